@@ -0,0 +1,2 @@
+# the tests of the generated python package run in its build directory, see scripts/generate_python.sh
+collect_ignore_glob = ['generators/python/test_*.py']
@@ -0,0 +1,72 @@
+import os
+import tempfile
+from os.path import basename, dirname, isfile, join
+
+
+class DescriptorWriter:
+    """
+        Writes the generated Descriptors to the output directory as they are produced.
+        Each file is written atomically (temporary file + rename) and files whose content did not change are not touched,
+        so their modification time is preserved and downstream build caches stay valid.
+    """
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.written_files = []
+        self.unchanged_files = []
+
+    @staticmethod
+    def get_content(descriptor):
+        """
+        :param descriptor: the generated descriptor
+        :return: the bytes of the file, one line per code line.
+        """
+        return ''.join('%s\n' % line for line in descriptor.code).encode('utf8')
+
+    @staticmethod
+    def _has_content(filename, content):
+        if not isfile(filename) or os.path.getsize(filename) != len(content):
+            return False
+        with open(filename, 'rb') as output_file:
+            return output_file.read() == content
+
+    @staticmethod
+    def _get_file_mode(filename):
+        if isfile(filename):
+            return os.stat(filename).st_mode & 0o777
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+    def write(self, descriptor):
+        """
+        Writes a descriptor unless the file already has the same content.
+        :param descriptor: the generated descriptor
+        :return: True if the file was written, False if it was left untouched.
+        """
+        filename = join(self.output_path, descriptor.filename)
+        content = self.get_content(descriptor)
+        if self._has_content(filename, content):
+            self.unchanged_files.append(descriptor.filename)
+            return False
+
+        file_descriptor, temp_filename = tempfile.mkstemp(dir=dirname(filename), prefix='.' + basename(filename) + '.')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as output_file:
+                output_file.write(content)
+            os.chmod(temp_filename, self._get_file_mode(filename))
+            os.replace(temp_filename, filename)
+        except BaseException:
+            os.unlink(temp_filename)
+            raise
+        self.written_files.append(descriptor.filename)
+        return True
+
+    def write_all(self, descriptors):
+        """
+        Consumes the descriptors iterator, writing each file as soon as it is generated.
+        :param descriptors: the descriptors iterator (usually a generator from AVAILABLE_GENERATORS)
+        """
+        os.makedirs(self.output_path, exist_ok=True)
+        for descriptor in descriptors:
+            self.write(descriptor)
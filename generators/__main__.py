@@ -0,0 +1,67 @@
+import argparse
+import logging
+import os
+
+from catbuffer_parser.__main__ import MultiFileParser
+
+from generators.All import AVAILABLE_GENERATORS
+from generators.DescriptorWriter import DescriptorWriter
+from generators.common.SchemaIndex import SchemaIndex
+
+
+def _parse_schema(schema_filename, include_path):
+    file_parser = MultiFileParser()
+    file_parser.set_include_path(include_path)
+    file_parser.parse(schema_filename)
+    return file_parser.cats_parser.type_descriptors()
+
+
+def _generate_output(generator_name, output_path, schema, options):
+    generator_class = AVAILABLE_GENERATORS[generator_name]
+    writer = DescriptorWriter(output_path)
+    writer.write_all(generator_class(schema, dict(options, output=output_path)))
+    print('{0}: {1} files written, {2} unchanged in {3}'.format(
+        generator_name, len(writer.written_files), len(writer.unchanged_files), output_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m generators', description='CATS code generator')
+    parser.add_argument('-s', '--schema', help='input CATS file', required=True)
+    parser.add_argument('-o', '--output', help='output directory, if not provided, _generated/{generator} is used. '
+                        'When several generators are used, each one writes to {output}/{generator}')
+    parser.add_argument('-i', '--include', help='schema root directory', default='./schemas')
+    parser.add_argument('-g', '--generator', help='generator to use to produce output files, can be repeated. '
+                        '"all" uses all the available generators', required=True, action='append',
+                        choices=list(AVAILABLE_GENERATORS.keys()) + ['all'])
+    parser.add_argument('-c', '--copyright', help='file containing copyright data to use with output files', default='../HEADER.inc')
+    parser.add_argument('-j', '--jobs', help='number of processes rendering the files', type=int, default=1)
+    parser.add_argument('--incremental', help='only generate the files whose inputs changed since the previous run',
+                        action='store_true')
+    parser.add_argument('--profile', help='write a JSON report with the generation timings to the given file')
+    parser.add_argument('--trace', help='log the generators trace', action='store_true')
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(name)s: %(message)s')
+    if args.trace:
+        logging.getLogger('generators').setLevel(logging.DEBUG)
+
+    generator_names = list(AVAILABLE_GENERATORS.keys()) if 'all' in args.generator else list(dict.fromkeys(args.generator))
+
+    # the schema is parsed and analyzed once, the language independent analysis is shared through the schema index
+    schema = _parse_schema(args.schema, args.include)
+    options = {'copyright': args.copyright, 'jobs': args.jobs, 'incremental': args.incremental,
+               'schema_index': SchemaIndex(schema)}
+    for generator_name in generator_names:
+        output_path = os.path.join(args.output or '_generated', generator_name)
+        profile = args.profile
+        if len(generator_names) == 1:
+            output_path = args.output or output_path
+        elif profile:
+            # one report per generator: report.json -> report.java.json
+            profile_root, profile_extension = os.path.splitext(profile)
+            profile = '{0}.{1}{2}'.format(profile_root, generator_name, profile_extension)
+        _generate_output(generator_name, output_path, schema, dict(options, profile=profile))
+
+
+if '__main__' == __name__:
+    main()
@@ -1,11 +1,30 @@
+import inspect
 import os
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from os.path import dirname
 
 from generators.Descriptor import Descriptor
+from generators.common.GenerationProfile import GenerationProfile
 from generators.common.MakoClassGenerator import MakoClassGenerator
 from generators.common.MakoEnumGenerator import MakoEnumGenerator
 from generators.common.MakoStaticClassGenerator import MakoStaticClassGenerator
 from generators.common.MakoTypeGenerator import MakoTypeGenerator
+from generators.common.Manifest import Manifest
+from generators.common.SchemaIndex import SchemaIndex
+
+# generators rendered by the current worker process, see FileGenerator.render_generators
+_worker_generators = []
+
+
+def _init_render_worker(generators):
+    _worker_generators[:] = generators
+
+
+def _render_worker_generator(index):
+    generator = _worker_generators[index]
+    return generator.generate(), generator.timings
 
 
 class FileGenerator(ABC):
@@ -31,23 +50,106 @@ class FileGenerator(ABC):
            them producing different files.
         :return:  multiple Descriptors using yield.
         """
+        profile = GenerationProfile(type(self).__name__) if self.options.get('profile') else None
         helper = self.create_helper()
+        helper.set_schema_index(self.get_schema_index())
         generators = []
         for type_name, class_schema in self.schema.items():
+            start_time = time.perf_counter()
             attribute_type = class_schema['type']
+            type_generators = []
             if helper.is_byte_type(attribute_type):
-                generators.extend(self.create_type_generators(helper, type_name, class_schema))
+                type_generators = self.create_type_generators(helper, type_name, class_schema)
             elif helper.is_enum_type(attribute_type):
-                generators.extend(self.create_enum_generators(helper, type_name, class_schema))
+                type_generators = self.create_enum_generators(helper, type_name, class_schema)
             elif helper.is_struct_type(attribute_type) and helper.should_generate_class(type_name):
-                generators.extend(self.create_class_generators(helper, type_name, class_schema))
+                type_generators = self.create_class_generators(helper, type_name, class_schema)
+            for generator in type_generators:
+                generator.timings['analysis'] = time.perf_counter() - start_time
+            generators.extend(type_generators)
         # write all the  helper files
         for filename in self.get_static_templates_file_names():
             generators.extend(self.create_static_class_generators(filename, helper))
-        for generator in generators:
-            code = self.init_code()
-            code += generator.generate()
+        # the license header is loaded once and shared by all the generated files
+        code_prefix = tuple(self.init_code())
+        manifest = self.create_manifest()
+        if manifest is not None:
+            generators = self.filter_changed_generators(manifest, generators, code_prefix)
+        for generator, class_output in zip(generators, self.render_generators(generators)):
+            code = list(code_prefix)
+            code += class_output
+            start_time = time.perf_counter()
             yield Descriptor(generator.get_generated_file_name(), code)
+            if profile is not None:
+                generator.timings['write'] = time.perf_counter() - start_time
+                profile.add(generator.get_generated_file_name(), getattr(generator, 'name', None),
+                            os.path.basename(generator.template_file_name), generator.timings,
+                            generator.get_profile_features())
+        if manifest is not None:
+            manifest.save()
+        if profile is not None:
+            profile.save(self.options['profile'])
+
+    def get_schema_index(self):
+        """
+        :return: the index given by the 'schema_index' option when it belongs to this schema, so the analysis is shared
+        with the other generators of the run, a new index otherwise.
+        """
+        schema_index = self.options.get('schema_index')
+        if schema_index is None or schema_index.schema is not self.schema:
+            schema_index = SchemaIndex(self.schema)
+        return schema_index
+
+    def create_manifest(self):
+        """
+        :return: the manifest of the output directory when the 'incremental' option is set, None otherwise.
+        """
+        return Manifest.from_options(self.options)
+
+    def filter_changed_generators(self, manifest, generators, code_prefix):
+        """
+        Records the inputs of each generator in the manifest and keeps the generators whose inputs changed.
+        The inputs are the schema types used by the generated file, the template, the generator sources and the
+        copyright header.
+        :param manifest: the manifest of the output directory
+        :param generators: all the generators of the schema
+        :param code_prefix: the code prepended to each generated file
+        :return: the generators that need to be rendered again.
+        """
+        language_directory = dirname(inspect.getfile(type(self)))
+        sources_digest = Manifest.sources_digest(dirname(dirname(__file__)), dirname(__file__), language_directory)
+        template_digests = {}
+        changed_generators = []
+        for generator in generators:
+            template_file_name = generator.get_template_full_file_name()
+            if template_file_name not in template_digests:
+                template_digests[template_file_name] = Manifest.file_digest(template_file_name)
+            digest = Manifest.digest(sources_digest, code_prefix, template_digests[template_file_name],
+                                     generator.get_input_schema())
+            if not manifest.is_unchanged(generator.get_generated_file_name(), digest):
+                changed_generators.append(generator)
+        return changed_generators
+
+    def render_generators(self, generators):
+        """
+        Renders the given generators. When the 'jobs' option is greater than one, the rendering is spread across a pool of
+        processes. Either way, the rendered code is returned in the same order as the generators.
+        :param generators: the generators to render, already created for the whole schema
+        :return: the rendered code of each generator using yield.
+        """
+        jobs = int(self.options.get('jobs') or 1)
+        if jobs <= 1 or len(generators) <= 1:
+            for generator in generators:
+                yield generator.generate()
+            return
+
+        # generators are handed to the workers once, the tasks only carry their index
+        chunk_size = max(1, len(generators) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_render_worker, initargs=(generators,)) as executor:
+            rendered = executor.map(_render_worker_generator, range(len(generators)), chunksize=chunk_size)
+            for generator, (class_output, timings) in zip(generators, rendered):
+                generator.timings.update(timings)
+                yield class_output
 
     def init_code(self):
         """
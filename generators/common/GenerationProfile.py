@@ -0,0 +1,67 @@
+import json
+import time
+
+
+class GenerationProfile:
+    """
+        Timings of a generation run, written as a JSON report when the 'profile' option is set.
+        The wall time of each generated file is split in schema analysis, template compile, template render and file
+        write (the time the caller takes to consume the yielded Descriptor). Times are reported in milliseconds.
+    """
+
+    PHASES = ('analysis', 'compile', 'render', 'write')
+
+    def __init__(self, generator_name):
+        self.generator_name = generator_name
+        self.start_time = time.perf_counter()
+        self.files = []
+
+    def add(self, filename, type_name, template, timings, features=None):
+        """
+        Adds the timings of a generated file.
+        :param filename: the generated file name
+        :param type_name: the schema type of the file, None for static files
+        :param template: the template (or generator) producing the file
+        :param timings: dictionary with the seconds spent in each phase, other keys are reported as phase details
+        :param features: optional dictionary describing the schema constructs of the type
+        """
+        record = {'file': filename, 'type': type_name, 'template': template}
+        record.update({phase: self._to_ms(timings.get(phase, 0)) for phase in self.PHASES})
+        details = {key: self._to_ms(value) for key, value in timings.items() if key not in self.PHASES}
+        if details:
+            record['details'] = details
+        if features:
+            record['features'] = features
+        self.files.append(record)
+
+    def get_report(self):
+        """
+        :return: the report with the run totals, the totals by template and the timings of each file.
+        """
+        templates = {}
+        for record in self.files:
+            template = templates.setdefault(record['template'], dict({'files': 0}, **{phase: 0 for phase in self.PHASES}))
+            template['files'] += 1
+            for phase in self.PHASES:
+                template[phase] = round(template[phase] + record[phase], 3)
+        return {
+            'generator': self.generator_name,
+            'unit': 'ms',
+            'total': self._to_ms(time.perf_counter() - self.start_time),
+            'phases': {phase: round(sum(record[phase] for record in self.files), 3) for phase in self.PHASES},
+            'templates': templates,
+            'files': self.files
+        }
+
+    def save(self, filename):
+        """
+        Writes the JSON report.
+        :param filename: the report file name
+        """
+        with open(filename, 'w', newline='\n') as report_file:
+            json.dump(self.get_report(), report_file, indent=2)
+            report_file.write('\n')
+
+    @staticmethod
+    def _to_ms(seconds):
+        return round(seconds * 1000, 3)
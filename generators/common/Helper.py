@@ -1,3 +1,4 @@
+from collections import namedtuple
 from enum import Enum
 
 from abc import ABC, abstractmethod
@@ -20,6 +21,10 @@ class TypeDescriptorDisposition(Enum):
     Var = 'var'
 
 
+# serialized layout of a struct, see Helper.get_static_layout
+StaticLayout = namedtuple('StaticLayout', ['field_layout', 'size_constant', 'size_terms', 'is_fixed_size'])
+
+
 class AttributeKind(Enum):
     """Attribute type enum"""
     SIMPLE = 1
@@ -41,6 +46,11 @@ class Helper(ABC):
     def __init__(self):
         # a shortcut for the templates to access the AttributeKind type.
         self.AttributeKind = AttributeKind
+        # optional SchemaIndex of the schema being generated, used to avoid whole schema scans.
+        self.schema_index = None
+
+    def set_schema_index(self, schema_index):
+        self.schema_index = schema_index
 
     @staticmethod
     def get_class_template_path(template_path, _):
@@ -100,11 +110,12 @@ class Helper(ABC):
     def is_conditional_attribute(attribute):
         return 'condition' in attribute
 
-    @staticmethod
-    def is_attribute_count_size_field(attribute, class_attributes):
+    def is_attribute_count_size_field(self, attribute, class_attributes):
         if class_attributes is None:
             return False
         attribute_name = attribute['name']
+        if self.schema_index is not None:
+            return self.schema_index.count_size_references(class_attributes, attribute_name) == 1
         is_size_of_class_attributes = list(
             filter(lambda a: 'size' in a and a['size'] == attribute_name, class_attributes))
         return len(is_size_of_class_attributes) == 1
@@ -219,7 +230,126 @@ class Helper(ABC):
 
         return AttributeKind.BUFFER
 
+    @classmethod
+    def get_fixed_size(cls, schema, type_name):
+        """
+        :param schema: the schema
+        :param type_name: the type name
+        :return: the size of the type when all its attributes have a fixed size, None otherwise.
+        """
+        type_descriptor = schema[type_name]
+        if not cls.is_struct_type(type_descriptor['type']):
+            return type_descriptor['size']
+        return cls._get_fixed_layout(schema, type_descriptor['layout'], 0, {})
+
+    @classmethod
+    def get_fixed_layout(cls, schema, type_name):
+        """
+        :param schema: the schema
+        :param type_name: the struct type name
+        :return: dictionary with the (offset, size) of the attributes (inline attributes expanded) preceding the first
+            attribute without a fixed size.
+        """
+        offsets = {}
+        cls._get_fixed_layout(schema, schema[type_name]['layout'], 0, offsets)
+        return offsets
+
+    @classmethod
+    def _get_fixed_layout(cls, schema, layout, offset, offsets):
+        # adds the attribute (offset, size) and returns the end offset, None once an attribute does not have a fixed size
+        for attribute in layout:
+            if cls.is_const_type(attribute):
+                continue
+            if cls.is_inline_type(attribute):
+                offset = cls._get_fixed_layout(schema, schema[attribute['type']]['layout'], offset, offsets)
+                if offset is None:
+                    return None
+                continue
+            attribute_size = cls._get_fixed_attribute_size(schema, attribute)
+            if attribute_size is None:
+                return None
+            offsets[attribute['name']] = (offset, attribute_size)
+            offset += attribute_size
+        return offset
+
+    @classmethod
+    def _get_fixed_attribute_size(cls, schema, attribute):
+        if cls.is_conditional_attribute(attribute) or cls.is_fill_array_type(attribute) or cls.is_var_array_type(attribute):
+            return None
+        size = attribute.get('size')
+        if isinstance(size, str):
+            return None
+        if cls.is_byte_type(attribute['type']):
+            return size
+        element_size = cls.get_fixed_size(schema, attribute['type'])
+        if element_size is None or size is None:
+            return element_size
+        return size * element_size
+
+    def get_static_layout(self, schema, type_name):
+        """
+        The static layout is computed once per schema and shared by all the languages generated from the schema index.
+        :param schema: the schema
+        :param type_name: the struct type name
+        :return: StaticLayout of the serialized struct:
+            - field_layout: the (offset, size) of the attributes preceding the first attribute without a fixed size,
+              reserved attributes excluded
+            - size_constant, size_terms: the size is size_constant + sum(count * element size) for the (attribute name,
+              count attribute name, element size) size terms, both are None when the size does not have a closed form
+              (conditional attributes, fill arrays or arrays of variable size elements)
+            - is_fixed_size: True when the size does not depend on the attribute values
+        """
+        if self.schema_index is not None and self.schema_index.schema is schema:
+            return self.schema_index.get_analysis(('static_layout', type_name), lambda: self.create_static_layout(schema, type_name))
+        return self.create_static_layout(schema, type_name)
+
+    @classmethod
+    def create_static_layout(cls, schema, type_name):
+        """
+        Computes the static layout without the schema index, for the generators without a language helper.
+        :param schema: the schema
+        :param type_name: the struct type name
+        :return: StaticLayout of the serialized struct, see get_static_layout.
+        """
+        size_terms = []
+        size_constant = cls._get_size_expression(schema, schema[type_name]['layout'], size_terms)
+        if size_constant is None:
+            size_terms = None
+        field_layout = {name: field for name, field in cls.get_fixed_layout(schema, type_name).items() if '_Reserved' not in name}
+        return StaticLayout(field_layout, size_constant, size_terms, size_constant is not None and not size_terms)
+
+    @classmethod
+    def _get_size_expression(cls, schema, layout, size_terms):
+        # adds the size terms and returns the constant part of the size, None when the size does not have a closed form
+        size_constant = 0
+        for attribute in layout:
+            if cls.is_const_type(attribute):
+                continue
+            if cls.is_inline_type(attribute):
+                inline_size_constant = cls._get_size_expression(schema, schema[attribute['type']]['layout'], size_terms)
+                if inline_size_constant is None:
+                    return None
+                size_constant += inline_size_constant
+                continue
+            if cls.is_conditional_attribute(attribute) or cls.is_fill_array_type(attribute):
+                return None
+            size = attribute.get('size')
+            if cls.is_var_array_type(attribute):
+                # the size of the variable size elements is given in bytes
+                size_terms.append((attribute['name'], size, 1))
+                continue
+            element_size = 1 if cls.is_byte_type(attribute['type']) else cls.get_fixed_size(schema, attribute['type'])
+            if element_size is None:
+                return None
+            if isinstance(size, str):
+                size_terms.append((attribute['name'], size, element_size))
+            else:
+                size_constant += element_size * (1 if size is None else size)
+        return size_constant
+
     def get_attribute_property_equal(self, schema, attributes, attribute_name, attribute_value, recurse=True):
+        if recurse and self.schema_index is not None and self.schema_index.schema is schema:
+            return self.schema_index.find_attribute(attributes, attribute_name, attribute_value)
         for attribute in attributes:
             if attribute_name in attribute and attribute[attribute_name] == attribute_value:
                 return attribute
@@ -231,6 +361,14 @@ class Helper(ABC):
                     return value
         return None
 
+    def get_const_attributes(self, schema, type_name):
+        if self.schema_index is not None and self.schema_index.schema is schema:
+            return self.schema_index.get_const_attributes(type_name)
+        return [(type_descriptor, attribute) for type_descriptor, entity_schema in schema.items()
+                for attribute in entity_schema.get('layout', [])
+                if attribute.get('disposition', None) == TypeDescriptorDisposition.Const.value and attribute.get(
+                    'type', None) == type_name]
+
     def get_name_from_type(self, type_name: str):
         return self.decapitalize_first_character(type_name)
 
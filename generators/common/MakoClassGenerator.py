@@ -1,8 +1,10 @@
-from collections import namedtuple
+import time
+from collections import Counter, namedtuple
 from itertools import chain
 from typing import List
 
 from generators.common.Helper import TypeDescriptorDisposition
+from .Manifest import Manifest
 from .MakoStaticClassGenerator import MakoStaticClassGenerator
 
 AttributeData = namedtuple('AttributeData',
@@ -18,6 +20,13 @@ ImmutableAttributeData = namedtuple('ImmutableAttributeData',
                                     ['attribute', 'kind', 'attribute_name', 'attribute_value', 'attribute_size', 'attribute_var_type',
                                      'attribute_type', 'attribute_base_type'])
 
+# helper methods used by the language independent part of the analysis.
+# Languages that do not override them share the analysis when generated from the same SchemaIndex.
+NEUTRAL_HELPER_METHODS = ('should_use_super_class', 'should_generate_class', 'get_generated_class_name', 'is_inline_class',
+                          'get_attribute_kind', 'get_attribute_size', 'get_base_type', 'get_comments_from_attribute',
+                          'is_conditional_attribute', 'is_reserved_field', 'get_attribute_property_equal',
+                          'decapitalize_first_character', 'is_var_array_type', 'is_fill_array_type')
+
 
 class MakoClassGenerator(MakoStaticClassGenerator):
     """
@@ -25,6 +34,7 @@ class MakoClassGenerator(MakoStaticClassGenerator):
     """
 
     def __init__(self, helper, name, schema, class_schema, template_path, file_extension):
+        start_time = time.perf_counter()
         super().__init__(helper.get_class_template_path(template_path, name),
                          helper.get_generated_class_name(name, class_schema, schema) + file_extension,
                          helper,
@@ -38,12 +48,13 @@ class MakoClassGenerator(MakoStaticClassGenerator):
         self.generated_class_name = helper.get_generated_class_name(name, class_schema, schema)
         self.base_class_name = None
         self.generated_base_class_name = None
-        if self.helper.should_use_super_class():
-            self.foreach_attributes(self.class_schema['layout'], self._find_base_callback)
         self.comments = helper.get_comments_from_attribute(self.class_schema)
-        self._recurse_foreach_attribute(self.name)
+        attributes_start_time = time.perf_counter()
+        self._analyze_attributes()
+        self.timings['attributes'] = time.perf_counter() - attributes_start_time
         self.body_class_name = helper.get_body_class_name(self.name)
 
+        constructor_start_time = time.perf_counter()
         condition_types = [(a, schema[a.condition_type_attribute['type']]) for a in self.attributes if
                            a.attribute_is_conditional and a.attribute['condition_operation'] != 'has']
         condition_types_values = self._calculate_constructor_options(condition_types)
@@ -53,6 +64,20 @@ class MakoClassGenerator(MakoStaticClassGenerator):
         self.constructor_attributes = [self.all_constructor_params] if not condition_types else [
             self.constructor_arguments(self.all_constructor_params, condition_type) for condition_type in
             condition_types_values]
+        self.timings['constructor_options'] = time.perf_counter() - constructor_start_time
+        self.logger.debug('analyzed %s in %.3f ms', name, (time.perf_counter() - start_time) * 1000)
+
+    def get_input_schema(self):
+        return Manifest.get_schema_subset(self.schema, [self.name])
+
+    def get_profile_features(self):
+        return {
+            'attributes': len(self.attributes),
+            'kinds': dict(Counter(a.kind.name for a in self.attributes)),
+            'conditionals': sum(1 for a in self.attributes if a.attribute_is_conditional),
+            'inline_aggregates': sum(1 for a in self.attributes if a.attribute_is_aggregate),
+            'constructors': len(self.constructor_attributes)
+        }
 
     @staticmethod
     def _calculate_constructor_options(condition_types):
@@ -68,15 +93,47 @@ class MakoClassGenerator(MakoStaticClassGenerator):
         with_values = {a_condition_value for (a_condition_name, a_condition_value, conditional_value) in
                        condition_types_values}
 
-        condition_types_values = {(a_condition_name,
+        condition_types_values = [(a_condition_name,
                                    conditional_value if conditional_value in with_values else None,
                                    conditional_value) for
                                   (a_condition_name, a_condition_value, conditional_value) in
-                                  condition_types_values}
-        return condition_types_values
+                                  condition_types_values]
+        # removes the duplicates in schema order, the order of a set changes between processes
+        return list(dict.fromkeys(condition_types_values))
+
+    def _analyze_attributes(self):
+        schema_index = self.helper.schema_index
+        if schema_index is None or schema_index.schema is not self.schema:
+            self._collect_attributes()
+        else:
+            # the language independent analysis is computed once per schema and shared by the languages
+            neutral_helper = tuple(getattr(type(self.helper), method) for method in NEUTRAL_HELPER_METHODS)
+            (self.base_class_name, self.generated_base_class_name, self.attributes,
+             self.immutable_attributes) = schema_index.get_analysis((neutral_helper, self.name), self._collect_attributes)
+        self._add_language_types()
+
+    def _collect_attributes(self):
+        if self.helper.should_use_super_class():
+            self.foreach_attributes(self.class_schema['layout'], self._find_base_callback)
+        self._recurse_foreach_attribute(self.name)
+        return self.base_class_name, self.generated_base_class_name, self.attributes, self.immutable_attributes
+
+    def _add_language_types(self):
+        self.immutable_attributes = [
+            a._replace(attribute_var_type=self.helper.get_generated_type(self.schema, a.attribute, a.kind))
+            for a in self.immutable_attributes]
+        attributes = []
+        for a in self.attributes:
+            attribute_var_type = self.helper.get_generated_type(self.schema, a.attribute, a.kind)
+            self.required_import = self.helper.add_required_import(self.required_import,
+                                                                   attribute_var_type,
+                                                                   self.generated_class_name,
+                                                                   self.generated_base_class_name)
+            attributes.append(a._replace(attribute_var_type=attribute_var_type))
+        self.attributes = attributes
 
     def _recurse_foreach_attribute(self, class_name: str, aggregate_attribute=None, depth=0):
-        print(str('\t' * depth) + '- ' + class_name)
+        self.logger.debug('%s- %s', '\t' * depth, class_name)
         class_generated = (class_name != self.name and self.helper.should_generate_class(class_name))
         class_attributes = self.schema[class_name]['layout']
         for attribute in class_attributes:
@@ -88,7 +145,7 @@ class MakoClassGenerator(MakoStaticClassGenerator):
                     aggregate_class_is_generated = self.helper.should_generate_class(attribute['type'])
                     # Is the aggregate class generated?
                     if aggregate_class_is_generated:
-                        print(str('\t ' * (depth + 1)) + ' ' + attribute['name'])
+                        self.logger.debug('%s %s', '\t ' * (depth + 1), attribute['name'])
                         self._add_attribute(attribute, class_attributes, aggregate_attribute)
                     new_aggregate_attribute = attribute if aggregate_attribute is None and aggregate_class_is_generated \
                         else aggregate_attribute
@@ -97,11 +154,11 @@ class MakoClassGenerator(MakoStaticClassGenerator):
                     self._add_immutable_attribute(attribute, class_attributes)
                     continue
                 elif self.helper.is_var_array_type(attribute) or self.helper.is_fill_array_type(attribute):
-                    print(str('\t ' * (depth + 1)) + ' ' + attribute['name'])
+                    self.logger.debug('%s %s', '\t ' * (depth + 1), attribute['name'])
                     self._add_attribute(attribute, class_attributes, aggregate_attribute)
                     continue
             else:
-                print(str('\t ' * (depth + 1)) + ' ' + attribute['name'])
+                self.logger.debug('%s %s', '\t ' * (depth + 1), attribute['name'])
                 self._add_attribute(attribute, class_attributes, aggregate_attribute)
 
     def _add_immutable_attribute(self, attribute, class_attributes):
@@ -109,13 +166,13 @@ class MakoClassGenerator(MakoStaticClassGenerator):
         attribute_name = attribute['name']
         attribute_value = attribute['value']
         attribute_size = self.helper.get_attribute_size(self.schema, attribute)
-        attribute_var_type = self.helper.get_generated_type(self.schema, attribute, kind)
         attribute_type = attribute.get('type', None)
         attribute_base_type = self.helper.get_base_type(self.schema, attribute_type)
 
-        print(attribute)
+        self.logger.debug('%s', attribute)
+        # attribute_var_type is language specific, see _add_language_types
         self.immutable_attributes.append(ImmutableAttributeData(
-            attribute, kind, attribute_name, attribute_value, attribute_size, attribute_var_type, attribute_type, attribute_base_type))
+            attribute, kind, attribute_name, attribute_value, attribute_size, None, attribute_type, attribute_base_type))
 
     def _add_attribute(self, attribute, class_attributes, aggregate_attribute):
         aggregate_attribute_name = aggregate_attribute['name'] if aggregate_attribute else None
@@ -125,7 +182,6 @@ class MakoClassGenerator(MakoStaticClassGenerator):
         attribute_comment = self.helper.get_comments_from_attribute(attribute)
         attribute_name = attribute['name']
         attribute_size = self.helper.get_attribute_size(self.schema, attribute)
-        attribute_var_type = self.helper.get_generated_type(self.schema, attribute, kind)
         attribute_is_final = attribute_name != 'size' and not attribute_is_conditional
         attribute_type = attribute.get('type', None)
         attribute_base_type = self.helper.get_base_type(self.schema, attribute_type)
@@ -138,10 +194,6 @@ class MakoClassGenerator(MakoStaticClassGenerator):
         attribute_is_reserved = self.helper.is_reserved_field(attribute)
         attribute_is_inline = not attribute_is_super and aggregate_attribute_name is not None
         attribute_aggregate_class = attribute.get('aggregate_class', None)
-        self.required_import = self.helper.add_required_import(self.required_import,
-                                                               attribute_var_type,
-                                                               self.generated_class_name,
-                                                               self.generated_base_class_name)
         if attribute_is_conditional:
             condition_type_attribute = self.helper.get_attribute_property_equal(self.schema,
                                                                                 self.class_schema['layout'], 'name',
@@ -156,8 +208,9 @@ class MakoClassGenerator(MakoStaticClassGenerator):
             conditional_read_before = len(
                 [a1 for a1 in self.attributes if a1.attribute_name == attribute['condition']]) == 0
 
+        # attribute_var_type is language specific, see _add_language_types
         attribute_tuple = AttributeData(attribute, kind, attribute_name,
-                                        attribute_comment, attribute_base_type, attribute_var_type,
+                                        attribute_comment, attribute_base_type, None,
                                         attribute_is_final, attribute_class_name,
                                         attribute_is_super, attribute_size, attribute_is_conditional,
                                         attribute_aggregate_attribute_name, attribute_is_reserved,
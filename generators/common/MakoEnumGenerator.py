@@ -1,4 +1,4 @@
-from generators.common.Helper import TypeDescriptorDisposition
+from .Manifest import Manifest
 from .MakoStaticClassGenerator import MakoStaticClassGenerator
 
 
@@ -21,15 +21,11 @@ class MakoEnumGenerator(MakoStaticClassGenerator):
         self._add_enum_values(self.class_schema)
         self.comments = helper.get_comments_from_attribute(self.class_schema)
         self.is_flag = helper.is_flags_enum(self.name)
-        for type_descriptor, entity_schema in self.schema.items():
-            if 'layout' in entity_schema:
-                for attribute in entity_schema['layout']:
-                    if attribute.get('disposition', None) == TypeDescriptorDisposition.Const.value and attribute.get(
-                            'type', None) == self.name:
-                        enum_name = type_descriptor
-                        enum_comment = self.helper.get_comment_from_name(enum_name)
-                        enum_value = attribute['value']
-                        self._add_enum_value(enum_name, enum_value, enum_comment)
+        for type_descriptor, attribute in self.helper.get_const_attributes(self.schema, self.name):
+            enum_name = type_descriptor
+            enum_comment = self.helper.get_comment_from_name(enum_name)
+            enum_value = attribute['value']
+            self._add_enum_value(enum_name, enum_value, enum_comment)
 
     def _add_enum_values(self, enum_attribute):
         enum_attribute_values = enum_attribute['values']
@@ -39,3 +35,7 @@ class MakoEnumGenerator(MakoStaticClassGenerator):
 
     def _add_enum_value(self, name, value, comments):
         self.enum_values[self.helper.create_enum_name(name)] = [value, comments]
+
+    def get_input_schema(self):
+        # const attributes of other types are added as enum values
+        return [Manifest.get_schema_subset(self.schema, [self.name]), self.enum_values]
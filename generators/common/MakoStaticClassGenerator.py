@@ -1,7 +1,9 @@
+import logging
+import time
 from inspect import getframeinfo, currentframe
 from os.path import dirname, abspath, realpath, join
 
-from mako.template import Template
+from .TemplateCache import TemplateCache
 
 
 class MakoStaticClassGenerator:
@@ -10,6 +12,8 @@ class MakoStaticClassGenerator:
         Note that the mako context has 2 main objects.
         - "genertor" with this object keeping all the known state
         - "helper" with the language helper methods.
+        Tracing goes to the logger of the language package (ex: generators.python) at DEBUG level, so it is off by default
+        and can be enabled for a single language.
     """
 
     def __init__(self, template_file_name, generated_file_name, helper, schema, class_schema):
@@ -19,16 +23,24 @@ class MakoStaticClassGenerator:
         self.schema = schema
         self.class_schema = class_schema
         self.helper = helper
+        self.logger = logging.getLogger(type(helper).__module__.rpartition('.')[0])
+        # seconds spent in each generation phase, reported by the 'profile' option
+        self.timings = {}
 
-    def _get_full_file_name(self):
+    def get_template_full_file_name(self):
         filename = getframeinfo(currentframe()).filename
         path = dirname(realpath(abspath(filename)))
         return join(path, self.template_file_name)
 
     def _read_file(self):
-        full_file_name = self._get_full_file_name()
-        fileTemplate = Template(filename=full_file_name)
+        full_file_name = self.get_template_full_file_name()
+        start_time = time.perf_counter()
+        fileTemplate = TemplateCache.get_template(full_file_name)
+        compiled_time = time.perf_counter()
         self.class_output += [fileTemplate.render(generator=self, helper=self.helper)]
+        self.timings['compile'] = compiled_time - start_time
+        self.timings['render'] = time.perf_counter() - compiled_time
+        self.logger.debug('rendered %s in %.3f ms', self.generated_file_name, self.timings['render'] * 1000)
 
     def generate(self):
         self._read_file()
@@ -42,3 +54,15 @@ class MakoStaticClassGenerator:
 
     def get_generated_file_name(self):
         return self.generated_file_name
+
+    def get_profile_features(self):
+        """
+        :return: the schema constructs of the generated type, reported by the 'profile' option.
+        """
+        return {}
+
+    def get_input_schema(self):
+        """
+        :return: the part of the schema the generated file depends on. Static templates may use the whole schema.
+        """
+        return self.schema
@@ -1,4 +1,5 @@
 from generators.common.Helper import AttributeKind
+from .Manifest import Manifest
 from .MakoStaticClassGenerator import MakoStaticClassGenerator
 
 
@@ -20,3 +21,6 @@ class MakoTypeGenerator(MakoStaticClassGenerator):
         self.attribute_type = helper.get_generated_type(self.schema, self.class_schema, self.attribute_kind)
         self.comments = helper.get_comments_from_attribute(self.class_schema)
         self.AttributeKind = AttributeKind
+
+    def get_input_schema(self):
+        return Manifest.get_schema_subset(self.schema, [self.name])
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+from os.path import isfile, join
+
+
+class Manifest:
+    """
+        Content-hash manifest stored in the output directory and used by the incremental generation.
+        For each generated file it records a hash of the inputs that produced it (schema types, template, generator
+        sources, copyright...). Files whose inputs did not change since the previous run do not need to be generated.
+    """
+
+    FILE_NAME = '.catbuffer-manifest.json'
+    VERSION = 1
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.previous_entries = self._load()
+        self.entries = {}
+
+    @classmethod
+    def from_options(cls, options):
+        """
+        :param options: the generator options
+        :return: the manifest of the 'output' directory when the 'incremental' option is set, None otherwise.
+        """
+        if not options.get('incremental'):
+            return None
+        if not options.get('output'):
+            raise ValueError('incremental generation requires the output option, the directory holding the manifest')
+        return cls(options['output'])
+
+    def _load(self):
+        try:
+            with open(join(self.output_path, self.FILE_NAME)) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get('version') != self.VERSION:
+            return {}
+        return manifest.get('files', {})
+
+    def is_unchanged(self, filename, digest):
+        """
+        Records the inputs digest of a generated file.
+        :param filename: the generated file name, relative to the output directory
+        :param digest: the hash of the inputs producing the file
+        :return: True if the file exists and was generated from the same inputs by the previous run.
+        """
+        self.entries[filename] = digest
+        return self.previous_entries.get(filename) == digest and isfile(join(self.output_path, filename))
+
+    def save(self):
+        """
+        Writes the manifest with the entries recorded during this run.
+        """
+        os.makedirs(self.output_path, exist_ok=True)
+        with open(join(self.output_path, self.FILE_NAME), 'w', newline='\n') as manifest_file:
+            json.dump({'version': self.VERSION, 'files': self.entries}, manifest_file, indent=2, sort_keys=True)
+            manifest_file.write('\n')
+
+    @staticmethod
+    def digest(*inputs):
+        """
+        :param inputs: json serializable inputs (schema parts, code lines, other digests...)
+        :return: the hash of the given inputs.
+        """
+        content = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode('utf8')).hexdigest()
+
+    @staticmethod
+    def file_digest(filename):
+        """
+        :param filename: the file to hash
+        :return: the hash of the file content.
+        """
+        with open(filename, 'rb') as input_file:
+            return hashlib.sha256(input_file.read()).hexdigest()
+
+    @staticmethod
+    def sources_digest(*directories):
+        """
+        :param directories: directories containing python sources, subdirectories are not included
+        :return: a hash of all the python sources in the given directories.
+        """
+        file_digests = []
+        for directory in directories:
+            for filename in sorted(os.listdir(directory)):
+                if filename.endswith('.py'):
+                    file_digests.append((filename, Manifest.file_digest(join(directory, filename))))
+        return Manifest.digest(file_digests)
+
+    @staticmethod
+    def get_schema_subset(schema, type_names):
+        """
+        :param schema: the whole schema
+        :param type_names: the types to start from
+        :return: the schema of the given types and all the types they transitively reference.
+        """
+        subset = {}
+        pending = [name for name in type_names if name in schema]
+        while pending:
+            name = pending.pop()
+            if name in subset:
+                continue
+            subset[name] = schema[name]
+            for attribute in schema[name].get('layout', []):
+                attribute_type = attribute.get('type')
+                if attribute_type in schema and attribute_type not in subset:
+                    pending.append(attribute_type)
+        return subset
@@ -0,0 +1,109 @@
+from collections import Counter
+
+from generators.common.Helper import TypeDescriptorDisposition
+
+
+class SchemaIndex:
+    """
+        Lookup tables computed once per run from the parsed schema, so the generators do not need to scan the whole
+        schema (or the whole layout) for each attribute.
+        - const attributes by enum type
+        - types referenced by and referencing each type
+        - per layout: the number of attributes using a size field and the flattened (inline expanded) attributes
+        - the language independent class analyses, shared by all the languages generated from this index
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.const_attributes = {}
+        self.referenced_types = {}
+        self.referencing_types = {}
+        for type_name, type_descriptor in schema.items():
+            self.referenced_types[type_name] = []
+            for attribute in type_descriptor.get('layout', []):
+                attribute_type = attribute.get('type')
+                if attribute.get('disposition') == TypeDescriptorDisposition.Const.value:
+                    self.const_attributes.setdefault(attribute_type, []).append((type_name, attribute))
+                if attribute_type in schema and attribute_type not in self.referenced_types[type_name]:
+                    self.referenced_types[type_name].append(attribute_type)
+                    self.referencing_types.setdefault(attribute_type, []).append(type_name)
+        self._layouts = {}
+        self._analyses = {}
+
+    def __getstate__(self):
+        # layout tables are keyed by object identity, they are rebuilt on demand after unpickling
+        state = self.__dict__.copy()
+        state['_layouts'] = {}
+        state['_analyses'] = {}
+        return state
+
+    def get_analysis(self, key, create_analysis):
+        """
+        :param key: the analysis key (ex: the type name and the helper methods used to analyze it)
+        :param create_analysis: callable creating the analysis the first time it is requested
+        :return: the analysis stored under the given key.
+        """
+        if key not in self._analyses:
+            self._analyses[key] = create_analysis()
+        return self._analyses[key]
+
+    def get_const_attributes(self, type_name):
+        """
+        :param type_name: the type name (usually an enum)
+        :return: list of (type name, attribute) with the const attributes of the given type, in schema order.
+        """
+        return self.const_attributes.get(type_name, [])
+
+    def get_referencing_types(self, type_name):
+        """
+        :param type_name: the type name
+        :return: the names of the types with an attribute of the given type.
+        """
+        return self.referencing_types.get(type_name, [])
+
+    def get_referenced_types(self, type_name):
+        """
+        :param type_name: the type name
+        :return: the names of the types used by the attributes of the given type.
+        """
+        return self.referenced_types.get(type_name, [])
+
+    def _get_layout_tables(self, layout):
+        # layouts are kept alive by the index, so their id cannot be reused during the run
+        tables = self._layouts.get(id(layout))
+        if tables is None:
+            size_references = Counter(attribute['size'] for attribute in layout if 'size' in attribute)
+            tables = self._layouts[id(layout)] = (layout, size_references, self._flatten_layout(layout), {})
+        return tables
+
+    def _flatten_layout(self, layout):
+        attributes = []
+        for attribute in layout:
+            attributes.append(attribute)
+            if attribute.get('disposition') == TypeDescriptorDisposition.Inline.value:
+                attributes += self._get_layout_tables(self.schema[attribute['type']]['layout'])[2]
+        return attributes
+
+    def count_size_references(self, layout, attribute_name):
+        """
+        :param layout: the class layout
+        :param attribute_name: the name of a layout attribute
+        :return: the number of attributes of the layout whose size is given by the named attribute.
+        """
+        return self._get_layout_tables(layout)[1][attribute_name]
+
+    def find_attribute(self, layout, property_name, property_value):
+        """
+        :param layout: the class layout, inline attributes are expanded
+        :param property_name: the property to look for (ex: 'name' or 'size')
+        :param property_value: the expected property value
+        :return: the first attribute (depth first) with the given property value, None otherwise.
+        """
+        attributes_by_property = self._get_layout_tables(layout)[3]
+        attributes_by_value = attributes_by_property.get(property_name)
+        if attributes_by_value is None:
+            attributes_by_value = attributes_by_property[property_name] = {}
+            for attribute in self._get_layout_tables(layout)[2]:
+                if property_name in attribute:
+                    attributes_by_value.setdefault(attribute[property_name], attribute)
+        return attributes_by_value.get(property_value)
@@ -0,0 +1,69 @@
+import hashlib
+import os
+from functools import partial
+from os.path import dirname, expanduser, join, realpath, relpath
+
+from mako.lookup import TemplateLookup
+
+# root of the generators tree, template uris are resolved relative to it (ex: /python/templates/Class.mako)
+TEMPLATES_ROOT = dirname(dirname(realpath(__file__)))
+
+
+class TemplateCache:
+    """
+        Process-wide registry of the compiled Mako templates.
+        Each template is compiled once per run and shared by all the generated files. The compiled python modules are
+        also written to an on-disk directory, keyed by the template content hash, so following runs can skip the
+        compilation. The directory can be changed with the CATBUFFER_TEMPLATE_CACHE environment variable, an empty value
+        disables the on-disk cache.
+    """
+
+    _lookup = None
+
+    @staticmethod
+    def get_module_directory():
+        """
+        :return: the directory where the compiled templates are stored or None if the on-disk cache is disabled.
+        """
+        module_directory = os.environ.get('CATBUFFER_TEMPLATE_CACHE')
+        if module_directory is None:
+            cache_home = os.environ.get('XDG_CACHE_HOME') or join(expanduser('~'), '.cache')
+            module_directory = join(cache_home, 'catbuffer-generators', 'templates')
+        if not module_directory:
+            return None
+        try:
+            os.makedirs(module_directory, exist_ok=True)
+        except OSError:
+            return None
+        return module_directory if os.access(module_directory, os.W_OK) else None
+
+    @staticmethod
+    def _get_module_file_name(module_directory, filename, uri):
+        with open(filename, 'rb') as template_file:
+            digest = hashlib.sha1(template_file.read()).hexdigest()
+        return join(module_directory, '{0}.{1}.py'.format(uri.lstrip('/'), digest))
+
+    @classmethod
+    def get_lookup(cls):
+        """
+        :return: the shared template lookup, created on first use.
+        """
+        if cls._lookup is None:
+            module_directory = cls.get_module_directory()
+            module_name_callable = partial(cls._get_module_file_name, module_directory) if module_directory else None
+            # templates do not change during a run, no need to stat them each time a file is generated
+            cls._lookup = TemplateLookup(directories=[TEMPLATES_ROOT],
+                                         module_directory=module_directory,
+                                         modulename_callable=module_name_callable,
+                                         filesystem_checks=False)
+        return cls._lookup
+
+    @classmethod
+    def get_template(cls, full_file_name):
+        """
+        Returns the compiled template of the given file, compiling it only the first time is requested.
+        :param full_file_name: the absolute path of the template
+        :return: the mako template
+        """
+        uri = '/' + relpath(realpath(full_file_name), TEMPLATES_ROOT).replace(os.sep, '/')
+        return cls.get_lookup().get_template(uri)
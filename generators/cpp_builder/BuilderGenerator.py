@@ -1,43 +1,75 @@
 # pylint: disable=too-few-public-methods
+import time
+from os.path import dirname
+
 from generators.Descriptor import Descriptor
+from generators.common.GenerationProfile import GenerationProfile
+from generators.common.Manifest import Manifest
+from .CppGenerator import CppGenerator
 from .HeaderGenerator import HeaderGenerator
 from .ImplementationGenerator import ImplementationGenerator
 
 
 class BuilderGenerator:
     """Cpp transaction builder generator, creates both header and implementation file"""
-    def __init__(self, schema, options):
+    def __init__(self, schema, options, hints=None):
         self.schema = schema
         self.options = options
+        self.hints = hints
         self.current = None
-        self.generated_header = False
-        self.current_name = None
 
     def __iter__(self):
         """Creates an iterator around this generator"""
-        self.current = iter(self.schema)
-        self.generated_header = False
+        self.current = self.generate()
         return self
 
-    def _iterate_until_next_transaction(self):
-        if self.generated_header:
-            return None
-
-        name = next(self.current)
-        while any(name.startswith(prefix) for prefix in ['Aggregate', 'Embedded', 'Transaction']) or not name.endswith('Transaction'):
-            name = next(self.current)
-        return name
-
     def __next__(self):
         """Returns Descriptor with desired filename and generated file content"""
-        if not self.generated_header:
-            self.current_name = self._iterate_until_next_transaction()
-            generator = HeaderGenerator(self.schema, self.options, self.current_name)
-            code = generator.generate()
-            self.generated_header = True
-            return Descriptor('{}.h'.format(generator.builder_name()), code)
-
-        generator = ImplementationGenerator(self.schema, self.options, self.current_name)
-        code = generator.generate()
-        self.generated_header = False
-        return Descriptor('{}.cpp'.format(generator.builder_name()), code)
+        return next(self.current)
+
+    def _transaction_names(self):
+        for name in self.schema:
+            if any(name.startswith(prefix) for prefix in ['Aggregate', 'Embedded', 'Transaction']) or not name.endswith('Transaction'):
+                continue
+            yield name
+
+    @staticmethod
+    def _inputs_digest(copyright_header):
+        """Hash of the inputs shared by all the generated files: generator sources and copyright"""
+        generator_directory = dirname(__file__)
+        return Manifest.digest(Manifest.sources_digest(dirname(generator_directory), generator_directory), copyright_header)
+
+    def generate(self):
+        """Generates the header and implementation files of all the transactions"""
+        profile = GenerationProfile(type(self).__name__) if self.options.get('profile') else None
+        # the license header is loaded once and shared by all the generated files
+        copyright_header = CppGenerator.read_copyright(self.options['copyright'])
+        # hints are shared by all the transactions, load them only if they were not provided
+        hints = self.hints if self.hints is not None else CppGenerator.load_hints()
+        manifest = Manifest.from_options(self.options)
+        inputs_digest = self._inputs_digest(copyright_header) if manifest is not None else None
+        for name in self._transaction_names():
+            for generator_class, extension in ((HeaderGenerator, 'h'), (ImplementationGenerator, 'cpp')):
+                filename = '{}.{}'.format(CppGenerator.get_builder_name(name), extension)
+                if manifest is not None:
+                    # the static sizes are also computed from the embedded transaction and its header
+                    digest = Manifest.digest(inputs_digest, dict(hints.get(name, {})),
+                                             Manifest.get_schema_subset(self.schema, [name, name + 'Body', 'Embedded' + name]))
+                    if manifest.is_unchanged(filename, digest):
+                        continue
+
+                start_time = time.perf_counter()
+                generator = generator_class(self.schema, self.options, name, copyright_header, hints)
+                analysis_time = time.perf_counter()
+                code = generator.generate()
+                render_time = time.perf_counter()
+                yield Descriptor(filename, code)
+                if profile is not None:
+                    timings = {'analysis': analysis_time - start_time, 'render': render_time - analysis_time,
+                               'write': time.perf_counter() - render_time}
+                    profile.add(filename, name, generator_class.__name__, timings)
+
+        if manifest is not None:
+            manifest.save()
+        if profile is not None:
+            profile.save(self.options['profile'])
@@ -1,11 +1,15 @@
 # pylint: disable=too-few-public-methods
 from abc import ABC, abstractmethod
 from enum import Enum
+from types import MappingProxyType
 import os
 import re
 import yaml
 
+from generators.common.Helper import Helper
+
 SUFFIX = 'Transaction'
+HINT_FILE_NAMES = ['includes', 'namespaces', 'plugin', 'rewrites', 'setters']
 
 
 class FieldKind(Enum):
@@ -74,10 +78,12 @@ class GeneratorInterface(ABC):
 # FP from pylint, this is semi-abstract class
 # pylint: disable=abstract-method
 class CppGenerator(GeneratorInterface):
-    def __init__(self, schema, options, name):
+    def __init__(self, schema, options, name, copyright_header=None, hints=None):
         super(CppGenerator, self).__init__()
         self.schema = schema
-        self.code = []
+        if copyright_header is None:
+            copyright_header = CppGenerator.read_copyright(options['copyright'])
+        self.code = list(copyright_header)
         self.transaction_name = name
         self.replacements = {
             'TRANSACTION_NAME': self.transaction_name,
@@ -87,36 +93,46 @@ class CppGenerator(GeneratorInterface):
         }
 
         self.indent = 0
-        self.hints = CppGenerator._load_hints(['includes', 'namespaces', 'plugin', 'rewrites', 'setters'])[self.transaction_name]
-        self.prepend_copyright(options['copyright'])
+        if hints is None:
+            hints = CppGenerator.load_hints()
+        self.hints = hints[self.transaction_name]
 
     @staticmethod
-    def _load_hints(filenames):
+    def load_hints(filenames=None):
+        """Loads the hint files into a read-only index: transaction name -> hint file name -> hints"""
+        # the C loader is much faster, fall back to the pure python one when libyaml is not available
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
         all_hints = {}
-        for filename in filenames:
+        for filename in filenames or HINT_FILE_NAMES:
             with open('generators/cpp_builder/hints/{0}.yaml'.format(filename)) as input_file:
-                hints = yaml.load(input_file, Loader=yaml.SafeLoader)
+                hints = yaml.load(input_file, Loader=loader)
                 for hint_key in hints:
                     if hint_key not in all_hints:
                         all_hints[hint_key] = {}
 
                     all_hints[hint_key][filename] = hints.get(hint_key)
 
-        return all_hints
+        return MappingProxyType({hint_key: MappingProxyType(hints) for hint_key, hints in all_hints.items()})
 
     def transaction_body_name(self):
         return '{}Body'.format(self.transaction_name)
 
+    @staticmethod
+    def get_builder_name(transaction_name):
+        return '{}Builder'.format(transaction_name[:-len(SUFFIX)])
+
     def builder_name(self):
-        return '{}Builder'.format(self.transaction_name[:-len(SUFFIX)])
+        return CppGenerator.get_builder_name(self.transaction_name)
 
     def written_name(self):
         return join_lower(tokenize(self.transaction_name[:-len(SUFFIX)]))
 
-    def prepend_copyright(self, copyright_file):
+    @staticmethod
+    def read_copyright(copyright_file):
         if os.path.isfile(copyright_file):
             with open(copyright_file) as header:
-                self.code = [line.strip() for line in header]
+                return tuple(line.strip() for line in header)
+        return ()
 
     def generate(self):
         self._add_includes()
@@ -181,6 +197,16 @@ class CppGenerator(GeneratorInterface):
 
         return 'const {}&'.format(qualified_typename)
 
+    def _get_static_sizes(self):
+        """Returns (type alias, size constant name, size) of the transactions whose size without the variable data is known"""
+        static_sizes = []
+        for prefix in ('', 'Embedded'):
+            size_constant = Helper.create_static_layout(self.schema, prefix + self.transaction_name).size_constant
+            if size_constant is not None:
+                static_sizes.append((prefix + 'Transaction', '{}Transaction_Size'.format(prefix + '_' if prefix else ''), size_constant))
+
+        return static_sizes
+
     def _get_schema_field(self, field_name):
         return next(field for field in self.schema[self.transaction_body_name()]['layout'] if field['name'] == field_name)
 
@@ -1,4 +1,4 @@
-from .CppGenerator import CppGenerator, FieldKind, capitalize
+from .CppGenerator import CppGenerator, FieldKind, capitalize, join_lower, tokenize
 
 # note: part of formatting happens in CppGenerator, so whenever literal brace needs
 # to be produced, it needs to be doubled here
@@ -25,6 +25,16 @@ class HeaderGenerator(CppGenerator):
         self.append('using EmbeddedTransaction = model::Embedded{TRANSACTION_NAME};')
         self.append('')
 
+        static_sizes = self._get_static_sizes()
+        for type_alias, constant_name, size in static_sizes:
+            comment_name = join_lower(tokenize(type_alias))
+            self.append('/// Size of {0} {1} without its variable data, computed from the schema.'.format(
+                'an' if comment_name.startswith('e') else 'a', comment_name))
+            self.append('static constexpr size_t {0} = {1};'.format(constant_name, size))
+
+        if static_sizes:
+            self.append('')
+
         self.indent -= 1
         self.append('public:')
 
@@ -14,6 +14,14 @@ class ImplementationGenerator(CppGenerator):
         self.append('')
 
     def _class_header(self):
+        static_sizes = self._get_static_sizes()
+        for type_alias, constant_name, _ in static_sizes:
+            self.append('static_assert(sizeof({BUILDER_NAME}::' + type_alias + ') == {BUILDER_NAME}::' + constant_name
+                        + ', "' + type_alias + ' size does not match the schema");')
+
+        if static_sizes:
+            self.append('')
+
         self.append('{BUILDER_NAME}::{BUILDER_NAME}(model::NetworkIdentifier networkIdentifier, const Key& signer)')
         self.indent += 2
         self.append(': TransactionBuilder(networkIdentifier, signer)')
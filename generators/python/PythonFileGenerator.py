@@ -35,7 +35,8 @@ class PythonFileGenerator(FileGenerator):
         return '../python/templates/'
 
     def get_static_templates_file_names(self):
-        return ['GeneratorUtils', 'EmbeddedTransactionBuilderFactory', 'TransactionBuilderFactory']
+        return ['GeneratorUtils', 'EmbeddedTransactionBuilderFactory', 'TransactionBuilderFactory', 'EntityFileReader',
+                'BulkTransactionDecoder', 'BlockHeaderBuilderFactory']
 
     def get_main_file_extension(self):
         return '.py'
@@ -4,6 +4,8 @@ from generators.common.Helper import Helper, AttributeKind
 
 
 class PythonHelper(Helper):
+    # struct module unsigned integer formats by size, the signed formats are the lowercase ones
+    STRUCT_INTEGER_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
 
     @staticmethod
     def add_required_import(required_import: set, import_type, class_name, base_class_name):
@@ -72,3 +74,158 @@ class PythonHelper(Helper):
         if attribute_kind == AttributeKind.FLAGS:
             return 'List[{0}]'.format(typename)
         return typename
+
+    @staticmethod
+    def get_slots(attribute_names):
+        """
+        :param attribute_names: the names of the attributes set on the instances of a class
+        :return: the tuple literal declaring the __slots__ of the class.
+        """
+        return '({0}{1})'.format(', '.join('\'{0}\''.format(name) for name in attribute_names), ',' if 1 == len(attribute_names) else '')
+
+    @staticmethod
+    def is_signed(schema, attribute):
+        """
+        :param schema: the schema
+        :param attribute: the schema attribute
+        :return: True if the integer attribute is signed, the signedness of the enums and custom types is in their descriptor.
+        """
+        if 'signedness' in attribute:
+            return attribute['signedness'] == 'signed'
+        return schema.get(attribute.get('type'), {}).get('signedness') == 'signed'
+
+    def get_signed_argument(self, schema, attribute):
+        """
+        :param schema: the schema
+        :param attribute: the schema attribute
+        :return: the signed argument of the GeneratorUtils integer codec calls, empty for the unsigned attributes.
+        """
+        return ', signed=True' if self.is_signed(schema, attribute) else ''
+
+    def get_struct_integer_format(self, size, signed=False):
+        """
+        :param size: the size of the integer
+        :param signed: True if the integer is signed
+        :return: the struct module format of the integer, None if there is no integer of this size.
+        """
+        integer_format = self.STRUCT_INTEGER_FORMATS.get(size)
+        return integer_format.lower() if signed and integer_format is not None else integer_format
+
+    def get_struct_format(self, schema, attribute):
+        """
+        :param schema: the schema
+        :param attribute: the attribute data
+        :return: the struct module format of a fixed size attribute, None if it cannot be packed with its neighbours.
+        """
+        size = attribute.attribute_size
+        if attribute.attribute_is_conditional or not isinstance(size, int):
+            return None
+        if attribute.attribute_is_reserved and attribute.kind == AttributeKind.SIMPLE:
+            return '{0}x'.format(size)
+        if attribute.kind == AttributeKind.BUFFER or (
+                attribute.kind == AttributeKind.CUSTOM and attribute.attribute_base_type == 'byte' and size > 8):
+            return '{0}s'.format(size)
+        if attribute.kind in (AttributeKind.SIMPLE, AttributeKind.SIZE_FIELD, AttributeKind.FLAGS) or (
+                attribute.kind == AttributeKind.CUSTOM and attribute.attribute_base_type in ('enum', 'byte')):
+            return self.get_struct_integer_format(size, self.is_signed(schema, attribute.attribute))
+        return None
+
+    def get_column_typecode(self, schema, attribute):
+        """
+        :param schema: the schema
+        :param attribute: the attribute data
+        :return: the array module typecode of the column of an integer attribute, None if the attribute is stored as bytes.
+        """
+        if attribute.kind in (AttributeKind.SIMPLE, AttributeKind.SIZE_FIELD, AttributeKind.FLAGS) or (
+                attribute.kind == AttributeKind.CUSTOM and attribute.attribute_base_type in ('enum', 'byte')):
+            return self.get_struct_integer_format(attribute.attribute_size, self.is_signed(schema, attribute.attribute))
+        return None
+
+    def get_struct_peek(self, schema, type_name, attribute_names):
+        """
+        :param schema: the schema
+        :param type_name: the struct type name
+        :param attribute_names: the names of the fixed size attributes to read, in layout order
+        :return: the offset of the first attribute and the struct format reading the attributes from this offset.
+            The attributes with an integer size are read as integers with their schema signedness, the other ones as bytes.
+        """
+        fixed_layout = self.get_fixed_layout(schema, type_name)
+        start_offset = offset = fixed_layout[attribute_names[0]][0]
+        struct_format = '<'
+        for attribute_name in attribute_names:
+            attribute_offset, attribute_size = fixed_layout[attribute_name]
+            if attribute_offset > offset:
+                struct_format += '{0}x'.format(attribute_offset - offset)
+            attribute = self.get_attribute_property_equal(schema, schema[type_name]['layout'], 'name', attribute_name)
+            integer_format = self.get_struct_integer_format(attribute_size, self.is_signed(schema, attribute))
+            struct_format += integer_format or '{0}s'.format(attribute_size)
+            offset = attribute_offset + attribute_size
+        return start_offset, struct_format
+
+    def get_numpy_dtype(self, schema, type_name, snake_case_names=False):
+        """
+        :param schema: the schema
+        :param type_name: the type name
+        :param snake_case_names: True to name the fields like the attributes of the transaction classes
+        :return: the numpy dtype description of the serialized type, None if the type does not have a fixed size.
+            Reserved attributes are not named, they are padding bytes of the description.
+        """
+        size = self.get_fixed_size(schema, type_name)
+        if size is None:
+            return None
+        type_descriptor = schema[type_name]
+        if not self.is_struct_type(type_descriptor['type']):
+            return self._get_numpy_scalar_format(type_descriptor['size'], type_descriptor.get('signedness'))
+
+        fixed_layout = self.get_fixed_layout(schema, type_name)
+        attributes = [attribute for attribute in self._get_serialized_attributes(schema, type_descriptor['layout'])
+                      if not self.is_reserved_field(attribute)]
+        return {
+            'names': [self.camel_to_snake(attribute['name']) if snake_case_names else attribute['name'] for attribute in attributes],
+            'formats': [self._get_numpy_attribute_format(schema, attribute) for attribute in attributes],
+            'offsets': [fixed_layout[attribute['name']][0] for attribute in attributes],
+            'itemsize': size
+        }
+
+    def _get_serialized_attributes(self, schema, layout):
+        for attribute in layout:
+            if self.is_inline_type(attribute):
+                yield from self._get_serialized_attributes(schema, schema[attribute['type']]['layout'])
+            elif not self.is_const_type(attribute):
+                yield attribute
+
+    def _get_numpy_attribute_format(self, schema, attribute):
+        if self.is_byte_type(attribute['type']):
+            return self._get_numpy_scalar_format(attribute['size'], attribute.get('signedness'))
+        element_format = self.get_numpy_dtype(schema, attribute['type'])
+        if 'size' in attribute:
+            return element_format, (attribute['size'],)
+        return element_format
+
+    @staticmethod
+    def _get_numpy_scalar_format(size, signedness):
+        if size in (1, 2, 4, 8):
+            return '<{0}{1}'.format('i' if signedness == 'signed' else 'u', size)
+        return 'u1', (size,)
+
+    def get_struct_runs(self, schema, attributes, excluded_attribute_names=()):
+        """
+        Groups the consecutive fixed size attributes, each group is read and written with a single struct call.
+        :param schema: the schema
+        :param attributes: the attributes, in layout order
+        :param excluded_attribute_names: names of the attributes that must not be part of a group
+        :return: list of (struct format, attributes) with the groups of at least two attributes.
+        """
+        runs = []
+        run = []
+        for attribute in list(attributes) + [None]:
+            attribute_format = None
+            if attribute is not None and attribute.attribute_name not in excluded_attribute_names:
+                attribute_format = self.get_struct_format(schema, attribute)
+            if attribute_format is not None:
+                run.append((attribute_format, attribute))
+                continue
+            if len(run) > 1:
+                runs.append(('<' + ''.join(run_format for run_format, _ in run), [run_attribute for _, run_attribute in run]))
+            run = []
+        return runs
@@ -0,0 +1,75 @@
+import struct
+from typing import Iterator, Tuple
+
+from .GeneratorUtils import GeneratorUtils
+# Imports for creating block header builders
+from .BlockHeaderBuilder import BlockHeaderBuilder
+<%
+    builders = {}
+    for name in sorted(generator.schema):
+        layout = generator.schema[name].get('layout', [])
+        entityTypeValue = next(iter([x for x in layout if helper.is_const_type(x) and x.get('name', '') == 'entityType']), {}).get('value', 0)
+        entityTypeVersion = next(iter([x for x in layout if helper.is_const_type(x) and x.get('name', '') == 'version']), {}).get('value', 0)
+        if entityTypeValue > 0 and name.endswith('BlockHeader'):
+            builders.setdefault((entityTypeValue, entityTypeVersion), name)
+
+    # the version and the type are peeked from their offsets in the header
+    header_layout = helper.get_fixed_layout(generator.schema, 'BlockHeader')
+    entity_offset, entity_format = helper.get_struct_peek(generator.schema, 'BlockHeader', ['version', 'type'])
+%>\
+% for name in sorted(builders.values()):
+from .${name}Builder import ${name}Builder
+% endfor
+
+_ENTITY_STRUCT = struct.Struct('${entity_format}')
+
+
+class BlockHeaderBuilderFactory:
+    """Factory in charge of creating the specific block header builder from the binary payload.
+    """
+
+    # builders by (entity type, version)
+    _builders = {
+% for (entityTypeValue, entityTypeVersion), name in builders.items():
+        (0x${'{:x}'.format(entityTypeValue)}, ${entityTypeVersion}): ${name}Builder,
+% endfor
+    }
+
+    @classmethod
+    def create_from_payload(cls, payload) -> BlockHeaderBuilder:
+        """
+        It creates the specific block header builder from the payload bytes.
+        Args:
+            payload: bytes
+        Returns:
+            the BlockHeaderBuilder subclass
+        """
+        return cls.create_from_buffer(memoryview(payload), 0)[0]
+
+    @classmethod
+    def create_from_buffer(cls, buffer: memoryview, offset: int) -> Tuple[BlockHeaderBuilder, int]:
+        """
+        It creates the specific block header builder from a buffer, without copying the buffer.
+        Args:
+            buffer: buffer holding the serialized block
+            offset: offset of the block in the buffer
+        Returns:
+            the BlockHeaderBuilder subclass and the offset following the header
+        """
+        version, entityType = _ENTITY_STRUCT.unpack_from(buffer, offset + ${entity_offset})
+        builder_class = cls._builders.get((entityType, version), BlockHeaderBuilder)
+        return builder_class.load_from_buffer(buffer, offset)
+
+    @classmethod
+    def iter_from_stream(cls, reader) -> Iterator[BlockHeaderBuilder]:
+        """
+        It creates the specific block header builders of back to back blocks read from a binary stream.
+        The blocks are read one at a time, each one is read from its size prefix.
+        The data following the header of a block (ex: its transactions) is skipped.
+        Args:
+            reader: binary file-like object (ex: an open file or a socket.makefile('rb'))
+        Returns:
+            iterator over the BlockHeaderBuilder subclasses
+        """
+        for payload in GeneratorUtils.iter_size_prefixed(reader, ${header_layout['size'][1]}):
+            yield cls.create_from_buffer(payload, 0)[0]
\ No newline at end of file
@@ -0,0 +1,126 @@
+<%
+    size_offset, size_size = helper.get_fixed_layout(generator.schema, 'Transaction')['size']
+%>\
+from __future__ import annotations
+import os
+import sys
+from concurrent.futures import Executor
+from typing import Callable, List, Optional, Tuple
+
+from .GeneratorUtils import GeneratorUtils
+from .TransactionBuilderFactory import TransactionBuilderFactory
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # python 3.7, the chunks are sent to the processes by value
+    shared_memory = None
+
+# True once the current process started its own resource tracker by attaching a chunk, see _attach_shared_memory
+_owns_resource_tracker = False
+
+
+def _decode_transactions(payload: memoryview, transform: Optional[Callable]) -> list:
+    results = []
+    offset = 0
+    while offset < len(payload):
+        transaction, offset = TransactionBuilderFactory.create_from_buffer(payload, offset)
+        results.append(transaction if transform is None else transform(transaction))
+    return results
+
+
+def _decode_chunk(payload: bytes, transform: Optional[Callable]) -> list:
+    return _decode_transactions(memoryview(payload), transform)
+
+
+def _attach_shared_memory(name: str):
+    global _owns_resource_tracker  # pylint: disable=global-statement
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)  # pylint: disable=unexpected-keyword-arg
+
+    # before python 3.13, attaching registers the memory with the resource tracker of the process. A process started
+    # before the tracker of the decoding process gets its own tracker, which would report the memory as leaked and
+    # unlink it when the process exits, so the memory is unregistered from it.
+    # pylint: disable=protected-access
+    if os.name == 'posix' and resource_tracker._resource_tracker._fd is None:
+        _owns_resource_tracker = True
+    memory = shared_memory.SharedMemory(name)
+    if _owns_resource_tracker:
+        resource_tracker.unregister(memory._name, 'shared_memory')
+    return memory
+
+
+def _decode_shared_chunk(name: str, start: int, end: int, transform: Optional[Callable]) -> list:
+    memory = _attach_shared_memory(name)
+    try:
+        with memory.buf[start:end] as payload:
+            return _decode_transactions(payload, transform)
+    finally:
+        memory.close()
+
+
+class BulkTransactionDecoder:
+    """Decodes large buffers of back to back transactions with a pool of processes.
+
+    The buffer is split in chunks ending at transaction boundaries, each chunk is decoded by one executor task.
+    The buffer is copied once in shared memory, the processes read their chunk from it instead of receiving pickled bytes.
+    """
+
+    @staticmethod
+    def split(buffer, chunk_size: int) -> List[Tuple[int, int]]:
+        """Splits a buffer of back to back transactions in chunks ending at transaction boundaries.
+        Args:
+            buffer: Bytes-like object holding the transactions.
+            chunk_size: Minimum size in bytes of a chunk, the last chunk can be smaller.
+        Returns:
+            List of (start, end) offsets of the chunks.
+        """
+        chunks = []
+        with memoryview(buffer) as view:
+            start = offset = 0
+            while offset < len(view):
+                size = GeneratorUtils.read_uint(view, offset + ${size_offset}, ${size_size})
+                if size < ${size_size} or offset + size > len(view):
+                    raise EOFError('transaction of {0} bytes at offset {1} exceeds the buffer'.format(size, offset))
+                offset += size
+                if offset - start >= chunk_size:
+                    chunks.append((start, offset))
+                    start = offset
+            if start < offset:
+                chunks.append((start, offset))
+        return chunks
+
+    @classmethod
+    def decode(cls, buffer, executor: Executor, chunk_size: int = 0x100000, transform: Optional[Callable] = None) -> list:
+        """Decodes back to back transactions, the chunks of the buffer are decoded in parallel by the executor.
+        Args:
+            buffer: Bytes-like object holding the transactions.
+            executor: Executor decoding the chunks (ex: a ProcessPoolExecutor).
+            chunk_size: Minimum size in bytes of the chunk decoded by one task.
+            transform: Optional picklable callable applied to each builder by the executor, its results are returned
+                instead of the builders (ex: to send back only the fields used by the caller).
+        Returns:
+            The transaction builders, or their transform results, in buffer order.
+        """
+        chunks = cls.split(buffer, chunk_size)
+        if not chunks:
+            return []
+
+        results = []
+        if shared_memory is None:
+            with memoryview(buffer) as view:
+                futures = [executor.submit(_decode_chunk, bytes(view[start:end]), transform) for start, end in chunks]
+            for future in futures:
+                results += future.result()
+            return results
+
+        memory = shared_memory.SharedMemory(create=True, size=chunks[-1][1])
+        try:
+            memory.buf[:chunks[-1][1]] = buffer
+            futures = [executor.submit(_decode_shared_chunk, memory.name, start, end, transform) for start, end in chunks]
+            for future in futures:
+                results += future.result()
+            return results
+        finally:
+            memory.close()
+            memory.unlink()
\ No newline at end of file
@@ -1,14 +1,43 @@
 ## NOTE: do *not* touch `buffered` in render definitions, it will completely break output
 <%
+    # consecutive fixed size attributes are read and written with one precompiled struct
+    struct_runs = helper.get_struct_runs(generator.schema, [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline],
+                                         ['size'] if generator.name == 'Receipt' else [])
+    struct_run_by_attribute = {a.attribute_name: (index, run_attributes) for index, (_, run_attributes) in enumerate(struct_runs) for a in run_attributes}
+
+    # entities read back to back from streams: size prefixed entities (blocks, receipts) and state entries
+    # the const attributes (ex: the version and the entity type of the block headers) are not serialized
+    def is_size_prefixed(name):
+        first_attribute = next((a for a in generator.schema[name]['layout'] if not helper.is_const_type(a)), {})
+        return first_attribute.get('disposition') == 'inline' and (first_attribute['type'] == 'SizePrefixedEntity' or is_size_prefixed(first_attribute['type']))
+
+    # receipts (and the statements) are serialized without their size field, see renderSerialize
+    def is_receipt(name):
+        return name == 'Receipt' or any(helper.is_inline_type(a) and is_receipt(a['type']) for a in generator.schema[name]['layout'])
+
+    # numpy dtype of the types with a fixed size
+    dtype_description = helper.get_numpy_dtype(generator.schema, generator.name)
+
+    size_prefix = helper.get_fixed_layout(generator.schema, generator.name)['size'] if is_size_prefixed(generator.name) else None
+
+    # fill arrays are read up to the end of the entity, given by its size field
+    has_fill_array = any(a.kind == helper.AttributeKind.FILL_ARRAY for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline)
+    fill_array_end_size = helper.get_fixed_layout(generator.schema, generator.name).get('size') if has_fill_array else None
+    is_state_entry = any(a.get('disposition') == 'inline' and a['type'] == 'StateHeader' for a in generator.schema[generator.name]['layout'])
+
     python_lib_import_statements = []
     catbuffer_lib_import_statements = []
-    for a in sorted(generator.required_import):
+    typing_import = 'from typing import Iterator, Tuple' if size_prefix or is_state_entry else 'from typing import Tuple'
+    for a in sorted(generator.required_import | {typing_import} | ({'import struct'} if struct_runs else set())):
         if str(a).startswith('from .'):
             catbuffer_lib_import_statements.append(a)
         else:
             python_lib_import_statements.append(a)
 %>\
 from __future__ import annotations
+
+# pylint: disable=unused-import
+
 % for a in python_lib_import_statements:
 ${a}
 % endfor
@@ -16,6 +45,15 @@ from .GeneratorUtils import GeneratorUtils
 % for a in catbuffer_lib_import_statements:
 ${a}
 % endfor
+% if struct_runs:
+
+% endif
+% for index, (struct_format, run_attributes) in enumerate(struct_runs):
+_STRUCT_${index} = struct.Struct('${struct_format}')  # ${', '.join(a.attribute_name for a in run_attributes)}
+% endfor
+% if dtype_description is not None:
+_DTYPE_DESCRIPTION = ${repr(dtype_description)}
+% endif
 
 class ${generator.generated_class_name}${'(' + str(generator.generated_base_class_name) + ')' if generator.generated_base_class_name is not None else ''}:
     """${helper.capitalize_first_character(generator.comments)}.
@@ -25,6 +63,21 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         ${a.attribute_name}: ${helper.capitalize_first_character(a.attribute_comment)}.
 % endfor
     """
+<%
+    # base classes declare the slots of their own attributes
+    slots = [a.attribute_name for a in generator.all_constructor_params if not a.attribute_is_inline and not a.attribute_is_super and not a.attribute_is_reserved and not a.attribute_name == 'size']
+%>\
+    __slots__ = ${helper.get_slots(slots)}
+<%
+    static_layout = helper.get_static_layout(generator.schema, generator.name)
+%>\
+    # serialized layout computed from the schema: (offset, size) of the fields preceding the first variable size field.
+    # The size is SIZE_CONSTANT + sum(count * element size) of the (field, count field, element size) SIZE_TERMS,
+    # both are None when the size depends on conditional fields or on the remaining bytes.
+    FIELD_LAYOUT = {${', '.join('{0}: {1}'.format(repr(name), field) for name, field in static_layout.field_layout.items())}}
+    SIZE_CONSTANT = ${static_layout.size_constant}
+    SIZE_TERMS = ${'None' if static_layout.size_terms is None else repr(tuple(static_layout.size_terms))}
+    IS_FIXED_SIZE = ${static_layout.is_fixed_size}
 <%def name="renderCondition(a, useSelf=True)" filter="trim">
     ${helper.get_condition_operation_text(a.attribute['condition_operation']).format(('self.' if useSelf else '') + a.attribute['condition'], helper.get_generated_class_name(a.condition_type_attribute['type'], a.condition_type_attribute, generator.schema) + '.' + helper.create_enum_name(a.attribute['condition_value']))}
 </%def>\
@@ -95,46 +148,81 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
 
     def as_tuple(self):
         return (${', '.join(['self.' + generate_accessor(a) for a in own_constructor_params])})
+
+    @staticmethod
+    def serialize_tuple_into(t, buffer: bytearray, offset: int) -> int:
+        """Serializes a tuple returned by as_tuple into a buffer, without creating the builder.
+        Args:
+            t: Tuple of the attribute values.
+            buffer: Buffer receiving the serialized object.
+            offset: Offset of the object in the buffer.
+        Returns:
+            Offset following the serialized object.
+        """
+    % if len(struct_runs) == 1 and struct_runs[0][1] == own_constructor_params:
+      % for index, a in enumerate(own_constructor_params):
+        % if a.kind == helper.AttributeKind.CUSTOM and a.attribute_base_type == 'byte' and a.attribute_size > 8:
+        assert len(t[${index}]) == ${a.attribute_size}, 'required argument bytes(${a.attribute_size})'
+        % endif
+      % endfor
+        _STRUCT_0.pack_into(buffer, offset, *t)  # kind:STRUCT
+        return offset + _STRUCT_0.size
+    % else:
+        return ${generator.generated_class_name}.from_tuple(t).serialize_into(buffer, offset)
+    % endif
   % endif
 %endif
 ##  LOAD FROM BINARY:
 <%def name="renderReader(a)" filter="trim" buffered="True">
     % if a.kind == helper.AttributeKind.SIMPLE:
-        ${a.attribute_name} = GeneratorUtils.buffer_to_uint(GeneratorUtils.get_bytes(bytes_, ${a.attribute_size}))  # kind:SIMPLE
-        bytes_ = bytes_[${a.attribute_size}:]
+        ${a.attribute_name} = GeneratorUtils.read_uint(buffer, offset, ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})  # kind:SIMPLE
+        offset += ${a.attribute_size}
     % elif a.kind == helper.AttributeKind.BUFFER:
-        ${a.attribute_name} = GeneratorUtils.get_bytes(bytes_, ${a.attribute_size})  # kind:BUFFER
-        bytes_ = bytes_[${a.attribute_size}:]
+        ${a.attribute_name} = GeneratorUtils.read_bytes(buffer, offset, ${a.attribute_size})  # kind:BUFFER
+        offset += ${a.attribute_size}
     % elif a.kind == helper.AttributeKind.SIZE_FIELD:
-        ${a.attribute_name} = GeneratorUtils.buffer_to_uint(GeneratorUtils.get_bytes(bytes_, ${a.attribute_size}))  # kind:SIZE_FIELD
-        bytes_ = bytes_[${a.attribute_size}:]
+        ${a.attribute_name} = GeneratorUtils.read_uint(buffer, offset, ${a.attribute_size})  # kind:SIZE_FIELD
+        offset += ${a.attribute_size}
     % elif a.kind == helper.AttributeKind.ARRAY:
         ${a.attribute_name}: ${a.attribute_var_type} = []  # kind:ARRAY
         for _ in range(${a.attribute_size}):
-            item = ${a.attribute_class_name}.load_from_binary(bytes_)
+            item, offset = ${a.attribute_class_name}.load_from_buffer(buffer, offset)
             ${a.attribute_name}.append(item)
-            bytes_ = bytes_[item.get_size():]
     % elif a.kind == helper.AttributeKind.CUSTOM and a.conditional_read_before:
-        ${a.attribute_name} = ${a.attribute_class_name}.load_from_binary(${a.attribute['condition']}Condition)  # kind:CUSTOM3
+        ${a.attribute_name} = ${a.attribute_class_name}.load_from_buffer(buffer, ${a.attribute['condition']}ConditionOffset)[0]  # kind:CUSTOM3
     % elif a.kind == helper.AttributeKind.CUSTOM and a.attribute_base_type == 'enum':
-        ${a.attribute_name} = ${a.attribute_class_name}.load_from_binary(bytes_)  # kind:CUSTOM2
-        bytes_ = bytes_[${a.attribute_name}.get_size():]
+        ${a.attribute_name}, offset = ${a.attribute_class_name}.load_from_buffer(buffer, offset)  # kind:CUSTOM2
     % elif a.kind == helper.AttributeKind.CUSTOM:
-        ${a.attribute_name} = ${a.attribute_class_name}.load_from_binary(bytes_)  # kind:CUSTOM1
-        bytes_ = bytes_[${a.attribute_name}.get_size():]
+        ${a.attribute_name}, offset = ${a.attribute_class_name}.load_from_buffer(buffer, offset)  # kind:CUSTOM1
     % elif a.kind == helper.AttributeKind.FILL_ARRAY:
         ${a.attribute_name}: List[${a.attribute_class_name}] = []
-        bytes_ = GeneratorUtils.load_from_binary(${a.attribute_class_name}, ${a.attribute_name}, bytes_, len(bytes_))
+        offset = GeneratorUtils.load_from_buffer(${a.attribute_class_name}, ${a.attribute_name}, buffer, offset, ${'end' if 'size' in helper.get_fixed_layout(generator.schema, generator.name) else 'len(buffer)'})
     % elif a.kind == helper.AttributeKind.FLAGS:
-        ${a.attribute_name} = ${a.attribute_class_name}.bytesToFlags(bytes_, ${a.attribute_size})  # kind:FLAGS
-        bytes_ = bytes_[${a.attribute_size}:]
+        ${a.attribute_name} = ${a.attribute_class_name}.intToFlags(GeneratorUtils.read_uint(buffer, offset, ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)}))  # kind:FLAGS
+        offset += ${a.attribute_size}
     % elif a.kind == helper.AttributeKind.VAR_ARRAY:
         transactions: List[${a.attribute_class_name}] = []
-        bytes_ = ${generator.generated_class_name}._load_embedded_transactions(transactions, bytes_, ${a.attribute_size})
+        offset = ${generator.generated_class_name}._load_embedded_transactions(transactions, buffer, offset, ${a.attribute_size})
     % else:
         FIX ME!
     % endif
 </%def>\
+<%def name="renderStructReader(index, run_attributes)" filter="trim" buffered="True">
+<%
+    values = [a.attribute_name for a in run_attributes if not (a.attribute_is_reserved and a.kind == helper.AttributeKind.SIMPLE)]
+%>\
+    % if values:
+        ${', '.join(values)}${',' if len(values) == 1 else ''} = _STRUCT_${index}.unpack_from(buffer, offset)  # kind:STRUCT
+    % endif
+    % for a in run_attributes:
+        % if a.kind == helper.AttributeKind.FLAGS:
+        ${a.attribute_name} = ${a.attribute_class_name}.intToFlags(${a.attribute_name})
+        % elif a.kind == helper.AttributeKind.CUSTOM:
+        ${a.attribute_name} = ${a.attribute_class_name}(${a.attribute_name})
+        % endif
+    % endfor
+        offset += _STRUCT_${index}.size
+</%def>\
 <%
     possible_constructor_params = generator.constructor_attributes[0]
     if generator.base_class_name is None:
@@ -152,18 +240,62 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         Returns:
             Instance of ${generator.generated_class_name}.
         """
-        bytes_ = bytes(payload)
+        return cls.load_from_buffer(memoryview(payload), 0)[0]
+
+% if size_prefix:
+    @classmethod
+    def iter_from_stream(cls, reader) -> Iterator[${generator.generated_class_name}]:
+        """Creates instances of ${generator.generated_class_name} from back to back entities read from a binary stream.
+        The entities are read one at a time, each one is read from its size prefix.
+        Data following the fields of an entity (ex: the transactions of a block) is skipped.
+        Args:
+            reader: Binary file-like object (ex: an open file or a socket.makefile('rb')).
+        Returns:
+            Iterator over the instances of ${generator.generated_class_name}.
+        """
+        for payload in GeneratorUtils.iter_size_prefixed(reader, ${size_prefix[1]}):
+            yield cls.load_from_buffer(payload, 0)[0]
+
+% elif is_state_entry:
+    @classmethod
+    def iter_from_stream(cls, reader, chunk_size: int = 0x10000) -> Iterator[${generator.generated_class_name}]:
+        """Creates instances of ${generator.generated_class_name} from back to back state entries read from a binary stream.
+        The stream is read by chunks, only the entries of the current chunk are held in memory.
+        Args:
+            reader: Binary file-like object (ex: an open file or a socket.makefile('rb')).
+            chunk_size: Number of bytes read at once.
+        Returns:
+            Iterator over the instances of ${generator.generated_class_name}.
+        """
+        return GeneratorUtils.iter_from_stream(cls, reader, chunk_size)
+
+% endif
+    @classmethod
+    def load_from_buffer(cls, buffer: memoryview, offset: int) -> Tuple[${generator.generated_class_name}, int]:
+        """Creates an instance of ${generator.generated_class_name} from a buffer, without copying the buffer.
+        Args:
+            buffer: Buffer holding the serialized object.
+            offset: Offset of the object in the buffer.
+        Returns:
+            Instance of ${generator.generated_class_name} and the offset following it.
+        """
+    % if fill_array_end_size:
+        end = offset + GeneratorUtils.read_uint(buffer, offset${' + {}'.format(fill_array_end_size[0]) if fill_array_end_size[0] else ''}, ${fill_array_end_size[1]})
+    % endif
     % if generator.base_class_name is not None:
-        superObject = ${generator.generated_base_class_name}.load_from_binary(bytes_)
-        bytes_ = bytes_[superObject.get_size():]
+        superObject, offset = ${generator.generated_base_class_name}.load_from_buffer(buffer, offset)
     % endif
     % for a in set([(a.attribute['condition'], a.attribute_size, a.conditional_read_before) for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline and a.conditional_read_before and a.attribute_is_conditional]):
-        ${a[0]}Condition = bytes_[0:${a[1]}]
-        bytes_ = bytes_[${a[1]}:]
+        ${a[0]}ConditionOffset = offset
+        offset += ${a[1]}
     % endfor
 
     % for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline and not a.conditional_read_before]:
-        %if a.attribute_is_conditional:
+        % if a.attribute_name in struct_run_by_attribute:
+          % if a is struct_run_by_attribute[a.attribute_name][1][0]:
+        ${renderStructReader(*struct_run_by_attribute[a.attribute_name]) | trim}
+          % endif
+        % elif a.attribute_is_conditional:
         ${a.attribute_name} = None
         if ${renderCondition(a, useSelf=False) | trim}:
             ## handle py indents
@@ -182,8 +314,38 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
             ${line}
             % endfor
     % endfor
-        return ${generator.generated_class_name}(${constructor_arguments_CSV})
+        return ${generator.generated_class_name}(${constructor_arguments_CSV}), offset
+
+% if dtype_description is not None:
+    @classmethod
+    def get_dtype(cls):
+        """Gets the numpy dtype of serialized ${generator.generated_class_name} objects, numpy is required.
+        Returns:
+            Numpy dtype, reserved attributes are padding bytes.
+        """
+        return GeneratorUtils.get_dtype(_DTYPE_DESCRIPTION)
+
+    @classmethod
+    def from_buffer_array(cls, buffer):
+        """Decodes back to back serialized ${generator.generated_class_name} objects with one numpy call, numpy is required.
+        Args:
+            buffer: Bytes-like object holding the serialized objects, it is not copied.
+        Returns:
+            Numpy array with one record by object.
+        """
+        return GeneratorUtils.from_buffer_array(_DTYPE_DESCRIPTION, buffer)
+
+    @classmethod
+    def to_buffer_array(cls, records) -> bytes:
+        """Serializes the records of a numpy array with one numpy call, numpy is required.
+        Args:
+            records: Numpy array with the fields of get_dtype (ex: returned by from_buffer_array).
+        Returns:
+            Serialized objects.
+        """
+        return GeneratorUtils.to_buffer_array(_DTYPE_DESCRIPTION, records)
 
+% endif
 ## GETTERS:
 % for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_reserved and not a.attribute_is_aggregate and not a.kind == helper.AttributeKind.SIZE_FIELD and (not a.attribute_is_reserved or not a.attribute_is_inline) and not a.attribute_name == 'size']:
     def get_${helper.camel_to_snake(a.attribute_name) if a.attribute_name != 'size' else 'bytes_size'}(self) -> ${a.attribute_var_type}:
@@ -227,8 +389,11 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         Returns:
             Size in bytes.
         """
+% if static_layout.is_fixed_size:
+        return ${generator.generated_class_name}.SIZE_CONSTANT
+% else:
         size = ${'super().get_size()' if generator.base_class_name is not None else '0'}
-% for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline]:
+  % for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline]:
     % if a.attribute_is_conditional:
         if ${renderCondition(a) | trim}:
             ## handle py indents
@@ -238,48 +403,89 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
     % else:
         ${renderSize(a).strip()}
     % endif
-% endfor
+  % endfor
         return size
+% endif
 
 ##  SERIALIZE:
 <%def name="renderSerialize(a)" filter="trim" buffered="True">\
     % if a.kind == helper.AttributeKind.SIMPLE and a.attribute_is_reserved:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(0, ${a.attribute_size}))
+        offset = GeneratorUtils.write_uint(buffer, offset, 0, ${a.attribute_size})
     % elif a.kind == helper.AttributeKind.SIMPLE and (generator.name != 'Receipt' or a.attribute_name != 'size'):
         % if a.attribute_is_reserved:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(0, ${a.attribute_size}))  # kind:SIMPLE
+        offset = GeneratorUtils.write_uint(buffer, offset, 0, ${a.attribute_size})  # kind:SIMPLE
         % else:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(self.get_${helper.camel_to_snake(a.attribute_name)}(), ${a.attribute_size}))  # kind:SIMPLE
+        offset = GeneratorUtils.write_uint(buffer, offset, self.get_${helper.camel_to_snake(a.attribute_name)}(), ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})  # kind:SIMPLE
         % endif
     % elif a.kind == helper.AttributeKind.BUFFER:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, self.${a.attribute_name})  # kind:BUFFER
+        offset = GeneratorUtils.write_bytes(buffer, offset, self.${a.attribute_name})  # kind:BUFFER
     % elif a.kind == helper.AttributeKind.SIZE_FIELD:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(len(self.get_${helper.camel_to_snake(a.parent_attribute['name'])}()), ${a.attribute_size}))  # kind:SIZE_FIELD
+        offset = GeneratorUtils.write_uint(buffer, offset, len(self.get_${helper.camel_to_snake(a.parent_attribute['name'])}()), ${a.attribute_size})  # kind:SIZE_FIELD
     % elif a.kind == helper.AttributeKind.ARRAY or a.kind == helper.AttributeKind.FILL_ARRAY:
         for _ in self.${a.attribute_name}: # kind:ARRAY|FILL_ARRAY
-            bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, _.serialize())
+            offset = _.serialize_into(buffer, offset)
     % elif a.kind == helper.AttributeKind.VAR_ARRAY:
         for _ in self.${a.attribute_name}: # kind:VAR_ARRAY
-            bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, self._serialize_aligned(_))
+            offset = self._serialize_aligned_into(_, buffer, offset)
     % elif a.kind == helper.AttributeKind.CUSTOM:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, self.${a.attribute_name}.serialize())  # kind:CUSTOM
+        offset = self.${a.attribute_name}.serialize_into(buffer, offset)  # kind:CUSTOM
     % elif a.kind == helper.AttributeKind.FLAGS:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(${a.attribute_class_name}.flagsToInt(self.get_${helper.camel_to_snake(a.attribute_name)}()), ${a.attribute_size}))  # kind:FLAGS
+        offset = GeneratorUtils.write_uint(buffer, offset, ${a.attribute_class_name}.flagsToInt(self.get_${helper.camel_to_snake(a.attribute_name)}()), ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})  # kind:FLAGS
     % else:
         # Ignored serialization: ${a.attribute_name} ${a.kind}
     % endif
+</%def>\
+<%def name="renderStructSerialize(index, run_attributes)" filter="trim" buffered="True">
+<%
+    def struct_value(a):
+        if a.kind == helper.AttributeKind.SIZE_FIELD:
+            return 'len(self.get_{}())'.format(helper.camel_to_snake(a.parent_attribute['name']))
+        if a.kind == helper.AttributeKind.FLAGS:
+            return '{}.flagsToInt(self.get_{}())'.format(a.attribute_class_name, helper.camel_to_snake(a.attribute_name))
+        if a.kind == helper.AttributeKind.CUSTOM and a.attribute_base_type == 'enum':
+            return 'self.{}.value'.format(a.attribute_name)
+        if a.kind == helper.AttributeKind.CUSTOM:
+            return 'self.{}.{}'.format(a.attribute_name, helper.decapitalize_first_character(a.attribute['type']))
+        if a.kind == helper.AttributeKind.BUFFER:
+            return 'self.{}'.format(a.attribute_name)
+        return 'self.get_{}()'.format(helper.camel_to_snake(a.attribute_name))
+
+    values = [struct_value(a) for a in run_attributes if not (a.attribute_is_reserved and a.kind == helper.AttributeKind.SIMPLE)]
+%>\
+        _STRUCT_${index}.pack_into(buffer, offset${''.join(', ' + value for value in values)})  # kind:STRUCT
+        offset += _STRUCT_${index}.size
 </%def>\
     def serialize(self) -> bytes:
         """Serializes self to bytes.
         Returns:
             Serialized bytes.
         """
-        bytes_ = bytes()
- % if generator.base_class_name is not None:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, super().serialize())
+        buffer = bytearray(self.get_size())
+% if is_receipt(generator.name):
+        # receipts are serialized without their size field
+        del buffer[self.serialize_into(buffer, 0):]
+% else:
+        self.serialize_into(buffer, 0)
+% endif
+        return bytes(buffer)
+
+    def serialize_into(self, buffer: bytearray, offset: int) -> int:
+        """Serializes self into a buffer.
+        Args:
+            buffer: Buffer receiving the serialized object.
+            offset: Offset of the object in the buffer.
+        Returns:
+            Offset following the serialized object.
+        """
+% if generator.base_class_name is not None:
+        offset = super().serialize_into(buffer, offset)
 % endif
 % for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline]:
-    % if a.attribute_is_conditional:
+    % if a.attribute_name in struct_run_by_attribute:
+        % if a is struct_run_by_attribute[a.attribute_name][1][0]:
+        ${renderStructSerialize(*struct_run_by_attribute[a.attribute_name])}
+        % endif
+    % elif a.attribute_is_conditional:
         if ${renderCondition(a) | trim}:
             ## handle py indents
             % for line in map(lambda a: a.strip(), renderSerialize(a).splitlines()):
@@ -289,7 +495,7 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         ${renderSerialize(a)}
     % endif
 % endfor
-        return bytes_
+        return offset
 ## type it manually to have mosaic ids in hex
 % if generator.name == 'UnresolvedMosaic':
 
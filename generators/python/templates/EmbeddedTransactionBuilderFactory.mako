@@ -1,5 +1,8 @@
 # pylint: disable=R0911,R0912
 
+import struct
+from typing import Tuple
+
 # Imports for creating embedded transaction builders
 from .EmbeddedTransactionBuilder import EmbeddedTransactionBuilder
 % for name in sorted(generator.schema):
@@ -11,35 +14,79 @@ from .EmbeddedTransactionBuilder import EmbeddedTransactionBuilder
 from .${name}Builder import ${name}Builder
 % endif
 % endfor
+<%
+    builders = {}
+    for name in generator.schema:
+        layout = generator.schema[name].get("layout", [{type:""}])
+        entityTypeValue = next(iter([x for x in layout if x.get('name','') == 'entityType']),{}).get('value',0)
+        entityTypeVersion = next(iter([x for x in layout if x.get('name','') == 'version']),{}).get('value',0)
+        if entityTypeValue > 0 and 'Aggregate' not in name and 'Block' not in name and name.startswith('Embedded'):
+            builders.setdefault((entityTypeValue, entityTypeVersion), name)
+
+    # the version and the type are peeked from their offsets in the header
+    header_layout = helper.get_fixed_layout(generator.schema, 'EmbeddedTransaction')
+    entity_offset, entity_format = helper.get_struct_peek(generator.schema, 'EmbeddedTransaction', ['version', 'type'])
+
+    # the routing fields of the header are peeked with a single struct call
+    peek_names = [name for name in header_layout if name in ('size', 'signerPublicKey', 'version', 'network', 'type', 'fee', 'deadline')]
+    peek_offset, peek_format = helper.get_struct_peek(generator.schema, 'EmbeddedTransaction', peek_names)
+%>\
+
+_ENTITY_STRUCT = struct.Struct('${entity_format}')
+_HEADER_STRUCT = struct.Struct('${peek_format}')  # ${', '.join(helper.camel_to_snake(name) for name in peek_names)}
 
 class EmbeddedTransactionBuilderFactory:
     """Factory in charge of creating the specific embedded transaction builder from the binary payload.
     """
 
+    # builders by (entity type, version)
+    _builders = {
+% for (entityTypeValue, entityTypeVersion), name in builders.items():
+        (0x${'{:x}'.format(entityTypeValue)}, ${entityTypeVersion}): ${name}Builder,
+% endfor
+    }
+
+    @staticmethod
+    def peek_header(buffer, offset: int = 0) -> Tuple[${', '.join('bytes' if peek_format_name == 'signerPublicKey' else 'int' for peek_format_name in peek_names)}]:
+        """
+        It reads the routing fields of an embedded transaction header without creating any builder.
+        The fields are read with one struct call at offsets computed from the schema, the enums are not validated.
+        Args:
+            buffer: bytes-like object holding the serialized embedded transaction
+            offset: offset of the embedded transaction in the buffer
+        Returns:
+            tuple (${', '.join(helper.camel_to_snake(name) for name in peek_names)})
+        """
+        return _HEADER_STRUCT.unpack_from(buffer, offset${' + {}'.format(peek_offset) if peek_offset else ''})
+
     @classmethod
-    def create_from_payload(cls, payload) -> EmbeddedTransactionBuilder:
+    def create_from_payload(cls, payload, lazy: bool = False) -> EmbeddedTransactionBuilder:
         """
         It creates the specific embedded transaction builder from the payload bytes.
         Args:
             payload: bytes
+            lazy: True to decode the fields on first access, see load_lazy_from_buffer
         Returns:
             the EmbeddedTransactionBuilder subclass
         """
-        headerBuilder = EmbeddedTransactionBuilder.load_from_binary(payload)
-        entityType = headerBuilder.type
-        entityTypeVersion = headerBuilder.version
-% for name in generator.schema:
-<%
-    layout = generator.schema[name].get("layout", [{type:""}])
-    entityTypeValue = next(iter([x for x in layout if x.get('name','') == 'entityType']),{}).get('value',0)
-    entityTypeVersion = next(iter([x for x in layout if x.get('name','') == 'version']),{}).get('value',0)
-%>\
-% if entityTypeValue > 0 and 'Aggregate' not in name and 'Block' not in name and name.startswith('Embedded'):
-        if entityType == 0x${'{:x}'.format(entityTypeValue)} and entityTypeVersion == ${entityTypeVersion}:
-            return ${name}Builder.load_from_binary(payload)
-% endif
-% endfor
-        return headerBuilder
+        return cls.create_from_buffer(memoryview(payload), 0, lazy)[0]
+
+    @classmethod
+    def create_from_buffer(cls, buffer: memoryview, offset: int, lazy: bool = False) -> Tuple[EmbeddedTransactionBuilder, int]:
+        """
+        It creates the specific embedded transaction builder from a buffer, without copying the buffer.
+        Args:
+            buffer: buffer holding the serialized transaction
+            offset: offset of the transaction in the buffer
+            lazy: True to decode the fields on first access, see load_lazy_from_buffer
+        Returns:
+            the EmbeddedTransactionBuilder subclass and the offset following the transaction
+        """
+        version, entityType = _ENTITY_STRUCT.unpack_from(buffer, offset + ${entity_offset})
+        builder_class = cls._builders.get((entityType, version), EmbeddedTransactionBuilder)
+        if lazy:
+            return builder_class.load_lazy_from_buffer(buffer, offset)
+        return builder_class.load_from_buffer(buffer, offset)
 
     @classmethod
     def create_by_name(cls, transaction_name, signer_public_key, network) -> EmbeddedTransactionBuilder:
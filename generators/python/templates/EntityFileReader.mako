@@ -0,0 +1,100 @@
+from __future__ import annotations
+from array import array
+from typing import Generic, Iterator, Type, TypeVar
+import mmap
+import os
+
+T = TypeVar('T')
+
+
+class EntityFileReader(Generic[T]):
+    """Reads a file of back to back entities (ex: the state entries of a snapshot export) through a memory map.
+
+    The file is not read in memory, the entities are decoded from memoryview slices of the mapped file.
+    The first pass over the file builds the index of the entity offsets, which gives random access by entry index.
+    Fixed size entities (IS_FIXED_SIZE) are located from their size, without a first pass.
+    The views returned by get_view must be released before the reader is closed.
+    """
+
+    def __init__(self, builder_class: Type[T], filename: str):
+        """Constructor.
+        Args:
+            builder_class: Class of the entities (ex: AccountStateBuilder).
+            filename: Name of the file holding the entities.
+        """
+        self.builder_class = builder_class
+        self._mmap = None
+        with open(filename, 'rb') as entity_file:
+            # empty files cannot be mapped
+            if os.fstat(entity_file.fileno()).st_size:
+                self._mmap = mmap.mmap(entity_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap if self._mmap is not None else b'')
+        self._offsets = None
+        self._fixed_size = builder_class.SIZE_CONSTANT if getattr(builder_class, 'IS_FIXED_SIZE', False) else None
+        if self._fixed_size is not None and len(self._buffer) % self._fixed_size:
+            file_size = len(self._buffer)
+            self.close()
+            raise EOFError('file size {0} is not a multiple of the entity size {1}'.format(file_size, self._fixed_size))
+
+    def __enter__(self) -> EntityFileReader[T]:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Releases the memory map."""
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _scan(self) -> Iterator[T]:
+        offsets = array('Q', [0])
+        offset = 0
+        while offset < len(self._buffer):
+            item, offset = self.builder_class.load_from_buffer(self._buffer, offset)
+            offsets.append(offset)
+            yield item
+        self._offsets = offsets
+
+    def _get_offsets(self) -> array:
+        if self._offsets is None:
+            for _ in self._scan():
+                pass
+        return self._offsets
+
+    def __len__(self) -> int:
+        if self._fixed_size is not None:
+            return len(self._buffer) // self._fixed_size
+        return len(self._get_offsets()) - 1
+
+    def __iter__(self) -> Iterator[T]:
+        if self._offsets is None and self._fixed_size is None:
+            return self._scan()
+        return (self[index] for index in range(len(self)))
+
+    def __getitem__(self, index: int) -> T:
+        """Decodes an entity.
+        Args:
+            index: Index of the entity in the file.
+        Returns:
+            Instance of the builder class.
+        """
+        return self.builder_class.load_from_buffer(self.get_view(index), 0)[0]
+
+    def get_view(self, index: int) -> memoryview:
+        """Gets the bytes of an entity, without copying them.
+        Args:
+            index: Index of the entity in the file.
+        Returns:
+            View of the entity bytes in the mapped file.
+        """
+        count = len(self)
+        if not -count <= index < count:
+            raise IndexError('entity index {0} out of range'.format(index))
+        index %= count
+        if self._fixed_size is not None:
+            return self._buffer[index * self._fixed_size:(index + 1) * self._fixed_size]
+        offsets = self._offsets
+        return self._buffer[offsets[index]:offsets[index + 1]]
\ No newline at end of file
@@ -4,12 +4,17 @@
         base_class_name = 'Flag'
 %>\
 from __future__ import annotations
+import struct
 from enum import ${base_class_name}
 % if generator.is_flag:
-from typing import List
+from typing import List, Tuple
+% else:
+from typing import Tuple
 % endif
 from .GeneratorUtils import GeneratorUtils
 
+_STRUCT = struct.Struct('<${helper.get_struct_integer_format(generator.size, helper.is_signed(generator.schema, generator.schema[generator.name]))}')
+_DTYPE_DESCRIPTION = ${repr(helper.get_numpy_dtype(generator.schema, generator.name))}
 
 class ${generator.generated_class_name}(${base_class_name}):
     """${helper.capitalize_first_character(generator.comments)}
@@ -32,8 +37,47 @@ class ${generator.generated_class_name}(${base_class_name}):
         Returns:
             Instance of ${generator.generated_class_name}.
         """
-        value: int = GeneratorUtils.buffer_to_uint(GeneratorUtils.get_bytes(bytes(payload), ${generator.size}))
-        return ${generator.generated_class_name}(value)
+        return cls.load_from_buffer(memoryview(payload), 0)[0]
+
+    @classmethod
+    def load_from_buffer(cls, buffer: memoryview, offset: int) -> Tuple[${generator.generated_class_name}, int]:
+        """Creates an instance of ${generator.generated_class_name} from a buffer, without copying the buffer.
+        Args:
+            buffer: Buffer holding the serialized object.
+            offset: Offset of the object in the buffer.
+        Returns:
+            Instance of ${generator.generated_class_name} and the offset following it.
+        """
+        value: int = _STRUCT.unpack_from(buffer, offset)[0]
+        return ${generator.generated_class_name}(value), offset + ${generator.size}
+
+    @classmethod
+    def get_dtype(cls):
+        """Gets the numpy dtype of serialized ${generator.generated_class_name} objects, numpy is required.
+        Returns:
+            Numpy dtype, reserved attributes are padding bytes.
+        """
+        return GeneratorUtils.get_dtype(_DTYPE_DESCRIPTION)
+
+    @classmethod
+    def from_buffer_array(cls, buffer):
+        """Decodes back to back serialized ${generator.generated_class_name} objects with one numpy call, numpy is required.
+        Args:
+            buffer: Bytes-like object holding the serialized objects, it is not copied.
+        Returns:
+            Numpy array with one record by object.
+        """
+        return GeneratorUtils.from_buffer_array(_DTYPE_DESCRIPTION, buffer)
+
+    @classmethod
+    def to_buffer_array(cls, records) -> bytes:
+        """Serializes the records of a numpy array with one numpy call, numpy is required.
+        Args:
+            records: Numpy array with the fields of get_dtype (ex: returned by from_buffer_array).
+        Returns:
+            Serialized objects.
+        """
+        return GeneratorUtils.to_buffer_array(_DTYPE_DESCRIPTION, records)
 
     @classmethod
     def get_size(cls) -> int:
@@ -88,6 +132,15 @@ class ${generator.generated_class_name}(${base_class_name}):
         Returns:
             Serialized bytes.
         """
-        bytes_ = bytes()
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(self.value, ${generator.size}))
-        return bytes_
\ No newline at end of file
+        return _STRUCT.pack(self.value)
+
+    def serialize_into(self, buffer: bytearray, offset: int) -> int:
+        """Serializes self into a buffer.
+        Args:
+            buffer: Buffer receiving the serialized object.
+            offset: Offset of the object in the buffer.
+        Returns:
+            Offset following the serialized object.
+        """
+        _STRUCT.pack_into(buffer, offset, self.value)
+        return offset + ${generator.size}
\ No newline at end of file
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import List, TypeVar
+from typing import AsyncIterator, Iterator, List, TypeVar
+import asyncio
+import struct
 
 T = TypeVar('T')
 
@@ -7,17 +9,27 @@ class GeneratorUtils:
     """Generator utility class"""
 
     @staticmethod
-    def buffer_to_uint(buffer: bytes) -> int:
-        return int.from_bytes(buffer, byteorder='little', signed=True)
+    def buffer_to_uint(buffer: bytes, signed: bool = False) -> int:
+        return int.from_bytes(buffer, byteorder='little', signed=signed)
 
     @staticmethod
-    def uint_to_buffer(uint: int, buffer_size: int) -> bytes:
-        return uint.to_bytes(buffer_size, byteorder='little', signed=True)
+    def uint_to_buffer(uint: int, buffer_size: int, signed: bool = False) -> bytes:
+        return uint.to_bytes(buffer_size, byteorder='little', signed=signed)
 
     @staticmethod
     def concat_typed_arrays(array1, array2):
         return array1 + array2
 
+    @staticmethod
+    def write_uint(buffer: bytearray, offset: int, uint: int, size: int, signed: bool = False) -> int:
+        buffer[offset:offset + size] = GeneratorUtils.uint_to_buffer(uint, size, signed)
+        return offset + size
+
+    @staticmethod
+    def write_bytes(buffer: bytearray, offset: int, data: bytes) -> int:
+        buffer[offset:offset + len(data)] = data
+        return offset + len(data)
+
     @staticmethod
     def get_transaction_padding_size(size: int, alignment: int) -> int:
         if size % alignment == 0:
@@ -30,6 +42,20 @@ class GeneratorUtils:
             raise Exception('size should not exceed {0}. The value of size was: {1}'.format(len(binary), size))
         return binary[0:size]
 
+    @staticmethod
+    def get_view(buffer: memoryview, offset: int, size: int) -> memoryview:
+        if offset + size > len(buffer):
+            raise EOFError('size should not exceed {0}. The value of size was: {1}'.format(len(buffer) - offset, size))
+        return buffer[offset:offset + size]
+
+    @staticmethod
+    def read_uint(buffer: memoryview, offset: int, size: int, signed: bool = False) -> int:
+        return GeneratorUtils.buffer_to_uint(GeneratorUtils.get_view(buffer, offset, size), signed)
+
+    @staticmethod
+    def read_bytes(buffer: memoryview, offset: int, size: int) -> bytes:
+        return bytes(GeneratorUtils.get_view(buffer, offset, size))
+
     # pylint: disable=bad-staticmethod-argument
     # cls argument is not GeneratorUtils
     @staticmethod
@@ -41,4 +67,111 @@ class GeneratorUtils:
             itemSize = item.get_size()
             remainingByteSizes -= itemSize
             payload = payload[itemSize:]
-        return payload
\ No newline at end of file
+        return payload
+
+    @staticmethod
+    def get_dtype(dtype_description):
+        # numpy is an optional dependency, it is only imported by the array helpers
+        import numpy  # pylint: disable=import-outside-toplevel
+        return numpy.dtype(dtype_description)
+
+    @staticmethod
+    def from_buffer_array(dtype_description, buffer):
+        import numpy  # pylint: disable=import-outside-toplevel
+        return numpy.frombuffer(buffer, numpy.dtype(dtype_description))
+
+    @staticmethod
+    def to_buffer_array(dtype_description, records) -> bytes:
+        import numpy  # pylint: disable=import-outside-toplevel
+        dtype = numpy.dtype(dtype_description)
+        if dtype.names is None:
+            return numpy.ascontiguousarray(records, dtype.base).tobytes()
+        if records.dtype == dtype:
+            return records.tobytes()
+        # the padding bytes of the reserved attributes are zeroed
+        result = numpy.zeros(records.shape, dtype)
+        for name in dtype.names:
+            result[name] = records[name]
+        return result.tobytes()
+
+    @staticmethod
+    def read_stream(reader, size: int) -> bytes:
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = reader.read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b''.join(chunks)
+
+    @staticmethod
+    def iter_size_prefixed(reader, size_size: int) -> Iterator[memoryview]:
+        """Reads back to back size prefixed entities, one at a time, from a binary file-like object.
+        The size prefix is included in the entity size, each entity is returned with its size prefix.
+        """
+        while True:
+            prefix = GeneratorUtils.read_stream(reader, size_size)
+            if not prefix:
+                return
+            if len(prefix) < size_size:
+                raise EOFError('truncated size prefix of {0} bytes'.format(len(prefix)))
+            size = GeneratorUtils.buffer_to_uint(prefix)
+            if size < size_size:
+                raise Exception('size should not be less than {0}. The value of size was: {1}'.format(size_size, size))
+            payload = prefix + GeneratorUtils.read_stream(reader, size - size_size)
+            if len(payload) < size:
+                raise EOFError('entity of {0} bytes truncated to {1} bytes'.format(size, len(payload)))
+            yield memoryview(payload)
+
+    @staticmethod
+    async def aiter_size_prefixed(reader: asyncio.StreamReader, size_size: int) -> AsyncIterator[bytes]:
+        """Reads back to back size prefixed entities, one at a time, from an asyncio stream.
+        The size prefix is included in the entity size, each entity is returned with its size prefix.
+        """
+        while True:
+            try:
+                prefix = await reader.readexactly(size_size)
+            except asyncio.IncompleteReadError as error:
+                if not error.partial:
+                    return
+                raise
+            size = GeneratorUtils.buffer_to_uint(prefix)
+            if size < size_size:
+                raise Exception('size should not be less than {0}. The value of size was: {1}'.format(size_size, size))
+            yield prefix + await reader.readexactly(size - size_size)
+
+    # pylint: disable=bad-staticmethod-argument
+    # cls argument is not GeneratorUtils
+    @staticmethod
+    def iter_from_stream(cls: T, reader, chunk_size: int) -> Iterator[T]:
+        """Reads back to back entities without size prefix from a binary file-like object.
+        The stream is read by chunks, an entity crossing the end of a chunk is decoded again once the next chunk is read.
+        """
+        data = b''
+        offset = 0
+        while True:
+            chunk = GeneratorUtils.read_stream(reader, chunk_size)
+            data = data[offset:] + chunk
+            buffer = memoryview(data)
+            offset = 0
+            while offset < len(data):
+                try:
+                    item, offset = cls.load_from_buffer(buffer, offset)
+                except (EOFError, struct.error):
+                    if not chunk:
+                        raise
+                    break
+                yield item
+            if not chunk:
+                return
+
+    # pylint: disable=bad-staticmethod-argument
+    # cls argument is not GeneratorUtils
+    @staticmethod
+    def load_from_buffer(cls: T, items: List[T], buffer: memoryview, offset: int, end: int) -> int:
+        while offset < end:
+            item, offset = cls.load_from_buffer(buffer, offset)
+            items.append(item)
+        return offset
\ No newline at end of file
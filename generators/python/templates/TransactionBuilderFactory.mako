@@ -1,5 +1,10 @@
 # pylint: disable=R0911,R0912
 
+import asyncio
+import struct
+from typing import AsyncIterator, Dict, Iterator, Tuple
+
+from .GeneratorUtils import GeneratorUtils
 # Imports for creating transaction builders
 from .TransactionBuilder import TransactionBuilder
 % for name in sorted(generator.schema):
@@ -11,37 +16,143 @@ from .TransactionBuilder import TransactionBuilder
 from .${name}Builder import ${name}Builder
 % endif
 % endfor
+<%
+    builders = {}
+    for name in generator.schema:
+        layout = generator.schema[name].get("layout", [{type:""}])
+        entityTypeValue = next(iter([x for x in layout if x.get('name','') == 'entityType']),{}).get('value',0)
+        entityTypeVersion = next(iter([x for x in layout if x.get('name','') == 'version']),{}).get('value',0)
+        if entityTypeValue > 0 and 'Block' not in name and not name.startswith('Embedded'):
+            builders.setdefault((entityTypeValue, entityTypeVersion), name)
+
+    # the version and the type are peeked from their offsets in the header
+    header_layout = helper.get_fixed_layout(generator.schema, 'Transaction')
+    entity_offset, entity_format = helper.get_struct_peek(generator.schema, 'Transaction', ['version', 'type'])
+
+    # the routing fields of the header are peeked with a single struct call
+    peek_names = [name for name in header_layout if name in ('size', 'signerPublicKey', 'version', 'network', 'type', 'fee', 'deadline')]
+    peek_offset, peek_format = helper.get_struct_peek(generator.schema, 'Transaction', peek_names)
+%>\
+
+_ENTITY_STRUCT = struct.Struct('${entity_format}')
+_HEADER_STRUCT = struct.Struct('${peek_format}')  # ${', '.join(helper.camel_to_snake(name) for name in peek_names)}
 
 
 class TransactionBuilderFactory:
     """Factory in charge of creating the specific transaction builder from the binary payload.
     """
 
+    # builders by (entity type, version)
+    _builders = {
+% for (entityTypeValue, entityTypeVersion), name in builders.items():
+        (0x${'{:x}'.format(entityTypeValue)}, ${entityTypeVersion}): ${name}Builder,
+% endfor
+    }
+
+    @staticmethod
+    def peek_header(buffer, offset: int = 0) -> Tuple[${', '.join('bytes' if peek_format_name == 'signerPublicKey' else 'int' for peek_format_name in peek_names)}]:
+        """
+        It reads the routing fields of a transaction header without creating any builder.
+        The fields are read with one struct call at offsets computed from the schema, the enums are not validated.
+        Args:
+            buffer: bytes-like object holding the serialized transaction
+            offset: offset of the transaction in the buffer
+        Returns:
+            tuple (${', '.join(helper.camel_to_snake(name) for name in peek_names)})
+        """
+        return _HEADER_STRUCT.unpack_from(buffer, offset${' + {}'.format(peek_offset) if peek_offset else ''})
+
     @classmethod
-    def create_from_payload(cls, payload) -> TransactionBuilder:
+    def create_from_payload(cls, payload, lazy: bool = False) -> TransactionBuilder:
         """
         It creates the specific transaction builder from the payload bytes.
         Args:
             payload: bytes
+            lazy: True to decode the fields on first access, see load_lazy_from_buffer
         Returns:
             the TransactionBuilder subclass
         """
-        headerBuilder = TransactionBuilder.load_from_binary(payload)
-        entityType = headerBuilder.type
-        entityTypeVersion = headerBuilder.version
-% for name in generator.schema:
-<%
-    layout = generator.schema[name].get("layout", [{type:""}])
-    entityTypeValue = next(iter([x for x in layout if x.get('name','') == 'entityType']),{}).get('value',0)
-    entityTypeVersion = next(iter([x for x in layout if x.get('name','') == 'version']),{}).get('value',0)
-%>\
-    % if entityTypeValue > 0 and 'Block' not in name and not name.startswith('Embedded'):
-        if entityType == 0x${'{:x}'.format(entityTypeValue)} and entityTypeVersion == ${entityTypeVersion}:
-            return ${name}Builder.load_from_binary(payload)
-    % endif
-% endfor
-        return headerBuilder
+        return cls.create_from_buffer(memoryview(payload), 0, lazy)[0]
+
+    @classmethod
+    def create_from_buffer(cls, buffer: memoryview, offset: int, lazy: bool = False) -> Tuple[TransactionBuilder, int]:
+        """
+        It creates the specific transaction builder from a buffer, without copying the buffer.
+        Args:
+            buffer: buffer holding the serialized transaction
+            offset: offset of the transaction in the buffer
+            lazy: True to decode the fields on first access, see load_lazy_from_buffer
+        Returns:
+            the TransactionBuilder subclass and the offset following the transaction
+        """
+        version, entityType = _ENTITY_STRUCT.unpack_from(buffer, offset + ${entity_offset})
+        builder_class = cls._builders.get((entityType, version), TransactionBuilder)
+        if lazy:
+            return builder_class.load_lazy_from_buffer(buffer, offset)
+        return builder_class.load_from_buffer(buffer, offset)
+
+    @classmethod
+    def decode_columns(cls, payloads) -> Dict[Tuple[int, int], dict]:
+        """
+        It decodes a batch of transactions into columns, without creating the transaction builders.
+        The transactions are grouped by (entity type, version) and each field is appended to the column of its group,
+        see append_columns: array.array for the integer fields, bytearray for the byte fields and, for the variable
+        size fields (ex: the transfer messages), bytearray with the end offsets of the values in '<name>_offsets'.
+        Args:
+            payloads: iterable of bytes-like objects, each one holding one serialized transaction
+        Returns:
+            the columns by field name of each (entity type, version), the unknown transactions only have header columns
+        """
+        groups = {}
+        for payload in payloads:
+            with memoryview(payload) as buffer:
+                key = _ENTITY_STRUCT.unpack_from(buffer, ${entity_offset})[::-1]
+                builder_class = cls._builders.get(key, TransactionBuilder)
+                columns = groups.get(key)
+                if columns is None:
+                    columns = groups[key] = builder_class.create_columns()
+                builder_class.append_columns(columns, buffer, 0)
+        return groups
+
+
+    @classmethod
+    def iter_from_stream(cls, reader, lazy: bool = False) -> Iterator[TransactionBuilder]:
+        """
+        It creates the specific transaction builders of back to back transactions read from a binary stream.
+        The transactions are read one at a time, each one is read from its size prefix.
+        Args:
+            reader: binary file-like object (ex: an open file or a socket.makefile('rb'))
+            lazy: True to decode the fields on first access, see load_lazy_from_buffer
+        Returns:
+            iterator over the TransactionBuilder subclasses
+        """
+        for payload in GeneratorUtils.iter_size_prefixed(reader, ${header_layout['size'][1]}):
+            yield cls.create_from_buffer(payload, 0, lazy)[0]
+
+    @classmethod
+    async def aiter_from_stream(cls, reader: asyncio.StreamReader, lazy: bool = False, executor=None,
+                                executor_size: int = 0x10000) -> AsyncIterator[TransactionBuilder]:
+        """
+        It creates the specific transaction builders of back to back transactions read from an asyncio stream.
+        The transactions are read one at a time with readexactly, each one is read from its size prefix.
+        Args:
+            reader: asyncio stream (ex: the reader returned by asyncio.open_connection)
+            lazy: True to decode the fields on first access, see load_lazy_from_buffer, it cannot be combined with an executor
+            executor: optional concurrent.futures executor decoding the large transactions outside of the event loop
+            executor_size: size in bytes from which the transactions are decoded by the executor
+        Returns:
+            async iterator over the TransactionBuilder subclasses
+        """
+        if lazy and executor is not None:
+            # lazy builders are not decoded and hold a view of their payload, which cannot be sent back by a process pool
+            raise ValueError('lazy decoding cannot be combined with an executor')
 
+        loop = asyncio.get_running_loop()
+        async for payload in GeneratorUtils.aiter_size_prefixed(reader, ${header_layout['size'][1]}):
+            if executor is not None and len(payload) >= executor_size:
+                yield await loop.run_in_executor(executor, cls.create_from_payload, payload, lazy)
+            else:
+                yield cls.create_from_payload(payload, lazy)
 
     @classmethod
     def create_by_name(cls, transaction_name, signer_public_key, network) -> TransactionBuilder:
@@ -1,8 +1,17 @@
 ## NOTE: do *not* touch `buffered` in render definitions, it will completely break output
 <%
+    # consecutive fixed size attributes are read and written with one precompiled struct
+    struct_runs = helper.get_struct_runs(generator.schema, [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline],
+                                         ['payloadSize'] if 'AggregateTransactionBody' in generator.generated_class_name else [])
+    struct_run_by_attribute = {a.attribute_name: (index, run_attributes) for index, (_, run_attributes) in enumerate(struct_runs) for a in run_attributes}
+
+    # numpy dtype of the types with a fixed size
+    dtype_description = helper.get_numpy_dtype(generator.schema, generator.name, snake_case_names=True)
+
     python_lib_import_statements = []
     catbuffer_lib_import_statements = []
-    for a in sorted(generator.required_import):
+    for a in sorted(generator.required_import | {'from typing import Tuple'} | ({'import struct'} if struct_runs else set())
+                    | ({'from array import array'} if generator.name in ('Transaction', 'EmbeddedTransaction') or generator.name.endswith('TransactionBody') else set())):
         if str(a).startswith('from .'):
             catbuffer_lib_import_statements.append(a)
         else:
@@ -19,6 +28,15 @@ from .GeneratorUtils import GeneratorUtils
 % for a in catbuffer_lib_import_statements:
 ${a}
 % endfor
+% if struct_runs:
+
+% endif
+% for index, (struct_format, run_attributes) in enumerate(struct_runs):
+_STRUCT_${index} = struct.Struct('${struct_format}')  # ${', '.join(helper.camel_to_snake(a.attribute_name) for a in run_attributes)}
+% endfor
+% if dtype_description is not None:
+_DTYPE_DESCRIPTION = ${repr(dtype_description)}
+% endif
 
 def to_hex_string(bin):
     return hexlify(bin).decode('utf-8')
@@ -35,6 +53,29 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
     % endif
 % endfor
     """
+<%
+    # base classes declare the slots of their own attributes, type_hints is a class attribute
+    if generator.name.endswith('TransactionBody'):
+        slots = [helper.camel_to_snake(a.attribute_name) for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline and not a.kind == helper.AttributeKind.SIZE_FIELD and not a.attribute_is_reserved and a.attribute_name != 'size']
+    elif generator.name == 'Transaction':
+        slots = ['signature', 'signer_public_key', 'version', 'network', 'type', 'fee', 'deadline']
+    elif generator.name == 'EmbeddedTransaction':
+        slots = ['signer_public_key', 'version', 'network', 'type']
+    else:
+        slots = ['body']
+%>\
+    __slots__ = ${helper.get_slots(slots + (['_payload'] if generator.name in ('Transaction', 'EmbeddedTransaction') else []))}
+<%
+    static_layout = helper.get_static_layout(generator.schema, generator.name)
+%>\
+    # serialized layout computed from the schema: (offset, size) of the fields preceding the first variable size field.
+    # The size is SIZE_CONSTANT + sum(count * element size) of the (field, count field, element size) SIZE_TERMS,
+    # both are None when the size depends on conditional fields or on the remaining bytes.
+    FIELD_LAYOUT = {${', '.join('{0}: {1}'.format(repr(helper.camel_to_snake(name)), field) for name, field in static_layout.field_layout.items())}}
+    SIZE_CONSTANT = ${static_layout.size_constant}
+    SIZE_TERMS = ${'None' if static_layout.size_terms is None else repr(tuple((helper.camel_to_snake(term_name), helper.camel_to_snake(count_name), element_size) for term_name, count_name, element_size in static_layout.size_terms))}
+    IS_FIXED_SIZE = ${static_layout.is_fixed_size}
+
 % if not generator.name.endswith('TransactionBody'):
     type_hints = {
 % for a in [a for a in generator.attributes if  not a.kind == helper.AttributeKind.SIZE_FIELD and not a.attribute_is_reserved and a.attribute_name != 'size']:
@@ -108,6 +149,7 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
 
         self.fee = 0
         self.deadline = 0
+        self._payload = None
 
   % elif generator.name == 'EmbeddedTransaction':
     def __init__(self, signer_public_key, version, network: NetworkTypeDto, type):
@@ -123,6 +165,7 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         self.version = version
         self.network = network
         self.type = type
+        self._payload = None
 
   % else:
     % for a in generator.immutable_attributes:
@@ -142,20 +185,78 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         super().__init__(signer_public_key, self.VERSION, network, self.ENTITY_TYPE)
 
         self.body = ${ next(a for a in generator.attributes if a.attribute_name.endswith('TransactionBody')).attribute_class_name }()
+
+    # the body of a lazily loaded transaction follows its fixed size header
+    _LAZY_FIELDS = dict(${generator.generated_base_class_name}._LAZY_FIELDS, body=lambda payload: ${ next(a for a in generator.attributes if a.attribute_name.endswith('TransactionBody')).attribute_class_name }.load_from_buffer(payload, ${helper.get_fixed_size(generator.schema, generator.base_class_name)})[0])
   % endif
 
 % endif # TransactionBody
+<%def name="renderLazyReader(a, offset)" filter="trim">
+    % if a.kind == helper.AttributeKind.CUSTOM and a.attribute_base_type == 'enum':
+    ${a.attribute_class_name}(GeneratorUtils.read_uint(payload, ${offset}, ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})).value
+    % elif a.kind == helper.AttributeKind.CUSTOM and a.attribute_base_type == 'byte' and a.attribute_size > 8:
+    GeneratorUtils.read_bytes(payload, ${offset}, ${a.attribute_size})
+    % else:
+    GeneratorUtils.read_uint(payload, ${offset}, ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})
+    % endif
+</%def>\
+% if generator.name in ('Transaction', 'EmbeddedTransaction'):
+<%
+    fixed_layout = helper.get_fixed_layout(generator.schema, generator.name)
+%>\
+    # readers of the fields of a lazily loaded transaction, by field name
+    _LAZY_FIELDS = {
+  % for a in [a for a in generator.attributes if helper.camel_to_snake(a.attribute_name) in slots]:
+        '${helper.camel_to_snake(a.attribute_name)}': lambda payload: ${renderLazyReader(a, fixed_layout[a.attribute_name][0])},
+  % endfor
+    }
+
+    @classmethod
+    def load_lazy_from_buffer(cls, buffer: memoryview, offset: int) -> Tuple[${generator.generated_class_name}, int]:
+        """Creates an instance of the class from a buffer, without decoding it.
+        The fields are decoded on first access and serialize returns the original bytes while no field is modified.
+        The buffer is not copied, it must not be modified while the instance is used.
+        Args:
+            buffer: Buffer holding the serialized object.
+            offset: Offset of the object in the buffer.
+        Returns:
+            Instance of the class and the offset following it.
+        """
+        size = GeneratorUtils.read_uint(buffer, offset${' + {}'.format(fixed_layout['size'][0]) if fixed_layout['size'][0] else ''}, ${fixed_layout['size'][1]})
+        result = cls.__new__(cls)
+        result._payload = GeneratorUtils.get_view(buffer, offset, size)
+        return result, offset + size
+
+    def __getattr__(self, name):
+        # called for the fields not set yet, only the lazily loaded transactions have such fields
+        reader = self._LAZY_FIELDS.get(name)
+        if reader is None or self._payload is None:
+            raise AttributeError(name)
+        value = reader(self._payload)
+        setattr(self, name, value)
+        return value
+
+    def _is_payload_unmodified(self) -> bool:
+        for name, reader in self._LAZY_FIELDS.items():
+            try:
+                value = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+            # decoded objects (ex: the body) can be modified in place, they are serialized again
+            if not isinstance(value, (int, bytes)) or value != reader(self._payload):
+                return False
+        return True
+
+% endif
 % if 'AggregateTransactionBody' in generator.generated_class_name:
     @staticmethod
-    def _load_embedded_transactions(transactions, payload: bytes, payload_size: int):
-        remaining_byte_sizes = payload_size
-        while remaining_byte_sizes > 0:
-            item = EmbeddedTransactionBuilderFactory.create_from_payload(payload)
+    def _load_embedded_transactions(transactions, buffer: memoryview, offset: int, payload_size: int) -> int:
+        end = offset + payload_size
+        while offset < end:
+            item, item_end = EmbeddedTransactionBuilderFactory.create_from_buffer(buffer, offset)
             transactions.append(item)
-            item_size = item.get_size() + GeneratorUtils.get_transaction_padding_size(item.get_size(), 8)
-            remaining_byte_sizes -= item_size
-            payload = payload[item_size:]
-        return payload
+            offset = item_end + GeneratorUtils.get_transaction_padding_size(item_end - offset, 8)
+        return offset
 
 % endif
 ##  LOAD FROM BINARY:
@@ -164,18 +265,18 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
     formatted_attribute_name = helper.camel_to_snake(a.attribute_name)
 %>\
     % if a.kind == helper.AttributeKind.SIMPLE:
-        ${formatted_attribute_name} = GeneratorUtils.buffer_to_uint(GeneratorUtils.get_bytes(bytes_, ${a.attribute_size}))  # kind:SIMPLE
-        bytes_ = bytes_[${a.attribute_size}:]
+        ${formatted_attribute_name} = GeneratorUtils.read_uint(buffer, offset, ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})  # kind:SIMPLE
+        offset += ${a.attribute_size}
     % elif a.kind == helper.AttributeKind.BUFFER:
-        ${formatted_attribute_name} = GeneratorUtils.get_bytes(bytes_, ${helper.camel_to_snake(a.attribute_size)})  # kind:BUFFER
-        bytes_ = bytes_[${helper.camel_to_snake(a.attribute_size)}:]
+        ${formatted_attribute_name} = GeneratorUtils.read_bytes(buffer, offset, ${helper.camel_to_snake(a.attribute_size)})  # kind:BUFFER
+        offset += ${helper.camel_to_snake(a.attribute_size)}
     % elif a.kind == helper.AttributeKind.SIZE_FIELD:
-        ${formatted_attribute_name} = GeneratorUtils.buffer_to_uint(GeneratorUtils.get_bytes(bytes_, ${a.attribute_size}))  # kind:SIZE_FIELD
-        bytes_ = bytes_[${a.attribute_size}:]
+        ${formatted_attribute_name} = GeneratorUtils.read_uint(buffer, offset, ${a.attribute_size})  # kind:SIZE_FIELD
+        offset += ${a.attribute_size}
     % elif a.kind == helper.AttributeKind.ARRAY:
         ${formatted_attribute_name} = []  # kind:ARRAY
         for _ in range(${helper.camel_to_snake(a.attribute_size)}):
-            item = ${a.attribute_class_name}.load_from_binary(bytes_)
+            item, offset = ${a.attribute_class_name}.load_from_buffer(buffer, offset)
         % if a.attribute_base_type == 'struct':
             ${formatted_attribute_name}.append(item.as_tuple())
         % elif a.attribute_base_type == 'enum':
@@ -183,40 +284,51 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         % else:
             ${formatted_attribute_name}.append(item.${helper.decapitalize_first_character(a.attribute['type'])})
         % endif
-            bytes_ = bytes_[item.get_size():]
     % elif a.kind == helper.AttributeKind.CUSTOM and a.conditional_read_before:
-        ${formatted_attribute_name} = ${a.attribute_class_name}.load_from_binary(${a.attribute['condition']}Condition).${helper.decapitalize_first_character(a.attribute['type'])}  # kind:CUSTOM3
+        ${formatted_attribute_name} = ${a.attribute_class_name}.load_from_buffer(buffer, ${a.attribute['condition']}ConditionOffset)[0].${helper.decapitalize_first_character(a.attribute['type'])}  # kind:CUSTOM3
     % elif a.kind == helper.AttributeKind.CUSTOM and a.attribute_base_type == 'enum':
-        ${formatted_attribute_name}_ = ${a.attribute_class_name}.load_from_binary(bytes_)  # kind:CUSTOM2
+        ${formatted_attribute_name}_, offset = ${a.attribute_class_name}.load_from_buffer(buffer, offset)  # kind:CUSTOM2
         ${formatted_attribute_name} = ${formatted_attribute_name}_.value
-        bytes_ = bytes_[${formatted_attribute_name}_.get_size():]
     % elif a.kind == helper.AttributeKind.CUSTOM and a.attribute_base_type == 'byte':
-        ${formatted_attribute_name}_ = ${a.attribute_class_name}.load_from_binary(bytes_)  # kind:CUSTOM1_byte
+        ${formatted_attribute_name}_, offset = ${a.attribute_class_name}.load_from_buffer(buffer, offset)  # kind:CUSTOM1_byte
         ${formatted_attribute_name} = ${formatted_attribute_name}_.${helper.decapitalize_first_character(a.attribute['type'])}
-        bytes_ = bytes_[${formatted_attribute_name}_.get_size():]
     % elif a.kind == helper.AttributeKind.CUSTOM:
       % if a.attribute_is_aggregate:
-        body = ${a.attribute_class_name}.load_from_binary(bytes_)  # kind:CUSTOM1_nonbyte
-        bytes_ = bytes_[body.get_size():]
+        body, offset = ${a.attribute_class_name}.load_from_buffer(buffer, offset${', end' if any(helper.is_fill_array_type(x) for x in generator.schema[a.attribute['type']]['layout']) else ''})  # kind:CUSTOM1_nonbyte
       % else:
-        ${formatted_attribute_name} = ${a.attribute_class_name}.load_from_binary(bytes_)  # kind:CUSTOM1_nonbyte
-        bytes_ = bytes_[${formatted_attribute_name}.get_size():]
-        ${formatted_attribute_name} = ${formatted_attribute_name}.as_tuple()
+        ${formatted_attribute_name}_, offset = ${a.attribute_class_name}.load_from_buffer(buffer, offset)  # kind:CUSTOM1_nonbyte
+        ${formatted_attribute_name} = ${formatted_attribute_name}_.as_tuple()
       % endif
     % elif a.kind == helper.AttributeKind.FILL_ARRAY:
         ${formatted_attribute_name}_ = []
-        bytes_ = GeneratorUtils.load_from_binary(${a.attribute_class_name}, ${formatted_attribute_name}_, bytes_, len(bytes_))
+        offset = GeneratorUtils.load_from_buffer(${a.attribute_class_name}, ${formatted_attribute_name}_, buffer, offset, len(buffer) if end is None else end)
         ${formatted_attribute_name} = list(map(lambda e: e.as_tuple(), ${formatted_attribute_name}_))
     % elif a.kind == helper.AttributeKind.FLAGS:
-        ${formatted_attribute_name} = ${a.attribute_class_name}.bytesToFlags(bytes_, ${a.attribute_size})  # kind:FLAGS
-        bytes_ = bytes_[${a.attribute_size}:]
+        ${formatted_attribute_name} = ${a.attribute_class_name}.intToFlags(GeneratorUtils.read_uint(buffer, offset, ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)}))  # kind:FLAGS
+        offset += ${a.attribute_size}
     % elif a.kind == helper.AttributeKind.VAR_ARRAY:
         transactions = []
-        bytes_ = ${generator.generated_class_name}._load_embedded_transactions(transactions, bytes_, ${helper.camel_to_snake(a.attribute_size)})
+        offset = ${generator.generated_class_name}._load_embedded_transactions(transactions, buffer, offset, ${helper.camel_to_snake(a.attribute_size)})
     % else:
         FIX ME!
     % endif
 </%def>\
+<%def name="renderStructReader(index, run_attributes)" filter="trim" buffered="True">
+<%
+    values = [helper.camel_to_snake(a.attribute_name) for a in run_attributes if not (a.attribute_is_reserved and a.kind == helper.AttributeKind.SIMPLE)]
+%>\
+    % if values:
+        ${', '.join(values)}${',' if len(values) == 1 else ''} = _STRUCT_${index}.unpack_from(buffer, offset)  # kind:STRUCT
+    % endif
+    % for a in run_attributes:
+        % if a.kind == helper.AttributeKind.FLAGS:
+        ${helper.camel_to_snake(a.attribute_name)} = ${a.attribute_class_name}.intToFlags(${helper.camel_to_snake(a.attribute_name)})
+        % elif a.kind == helper.AttributeKind.CUSTOM and a.attribute_base_type == 'enum':
+        ${helper.camel_to_snake(a.attribute_name)} = ${a.attribute_class_name}(${helper.camel_to_snake(a.attribute_name)}).value
+        % endif
+    % endfor
+        offset += _STRUCT_${index}.size
+</%def>\
 <%def name="renderCondition(a, useSelf=True)" filter="trim">
     ${helper.get_condition_operation_text(a.attribute['condition_operation']).format(('self.' if useSelf else '') + helper.camel_to_snake(a.attribute['condition']), helper.get_generated_class_name(a.condition_type_attribute['type'], a.condition_type_attribute, generator.schema) + '.' + helper.create_enum_name(a.attribute['condition_value']) + '.value')}
 </%def>\
@@ -228,20 +340,49 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         Returns:
             Instance of ${generator.generated_class_name}.
         """
-        bytes_ = bytes(payload)
+        return cls.load_from_buffer(memoryview(payload), 0)[0]
+
+<%
+    # fill arrays are read up to the end of the transaction, given by its size, bodies read them up to the end argument
+    has_fill_array = any(a.kind == helper.AttributeKind.FILL_ARRAY for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline)
+    body_has_fill_array = any(helper.is_fill_array_type(x) for a in generator.attributes if a.attribute_is_aggregate for x in generator.schema[a.attribute['type']]['layout'])
+    size_field = helper.get_fixed_layout(generator.schema, generator.name).get('size')
+%>\
+    @classmethod
+  % if has_fill_array:
+    def load_from_buffer(cls, buffer: memoryview, offset: int, end: int = None) -> Tuple[${generator.generated_class_name}, int]:
+  % else:
+    def load_from_buffer(cls, buffer: memoryview, offset: int) -> Tuple[${generator.generated_class_name}, int]:
+  % endif
+        """Creates an instance of ${generator.generated_class_name} from a buffer, without copying the buffer.
+        Args:
+            buffer: Buffer holding the serialized object.
+            offset: Offset of the object in the buffer.
+  % if has_fill_array:
+            end: End offset of the object in the buffer, the end of the buffer by default.
+  % endif
+        Returns:
+            Instance of ${generator.generated_class_name} and the offset following it.
+        """
+  % if body_has_fill_array:
+        end = offset + GeneratorUtils.read_uint(buffer, offset${' + {}'.format(size_field[0]) if size_field[0] else ''}, ${size_field[1]})
+  % endif
     % if generator.base_class_name is not None:
-        superObject = ${generator.generated_base_class_name}.load_from_binary(bytes_)
+        superObject, offset = ${generator.generated_base_class_name}.load_from_buffer(buffer, offset)
         assert cls.VERSION == superObject.version, 'Invalid entity version ({})'.format(superObject.version)
         assert cls.ENTITY_TYPE == superObject.type, 'Invalid entity type ({})'.format(superObject.type)
-        bytes_ = bytes_[superObject.get_size():]
     % endif
     % for a in set([(a.attribute['condition'], a.attribute_size, a.conditional_read_before) for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline and a.conditional_read_before and a.attribute_is_conditional]):
-        ${a[0]}Condition = bytes_[0:${a[1]}]
-        bytes_ = bytes_[${a[1]}:]
+        ${a[0]}ConditionOffset = offset
+        offset += ${a[1]}
     % endfor
 
     % for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline and not a.conditional_read_before]:
-        %if a.attribute_is_conditional:
+        % if a.attribute_name in struct_run_by_attribute:
+          % if a is struct_run_by_attribute[a.attribute_name][1][0]:
+        ${renderStructReader(*struct_run_by_attribute[a.attribute_name]) | trim}
+          % endif
+        % elif a.attribute_is_conditional:
         ${helper.camel_to_snake(a.attribute_name)} = None
         if ${renderCondition(a, useSelf=False) | trim}:
             ## handle py indents
@@ -264,14 +405,14 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
 % if generator.name == 'EmbeddedTransaction':
         # create object and call
         result = EmbeddedTransactionBuilder(signer_public_key, version, network, type)
-        return result
+        return result, offset
 % elif generator.name == 'Transaction':
         # create object and call
         result = TransactionBuilder(signer_public_key, version, network, type)
         result.signature = signature
         result.fee = fee
         result.deadline = deadline
-        return result
+        return result, offset
 % else:
         # create object and call
     % if generator.name.endswith('TransactionBody'):
@@ -293,7 +434,178 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         result.${helper.camel_to_snake(a.attribute_name)} = ${helper.camel_to_snake(a.attribute_name)}
       % endif
     % endfor
-        return result
+        return result, offset
+% endif
+
+##  COLUMNS:
+<%def name="renderColumnWriter(a, offset='offset')" filter="trim" buffered="True">
+<%
+    formatted_attribute_name = helper.camel_to_snake(a.attribute_name)
+    typecode = helper.get_column_typecode(generator.schema, a)
+%>\
+    % if a.attribute_is_reserved:
+        offset += ${a.attribute_size}
+    % elif a.kind == helper.AttributeKind.SIZE_FIELD:
+        ${formatted_attribute_name} = GeneratorUtils.read_uint(buffer, offset, ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})
+        offset += ${a.attribute_size}
+    % elif typecode is not None:
+        ${formatted_attribute_name} = GeneratorUtils.read_uint(buffer, ${offset}, ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})
+        columns['${formatted_attribute_name}'].append(${formatted_attribute_name})
+      % if offset == 'offset':
+        offset += ${a.attribute_size}
+      % endif
+    % elif a.kind == helper.AttributeKind.CUSTOM:
+        columns['${formatted_attribute_name}'] += GeneratorUtils.get_view(buffer, ${offset}, ${helper.get_fixed_size(generator.schema, a.attribute['type'])})
+      % if offset == 'offset':
+        offset += ${helper.get_fixed_size(generator.schema, a.attribute['type'])}
+      % endif
+    % elif a.kind == helper.AttributeKind.FILL_ARRAY:
+        columns['${formatted_attribute_name}'] += buffer[offset:end]
+        columns['${formatted_attribute_name}_offsets'].append(len(columns['${formatted_attribute_name}']))
+        offset = len(buffer) if end is None else end
+    % else:
+<%
+    if a.kind == helper.AttributeKind.ARRAY:
+        size = '{0} * {1}'.format(helper.camel_to_snake(a.attribute_size), helper.get_fixed_size(generator.schema, a.attribute['type']))
+    else:
+        size = helper.camel_to_snake(a.attribute_size)
+%>\
+        columns['${formatted_attribute_name}'] += GeneratorUtils.get_view(buffer, offset, ${size})
+        columns['${formatted_attribute_name}_offsets'].append(len(columns['${formatted_attribute_name}']))
+        offset += ${size}
+    % endif
+</%def>\
+<%def name="renderColumnDefault(a)" filter="trim" buffered="True">
+<%
+    formatted_attribute_name = helper.camel_to_snake(a.attribute_name)
+%>\
+    % if helper.get_column_typecode(generator.schema, a) is not None:
+        columns['${formatted_attribute_name}'].append(0)
+    % elif a.kind == helper.AttributeKind.CUSTOM:
+        columns['${formatted_attribute_name}'] += bytes(${helper.get_fixed_size(generator.schema, a.attribute['type'])})
+    % else:
+        columns['${formatted_attribute_name}_offsets'].append(len(columns['${formatted_attribute_name}']))
+    % endif
+</%def>\
+<%def name="renderStructColumns(index, run_attributes)" filter="trim" buffered="True">
+<%
+    values = [helper.camel_to_snake(a.attribute_name) for a in run_attributes if not (a.attribute_is_reserved and a.kind == helper.AttributeKind.SIMPLE)]
+%>\
+    % if values:
+        ${', '.join(values)}${',' if len(values) == 1 else ''} = _STRUCT_${index}.unpack_from(buffer, offset)
+    % endif
+    % for a in [a for a in run_attributes if not a.attribute_is_reserved and not a.kind == helper.AttributeKind.SIZE_FIELD and a.attribute_name != 'size']:
+      % if helper.get_column_typecode(generator.schema, a) is not None:
+        columns['${helper.camel_to_snake(a.attribute_name)}'].append(${helper.camel_to_snake(a.attribute_name)})
+      % else:
+        columns['${helper.camel_to_snake(a.attribute_name)}'] += ${helper.camel_to_snake(a.attribute_name)}
+      % endif
+    % endfor
+        offset += _STRUCT_${index}.size
+</%def>\
+% if generator.name in ('Transaction', 'EmbeddedTransaction') or generator.name.endswith('TransactionBody'):
+    @classmethod
+    def create_columns(cls) -> dict:
+        """Creates the empty columns of the fields of the class, see append_columns.
+        Returns:
+            Columns by field name.
+        """
+        return {
+  % for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline and not a.kind == helper.AttributeKind.SIZE_FIELD and not a.attribute_is_reserved and a.attribute_name != 'size']:
+    % if helper.get_column_typecode(generator.schema, a) is not None:
+            '${helper.camel_to_snake(a.attribute_name)}': array('${helper.get_column_typecode(generator.schema, a)}'),
+    % elif a.kind == helper.AttributeKind.CUSTOM:
+            '${helper.camel_to_snake(a.attribute_name)}': bytearray(),
+    % else:
+            '${helper.camel_to_snake(a.attribute_name)}': bytearray(),
+            '${helper.camel_to_snake(a.attribute_name)}_offsets': array('Q', [0]),
+    % endif
+  % endfor
+        }
+
+    @classmethod
+  % if has_fill_array:
+    def append_columns(cls, columns: dict, buffer: memoryview, offset: int, end: int = None) -> int:
+  % else:
+    def append_columns(cls, columns: dict, buffer: memoryview, offset: int) -> int:
+  % endif
+        """Appends the fields of a serialized object to columns, without creating the object.
+        The integer fields are appended to arrays and the fixed size byte fields are appended back to back to bytearrays.
+        The variable size fields are appended to bytearrays, the end offset of each value is appended to '<name>_offsets'.
+        Absent conditional fields are appended as zeros.
+        Args:
+            columns: Columns by field name, see create_columns.
+            buffer: Buffer holding the serialized object.
+            offset: Offset of the object in the buffer.
+  % if has_fill_array:
+            end: End offset of the object in the buffer, the end of the buffer by default.
+  % endif
+        Returns:
+            Offset following the object.
+        """
+    % for a in set([(a.attribute['condition'], a.attribute_size, a.conditional_read_before) for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline and a.conditional_read_before and a.attribute_is_conditional]):
+        ${a[0]}ConditionOffset = offset
+        offset += ${a[1]}
+    % endfor
+    % for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline and not a.conditional_read_before]:
+        % if a.attribute_name in struct_run_by_attribute:
+          % if a is struct_run_by_attribute[a.attribute_name][1][0]:
+        ${renderStructColumns(*struct_run_by_attribute[a.attribute_name]) | trim}
+          % endif
+        % elif a.attribute_is_conditional:
+        if ${renderCondition(a, useSelf=False) | trim}:
+            % for line in map(lambda a: a.strip(), renderColumnWriter(a).splitlines()):
+            ${line}
+            % endfor
+        else:
+            % for line in map(lambda a: a.strip(), renderColumnDefault(a).splitlines()):
+            ${line}
+            % endfor
+        % else:
+        ${renderColumnWriter(a) | trim}
+        % endif
+    % endfor
+    % for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline and a.conditional_read_before]:
+        if ${renderCondition(a, useSelf=False) | trim}:
+            % for line in map(lambda a: a.strip(), renderColumnWriter(a, a.attribute['condition'] + 'ConditionOffset').splitlines()):
+            ${line}
+            % endfor
+        else:
+            % for line in map(lambda a: a.strip(), renderColumnDefault(a).splitlines()):
+            ${line}
+            % endfor
+    % endfor
+        return offset
+% else:
+<%
+    body_class_name = [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline][0].attribute_class_name
+%>\
+    @classmethod
+    def create_columns(cls) -> dict:
+        """Creates the empty columns of the header and body fields, see append_columns.
+        Returns:
+            Columns by field name.
+        """
+        return dict(${generator.generated_base_class_name}.create_columns(), **${body_class_name}.create_columns())
+
+    @classmethod
+    def append_columns(cls, columns: dict, buffer: memoryview, offset: int) -> int:
+        """Appends the header and body fields of a serialized transaction to columns, without creating the transaction.
+        Args:
+            columns: Columns by field name, see create_columns.
+            buffer: Buffer holding the serialized transaction.
+            offset: Offset of the transaction in the buffer.
+        Returns:
+            Offset following the transaction.
+        """
+  % if body_has_fill_array:
+        end = offset + GeneratorUtils.read_uint(buffer, offset${' + {}'.format(size_field[0]) if size_field[0] else ''}, ${size_field[1]})
+        offset = ${generator.generated_base_class_name}.append_columns(columns, buffer, offset)
+        return ${body_class_name}.append_columns(columns, buffer, offset, end)
+  % else:
+        offset = ${generator.generated_base_class_name}.append_columns(columns, buffer, offset)
+        return ${body_class_name}.append_columns(columns, buffer, offset)
+  % endif
 % endif
 
 % for a in [a for a in generator.attributes if a.attribute_is_inline and not a.kind == helper.AttributeKind.SIZE_FIELD and not a.attribute_is_reserved and a.attribute_name != 'size']:
@@ -313,14 +625,14 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
 % endfor
 % if 'AggregateTransactionBody' in generator.generated_class_name:
     @classmethod
-    def _serialize_aligned(cls, transaction: EmbeddedTransactionBuilder) -> bytes:
-        """Serializes an embeded transaction with correct padding.
+    def _serialize_aligned_into(cls, transaction: EmbeddedTransactionBuilder, buffer: bytearray, offset: int) -> int:
+        """Serializes an embeded transaction with correct padding into a buffer.
         Returns:
-            Serialized embedded transaction.
+            Offset following the padding.
         """
-        bytes_ = transaction.serialize()
-        padding = bytes(GeneratorUtils.get_transaction_padding_size(len(bytes_), 8))
-        return GeneratorUtils.concat_typed_arrays(bytes_, padding)
+        end = transaction.serialize_into(buffer, offset)
+        padding = bytes(GeneratorUtils.get_transaction_padding_size(end - offset, 8))
+        return GeneratorUtils.write_bytes(buffer, end, padding)
 
     @classmethod
     def _get_size_aligned(cls, transaction: EmbeddedTransactionBuilder) -> int:
@@ -332,10 +644,42 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         paddingSize = GeneratorUtils.get_transaction_padding_size(size, 8)
         return size + paddingSize
 % endif
+% if dtype_description is not None:
+    @classmethod
+    def get_dtype(cls):
+        """Gets the numpy dtype of serialized ${generator.generated_class_name} objects, numpy is required.
+        Returns:
+            Numpy dtype, reserved attributes are padding bytes.
+        """
+        return GeneratorUtils.get_dtype(_DTYPE_DESCRIPTION)
+
+    @classmethod
+    def from_buffer_array(cls, buffer):
+        """Decodes back to back serialized ${generator.generated_class_name} objects with one numpy call, numpy is required.
+        Args:
+            buffer: Bytes-like object holding the serialized objects, it is not copied.
+        Returns:
+            Numpy array with one record by object.
+        """
+        return GeneratorUtils.from_buffer_array(_DTYPE_DESCRIPTION, buffer)
+
+    @classmethod
+    def to_buffer_array(cls, records) -> bytes:
+        """Serializes the records of a numpy array with one numpy call, numpy is required.
+        Args:
+            records: Numpy array with the fields of get_dtype (ex: returned by from_buffer_array).
+        Returns:
+            Serialized objects.
+        """
+        return GeneratorUtils.to_buffer_array(_DTYPE_DESCRIPTION, records)
+
+% endif
 ## SIZE:
 <%def name="renderSize(a)" filter="trim"  buffered="True">\
 <%
     formatted_attribute_name = helper.camel_to_snake(a.attribute_name)
+    element_size = helper.get_fixed_size(generator.schema, a.attribute['type']) if a.kind in (
+        helper.AttributeKind.ARRAY, helper.AttributeKind.FILL_ARRAY, helper.AttributeKind.CUSTOM) else None
 %>\
     % if a.kind == helper.AttributeKind.SIMPLE:
         size += ${a.attribute_size}  # ${formatted_attribute_name}
@@ -346,6 +690,8 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
     % elif a.kind == helper.AttributeKind.VAR_ARRAY:
         for _ in self.${formatted_attribute_name}:
             size += self._get_size_aligned(_)
+    % elif (a.kind == helper.AttributeKind.ARRAY or a.kind == helper.AttributeKind.FILL_ARRAY) and element_size is not None:
+        size += len(self.${formatted_attribute_name}) * ${element_size}  # ${formatted_attribute_name}
     % elif a.kind == helper.AttributeKind.ARRAY or a.kind == helper.AttributeKind.FILL_ARRAY:
         for _ in self.${formatted_attribute_name}:
         % if a.attribute_base_type == 'struct':
@@ -358,6 +704,8 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
     % else:
       % if a.attribute_name.endswith('TransactionBody'):
         size += self.body.get_size()
+      % elif element_size is not None:
+        size += ${element_size}  # ${formatted_attribute_name}
       % else:
         % if a.attribute_base_type == 'struct':
         size += ${a.attribute_class_name}.from_tuple(self.${formatted_attribute_name}).get_size()
@@ -372,8 +720,11 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         Returns:
             Size in bytes.
         """
+% if static_layout.is_fixed_size:
+        return ${generator.generated_class_name}.SIZE_CONSTANT
+% else:
         size = ${'super().get_size()' if generator.base_class_name is not None else '0'}
-% for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline]:
+  % for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline]:
     % if a.attribute_is_conditional:
         if ${renderCondition(a) | trim}:
             ## handle py indents
@@ -383,74 +734,129 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
     % else:
         ${renderSize(a).strip()}
     % endif
-% endfor
+  % endfor
         return size
+% endif
 
 ##  SERIALIZE:
+<%def name="renderValueSerialize(a, value)" filter="trim" buffered="True">\
+## writes one value of a custom type (ex: an amount or a mosaic tuple) without creating its dto or builder
+<%
+    value_size = helper.get_fixed_size(generator.schema, a.attribute['type'])
+%>\
+    % if a.attribute_base_type == 'struct':
+        offset = ${a.attribute_class_name}.serialize_tuple_into(${value}, buffer, offset)
+    % elif a.attribute_base_type == 'enum':
+        offset = GeneratorUtils.write_uint(buffer, offset, ${a.attribute_class_name}(${value}).value, ${value_size}${helper.get_signed_argument(generator.schema, a.attribute)})
+    % elif value_size <= 8:
+        offset = GeneratorUtils.write_uint(buffer, offset, ${value}, ${value_size}${helper.get_signed_argument(generator.schema, a.attribute)})
+    % else:
+        assert len(${value}) == ${value_size}, 'required argument bytes(${value_size})'
+        offset = GeneratorUtils.write_bytes(buffer, offset, ${value})
+    % endif
+</%def>\
 <%def name="renderSerialize(a)" filter="trim" buffered="True">\
 <%
     formatted_attribute_name = helper.camel_to_snake(a.attribute_name)
 %>\
     % if a.kind == helper.AttributeKind.SIMPLE and a.attribute_is_reserved:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(0, ${a.attribute_size}))
+        offset = GeneratorUtils.write_uint(buffer, offset, 0, ${a.attribute_size})
     % elif a.kind == helper.AttributeKind.SIMPLE and a.attribute_name != 'size':
         % if a.attribute_is_reserved:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(0, ${a.attribute_size}))  # kind:SIMPLE
+        offset = GeneratorUtils.write_uint(buffer, offset, 0, ${a.attribute_size})  # kind:SIMPLE
         % else:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(self.${formatted_attribute_name}, ${a.attribute_size}))  # serial_kind:SIMPLE
+        offset = GeneratorUtils.write_uint(buffer, offset, self.${formatted_attribute_name}, ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})  # serial_kind:SIMPLE
         % endif
     % elif a.kind == helper.AttributeKind.SIMPLE and a.attribute_name == 'size':
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(self.get_size(), ${a.attribute_size}))  # serial_kind:SIMPLE
+        offset = GeneratorUtils.write_uint(buffer, offset, self.get_size(), ${a.attribute_size})  # serial_kind:SIMPLE
     % elif a.kind == helper.AttributeKind.BUFFER:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, self.${formatted_attribute_name})  # kind:BUFFER
+        offset = GeneratorUtils.write_bytes(buffer, offset, self.${formatted_attribute_name})  # kind:BUFFER
     % elif a.kind == helper.AttributeKind.SIZE_FIELD:
         ## note: it would be best to access parent 'kind'
       % if 'AggregateTransactionBody' in generator.generated_class_name and a.attribute_name == 'payloadSize':
-        # calculate payload size
-        size_value = 0
-        for _ in self.${a.parent_attribute['name']}:
-            size_value += self._get_size_aligned(_)
+        # payload size is written once the transactions are serialized
+        ${formatted_attribute_name}_offset = offset
+        offset += ${a.attribute_size}  # kind:SIZE_FIELD
       % else:
         size_value = len(self.${helper.camel_to_snake(a.parent_attribute['name'])})
+        offset = GeneratorUtils.write_uint(buffer, offset, size_value, ${a.attribute_size})  # kind:SIZE_FIELD
       % endif
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(size_value, ${a.attribute_size}))  # kind:SIZE_FIELD
     % elif a.kind == helper.AttributeKind.ARRAY or a.kind == helper.AttributeKind.FILL_ARRAY:
         for _ in self.${formatted_attribute_name}: # kind:ARRAY|FILL_ARRAY
-        % if a.attribute_base_type == 'struct':
-            bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, ${a.attribute_class_name}.from_tuple(_).serialize())
-        % else:
-            bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, ${a.attribute_class_name}(_).serialize())
-        % endif
+        % for line in renderValueSerialize(a, '_').splitlines():
+            ${line.strip()}
+        % endfor
     % elif a.kind == helper.AttributeKind.VAR_ARRAY:
+        ${formatted_attribute_name}_offset = offset
         for _ in self.${formatted_attribute_name}: # kind:VAR_ARRAY
-            bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, self._serialize_aligned(_))
+            offset = self._serialize_aligned_into(_, buffer, offset)
+        GeneratorUtils.write_uint(buffer, ${helper.camel_to_snake(a.attribute_size)}_offset, offset - ${formatted_attribute_name}_offset, ${next(size_field.attribute_size for size_field in generator.attributes if size_field.attribute_name == a.attribute_size)})
     % elif a.kind == helper.AttributeKind.CUSTOM:
       % if a.attribute_name.endswith('TransactionBody'):
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, self.body.serialize())  # kind:CUSTOM
+        offset = self.body.serialize_into(buffer, offset)  # kind:CUSTOM
       % else:
-        % if a.attribute_base_type == 'struct':
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, ${a.attribute_class_name}.from_tuple(self.${formatted_attribute_name}).serialize())  # kind:CUSTOM
-        % else:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, ${a.attribute_class_name}(self.${formatted_attribute_name}).serialize())  # kind:CUSTOM
-        % endif
+        ${renderValueSerialize(a, 'self.' + formatted_attribute_name)}  # kind:CUSTOM
       % endif
     % elif a.kind == helper.AttributeKind.FLAGS:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(${a.attribute_class_name}.flagsToInt(self.${formatted_attribute_name}), ${a.attribute_size}))  # kind:FLAGS
+        offset = GeneratorUtils.write_uint(buffer, offset, ${a.attribute_class_name}.flagsToInt(self.${formatted_attribute_name}), ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})  # kind:FLAGS
     % else:
         # Ignored serialization: ${formatted_attribute_name} ${a.kind}
     % endif
+</%def>\
+<%def name="renderStructSerialize(index, run_attributes)" filter="trim" buffered="True">
+<%
+    def struct_value(a):
+        formatted_attribute_name = helper.camel_to_snake(a.attribute_name)
+        if a.kind == helper.AttributeKind.SIMPLE and a.attribute_name == 'size':
+            return 'self.get_size()'
+        if a.kind == helper.AttributeKind.SIZE_FIELD:
+            return 'len(self.{})'.format(helper.camel_to_snake(a.parent_attribute['name']))
+        if a.kind == helper.AttributeKind.FLAGS:
+            return '{}.flagsToInt(self.{})'.format(a.attribute_class_name, formatted_attribute_name)
+        if a.kind == helper.AttributeKind.CUSTOM and a.attribute_base_type == 'enum':
+            return '{}(self.{}).value'.format(a.attribute_class_name, formatted_attribute_name)
+        return 'self.{}'.format(formatted_attribute_name)
+
+    values = [struct_value(a) for a in run_attributes if not (a.attribute_is_reserved and a.kind == helper.AttributeKind.SIMPLE)]
+    # the byte types check the size of the value, struct would pad or truncate it
+    checked_attributes = [a for a in run_attributes if a.kind == helper.AttributeKind.CUSTOM and a.attribute_base_type == 'byte' and a.attribute_size > 8]
+%>\
+% for a in checked_attributes:
+        assert len(self.${helper.camel_to_snake(a.attribute_name)}) == ${a.attribute_size}, 'required argument bytes(${a.attribute_size})'
+% endfor
+        _STRUCT_${index}.pack_into(buffer, offset${''.join(', ' + value for value in values)})  # kind:STRUCT
+        offset += _STRUCT_${index}.size
 </%def>\
     def serialize(self) -> bytes:
         """Serializes self to bytes.
         Returns:
             Serialized bytes.
         """
-        bytes_ = bytes()
+% if not generator.name.endswith('TransactionBody'):
+        if self._payload is not None and self._is_payload_unmodified():
+            return bytes(self._payload)
+% endif
+        buffer = bytearray(self.get_size())
+        self.serialize_into(buffer, 0)
+        return bytes(buffer)
+
+    def serialize_into(self, buffer: bytearray, offset: int) -> int:
+        """Serializes self into a buffer.
+        Args:
+            buffer: Buffer receiving the serialized object.
+            offset: Offset of the object in the buffer.
+        Returns:
+            Offset following the serialized object.
+        """
 % if generator.base_class_name is not None:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, super().serialize())
+        offset = super().serialize_into(buffer, offset)
 % endif
 % for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline]:
-    % if a.attribute_is_conditional:
+    % if a.attribute_name in struct_run_by_attribute:
+        % if a is struct_run_by_attribute[a.attribute_name][1][0]:
+        ${renderStructSerialize(*struct_run_by_attribute[a.attribute_name])}
+        % endif
+    % elif a.attribute_is_conditional:
         if ${renderCondition(a) | trim}:
             ## handle py indents
             % for line in map(lambda a: a.strip(), renderSerialize(a).splitlines()):
@@ -460,7 +866,7 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         ${renderSerialize(a)}
     % endif
 % endfor
-        return bytes_
+        return offset
 
 ## STRINGIFY:
 <%def name="renderStr(a)" filter="trim" buffered="True">\
@@ -473,7 +879,7 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         % if a.attribute_is_reserved:
         result += '{:24s} : {}\n'.format('${attribute_name_f}', to_hex_string(GeneratorUtils.uint_to_buffer(0, ${a.attribute_size})))
         % else:
-        result += '{:24s} : {}\n'.format('${attribute_name_f}', to_hex_string(GeneratorUtils.uint_to_buffer(self.${helper.camel_to_snake(a.attribute_name)}, ${a.attribute_size})))
+        result += '{:24s} : {}\n'.format('${attribute_name_f}', to_hex_string(GeneratorUtils.uint_to_buffer(self.${helper.camel_to_snake(a.attribute_name)}, ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})))
         % endif
     % elif a.kind == helper.AttributeKind.SIMPLE and a.attribute_name == 'size':
         result += '{:24s} : {}\n'.format('${attribute_name_f}', to_hex_string(GeneratorUtils.uint_to_buffer(self.get_size(), ${a.attribute_size})))
@@ -515,7 +921,7 @@ class ${generator.generated_class_name}${'(' + str(generator.generated_base_clas
         % endif
       % endif
     % elif a.kind == helper.AttributeKind.FLAGS:
-        _serializedFlags = GeneratorUtils.uint_to_buffer(${a.attribute_class_name}.flagsToInt(self.${helper.camel_to_snake(a.attribute_name)}), ${a.attribute_size})
+        _serializedFlags = GeneratorUtils.uint_to_buffer(${a.attribute_class_name}.flagsToInt(self.${helper.camel_to_snake(a.attribute_name)}), ${a.attribute_size}${helper.get_signed_argument(generator.schema, a.attribute)})
         result += '{:24s} : {} {}\n'.format('${attribute_name_f}', to_hex_string(_serializedFlags), self.${helper.camel_to_snake(a.attribute_name)})
     % else:
         # Ignored serialization: ${a.attribute_name} ${a.kind}
@@ -1,16 +1,29 @@
+<%
+    if generator.attribute_kind == helper.AttributeKind.BUFFER:
+        struct_format = '<{0}s'.format(generator.size)
+    else:
+        struct_format = '<' + helper.get_struct_integer_format(generator.size, helper.is_signed(generator.schema, generator.schema[generator.name]))
+%>\
 from __future__ import annotations
+import struct
 from binascii import hexlify
+from typing import Tuple
 % if generator.name == 'UnresolvedAddress':
 from base64 import b32encode
 % endif
 from .GeneratorUtils import GeneratorUtils
 
+_STRUCT = struct.Struct('${struct_format}')
+_DTYPE_DESCRIPTION = ${repr(helper.get_numpy_dtype(generator.schema, generator.name))}
+
 class ${generator.generated_class_name}:
     """${generator.comments}.
 
     Attributes:
         ${generator.attribute_name}: ${generator.comments}.
     """
+    __slots__ = ('${generator.attribute_name}',)
+
 % if generator.attribute_kind == helper.AttributeKind.BUFFER:
     def __init__(self, ${generator.attribute_name}: ${generator.attribute_type} = bytes(${generator.size})):
 % else:
@@ -35,13 +48,51 @@ class ${generator.generated_class_name}:
         Returns:
             Instance of ${generator.generated_class_name}.
         """
-        bytes_ = bytes(payload)
-% if generator.attribute_kind == helper.AttributeKind.BUFFER:
-        ${generator.attribute_name} = GeneratorUtils.get_bytes(bytes_, ${generator.size})
-% else:
-        ${generator.attribute_name} = GeneratorUtils.buffer_to_uint(GeneratorUtils.get_bytes(bytes_, ${generator.size}))
-% endif
-        return ${generator.generated_class_name}(${generator.attribute_name})
+        return cls.load_from_buffer(memoryview(payload), 0)[0]
+
+    @classmethod
+    def load_from_buffer(cls, buffer: memoryview, offset: int) -> Tuple[${generator.generated_class_name}, int]:
+        """Creates an instance of ${generator.generated_class_name} from a buffer, without copying the buffer.
+
+        Args:
+            buffer: Buffer holding the serialized object.
+            offset: Offset of the object in the buffer.
+        Returns:
+            Instance of ${generator.generated_class_name} and the offset following it.
+        """
+        ${generator.attribute_name}, = _STRUCT.unpack_from(buffer, offset)
+        return ${generator.generated_class_name}(${generator.attribute_name}), offset + ${generator.size}
+
+    @classmethod
+    def get_dtype(cls):
+        """Gets the numpy dtype of serialized ${generator.generated_class_name} objects, numpy is required.
+
+        Returns:
+            Numpy dtype, reserved attributes are padding bytes.
+        """
+        return GeneratorUtils.get_dtype(_DTYPE_DESCRIPTION)
+
+    @classmethod
+    def from_buffer_array(cls, buffer):
+        """Decodes back to back serialized ${generator.generated_class_name} objects with one numpy call, numpy is required.
+
+        Args:
+            buffer: Bytes-like object holding the serialized objects, it is not copied.
+        Returns:
+            Numpy array with one record by object.
+        """
+        return GeneratorUtils.from_buffer_array(_DTYPE_DESCRIPTION, buffer)
+
+    @classmethod
+    def to_buffer_array(cls, records) -> bytes:
+        """Serializes the records of a numpy array with one numpy call, numpy is required.
+
+        Args:
+            records: Numpy array with the fields of get_dtype (ex: returned by from_buffer_array).
+        Returns:
+            Serialized objects.
+        """
+        return GeneratorUtils.to_buffer_array(_DTYPE_DESCRIPTION, records)
 
     @classmethod
     def get_size(cls) -> int:
@@ -65,13 +116,19 @@ class ${generator.generated_class_name}:
         Returns:
             Serialized bytes.
         """
-        bytes_ = bytes()
-% if generator.attribute_kind == helper.AttributeKind.BUFFER:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, self.${generator.attribute_name})
-% else:
-        bytes_ = GeneratorUtils.concat_typed_arrays(bytes_, GeneratorUtils.uint_to_buffer(self.get_${helper.camel_to_snake(generator.name)}(), ${generator.size}))
-% endif
-        return bytes_
+        return _STRUCT.pack(self.${generator.attribute_name})
+
+    def serialize_into(self, buffer: bytearray, offset: int) -> int:
+        """Serializes self into a buffer.
+
+        Args:
+            buffer: Buffer receiving the serialized object.
+            offset: Offset of the object in the buffer.
+        Returns:
+            Offset following the serialized object.
+        """
+        _STRUCT.pack_into(buffer, offset, self.${generator.attribute_name})
+        return offset + ${generator.size}
 
     def __str__(self):
 % if generator.attribute_kind == helper.AttributeKind.BUFFER:
@@ -81,6 +138,6 @@ class ${generator.generated_class_name}:
         result = hexlify(self.${generator.attribute_name}).decode('utf-8') # ${generator.name}
     % endif
 % else:
-        result = hexlify(GeneratorUtils.uint_to_buffer(self.get_${helper.camel_to_snake(generator.name)}(), ${generator.size})).decode('utf-8')
+        result = hexlify(GeneratorUtils.uint_to_buffer(self.get_${helper.camel_to_snake(generator.name)}(), ${generator.size}${helper.get_signed_argument(generator.schema, generator.schema[generator.name])})).decode('utf-8')
 % endif
         return result
\ No newline at end of file
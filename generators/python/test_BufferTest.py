@@ -0,0 +1,86 @@
+# pylint: disable=import-error
+# the tests run in the build directory, next to the generated package and test_VectorTest
+import importlib
+import struct
+
+import pytest
+
+from symbol_catbuffer.MosaicResolutionStatementBuilder import MosaicResolutionStatementBuilder
+from symbol_catbuffer.TransactionBuilderFactory import TransactionBuilderFactory
+from test_VectorTest import generate_pretty_id, prepare_payload, prepare_test_cases
+
+
+def get_builder_class(builder_name):
+    return getattr(importlib.import_module('symbol_catbuffer.{}'.format(builder_name)), builder_name)
+
+
+def create_mosaic_resolution_statement(unresolved, resolved_ids):
+    # size, version, type (mosaic alias resolution), unresolved mosaic id and (primary id, secondary id, resolved mosaic id) entries
+    size = 16 + 16 * len(resolved_ids)
+    payload = struct.pack('<IHHQ', size, 1, 0xF143, unresolved)
+    for index, resolved_id in enumerate(resolved_ids):
+        payload += struct.pack('<IIQ', index + 1, 0, resolved_id)
+    return payload
+
+
+@pytest.mark.parametrize('item', prepare_test_cases(), ids=generate_pretty_id)
+def test_load_from_buffer_with_offset_and_trailing_data(item):
+    payload = prepare_payload(item['payload'])
+    builder_class = get_builder_class(item['builder'])
+    buffer = memoryview(b'\xff' * 3 + payload + b'\xff' * 5)
+
+    builder, offset = builder_class.load_from_buffer(buffer, 3)
+
+    assert offset == 3 + len(payload)
+    assert builder.serialize() == payload
+
+
+@pytest.mark.parametrize('item', [item for item in prepare_test_cases() if item['builder'].endswith('TransactionBuilder')],
+                         ids=generate_pretty_id)
+def test_create_from_buffer_with_offset_and_trailing_data(item):
+    payload = prepare_payload(item['payload'])
+    buffer = memoryview(b'\xff' * 3 + payload + b'\xff' * 5)
+
+    transaction, offset = TransactionBuilderFactory.create_from_buffer(buffer, 3)
+
+    assert offset == 3 + len(payload)
+    assert transaction.serialize() == payload
+
+
+@pytest.mark.parametrize('item', prepare_test_cases(), ids=generate_pretty_id)
+def test_serialize_into(item):
+    payload = prepare_payload(item['payload'])
+    builder = get_builder_class(item['builder']).load_from_binary(payload)
+    buffer = bytearray(b'\xff' * (3 + len(payload) + 5))
+
+    offset = builder.serialize_into(buffer, 3)
+
+    assert offset == 3 + len(payload) == 3 + builder.get_size()
+    assert buffer == b'\xff' * 3 + payload + b'\xff' * 5
+
+
+def test_load_back_to_back_aggregates():
+    payloads = [prepare_payload(item['payload']) for item in prepare_test_cases() if item['builder'].startswith('Aggregate')][:2]
+    buffer = memoryview(b''.join(payloads))
+
+    first, offset = TransactionBuilderFactory.create_from_buffer(buffer, 0)
+    second, offset = TransactionBuilderFactory.create_from_buffer(buffer, offset)
+
+    assert offset == len(buffer)
+    assert [first.serialize(), second.serialize()] == payloads
+    assert [first.cosignatures, second.cosignatures] == [
+        TransactionBuilderFactory.create_from_payload(payload).cosignatures for payload in payloads]
+
+
+def test_load_back_to_back_resolution_statements():
+    payloads = [create_mosaic_resolution_statement(0x1234, [0xAB, 0xCD]), create_mosaic_resolution_statement(0x5678, [0xEF])]
+    buffer = memoryview(b''.join(payloads))
+
+    first, offset = MosaicResolutionStatementBuilder.load_from_buffer(buffer, 0)
+    second, offset = MosaicResolutionStatementBuilder.load_from_buffer(buffer, offset)
+
+    assert offset == len(buffer)
+    assert [entry.resolved.mosaicId for entry in first.resolutionEntries] == [0xAB, 0xCD]
+    assert [entry.resolved.mosaicId for entry in second.resolutionEntries] == [0xEF]
+    # receipts are serialized without their size
+    assert [first.serialize(), second.serialize()] == [payload[4:] for payload in payloads]
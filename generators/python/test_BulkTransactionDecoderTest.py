@@ -0,0 +1,81 @@
+# pylint: disable=import-error
+# the tests run in the build directory, next to the generated package and test_VectorTest
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from symbol_catbuffer.BulkTransactionDecoder import BulkTransactionDecoder
+from test_VectorTest import prepare_payload, prepare_test_cases
+
+
+def prepare_transaction_payloads():
+    return [prepare_payload(item['payload']) for item in prepare_test_cases() if item['builder'].endswith('TransactionBuilder')]
+
+
+def get_fee_and_deadline(transaction):
+    return transaction.fee, transaction.deadline
+
+
+def test_split_ends_chunks_at_transaction_boundaries():
+    payloads = prepare_transaction_payloads()
+    buffer = b''.join(payloads)
+
+    chunks = BulkTransactionDecoder.split(buffer, 1000)
+
+    boundaries = {sum(len(payload) for payload in payloads[:index]) for index in range(len(payloads) + 1)}
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(buffer)
+    assert all(start in boundaries and end in boundaries and end - start >= 1000 for start, end in chunks[:-1])
+    assert all(chunks[index][1] == chunks[index + 1][0] for index in range(len(chunks) - 1))
+
+
+def test_split_rejects_truncated_transaction():
+    payload = prepare_transaction_payloads()[0]
+
+    with pytest.raises(EOFError):
+        BulkTransactionDecoder.split(payload + payload[:-1], 1000)
+
+
+@pytest.mark.parametrize('executor_class', [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_decode(executor_class):
+    payloads = prepare_transaction_payloads()
+
+    with executor_class(max_workers=2) as executor:
+        transactions = BulkTransactionDecoder.decode(b''.join(payloads), executor, chunk_size=1000)
+
+    assert [transaction.serialize() for transaction in transactions] == payloads
+
+
+def test_decode_with_transform():
+    payloads = prepare_transaction_payloads()
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = BulkTransactionDecoder.decode(b''.join(payloads), executor, chunk_size=1000, transform=get_fee_and_deadline)
+        transactions = BulkTransactionDecoder.decode(b''.join(payloads), executor, chunk_size=1000)
+
+    assert results == [get_fee_and_deadline(transaction) for transaction in transactions]
+
+
+def test_decode_empty_buffer():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert BulkTransactionDecoder.decode(b'', executor) == []
+
+
+# the workers are started before the shared memory, and therefore before the resource tracker of the decoding process
+DECODE_WITH_STARTED_WORKERS_SCRIPT = '''
+from concurrent.futures import ProcessPoolExecutor
+from symbol_catbuffer.BulkTransactionDecoder import BulkTransactionDecoder
+from test_BulkTransactionDecoderTest import prepare_transaction_payloads
+
+with ProcessPoolExecutor(max_workers=2) as executor:
+    list(executor.map(len, [b'', b'']))
+    BulkTransactionDecoder.decode(b''.join(prepare_transaction_payloads()), executor, chunk_size=1000)
+'''
+
+
+def test_decode_with_started_workers_does_not_leak_shared_memory():
+    # the resource trackers of the workers share the stderr of the script, it is read until they exit
+    result = subprocess.run([sys.executable, '-c', DECODE_WITH_STARTED_WORKERS_SCRIPT], capture_output=True, check=True, text=True)
+
+    assert 'resource_tracker' not in result.stderr
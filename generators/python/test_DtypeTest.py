@@ -0,0 +1,56 @@
+# pylint: disable=import-error
+# the tests run in the build directory, next to the generated package and test_VectorTest
+import pytest
+
+from symbol_catbuffer.TransactionBuilderFactory import TransactionBuilderFactory
+from test_BufferTest import get_builder_class
+from test_VectorTest import prepare_payload, prepare_test_cases
+
+numpy = pytest.importorskip('numpy')
+
+
+def prepare_dtype_builder_names():
+    # the fixed size types and builders declare their dtype, the other builders inherit the dtype of their fixed size header
+    return sorted({item['builder'] for item in prepare_test_cases() if 'get_dtype' in vars(get_builder_class(item['builder']))})
+
+
+def prepare_payloads(builder_name):
+    return [prepare_payload(item['payload']) for item in prepare_test_cases() if item['builder'] == builder_name] * 2
+
+
+@pytest.mark.parametrize('builder_name', prepare_dtype_builder_names())
+def test_buffer_array_round_trip(builder_name):
+    builder_class = get_builder_class(builder_name)
+    payloads = prepare_payloads(builder_name)
+
+    records = builder_class.from_buffer_array(b''.join(payloads))
+
+    assert builder_class.get_dtype().itemsize == len(payloads[0])
+    assert len(records) == len(payloads)
+    assert builder_class.to_buffer_array(records) == b''.join(payloads)
+
+
+@pytest.mark.parametrize('builder_name', [name for name in prepare_dtype_builder_names() if name.endswith('TransactionBuilder')])
+def test_transaction_records(builder_name):
+    payloads = prepare_payloads(builder_name)
+    transactions = [TransactionBuilderFactory.create_from_payload(payload) for payload in payloads]
+
+    records = get_builder_class(builder_name).from_buffer_array(b''.join(payloads))
+
+    assert list(records['fee']) == [transaction.fee for transaction in transactions]
+    assert list(records['deadline']) == [transaction.deadline for transaction in transactions]
+    assert [bytes(key) for key in records['signer_public_key']] == [transaction.signer_public_key for transaction in transactions]
+
+
+def test_to_buffer_array_zeroes_reserved_bytes():
+    builder_name = next(name for name in prepare_dtype_builder_names() if name.endswith('TransactionBuilder'))
+    builder_class = get_builder_class(builder_name)
+    payloads = prepare_payloads(builder_name)
+    records = builder_class.from_buffer_array(b''.join(payloads))
+
+    # records without the padding bytes of the reserved attributes
+    packed_records = numpy.zeros(len(records), [(name, records.dtype.fields[name][0]) for name in records.dtype.names])
+    for name in records.dtype.names:
+        packed_records[name] = records[name]
+
+    assert builder_class.to_buffer_array(packed_records) == b''.join(payloads)
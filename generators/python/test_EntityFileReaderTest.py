@@ -0,0 +1,68 @@
+# pylint: disable=import-error
+# the tests run in the build directory, next to the generated package and test_VectorTest
+import pytest
+
+from symbol_catbuffer.EntityFileReader import EntityFileReader
+from test_BufferTest import get_builder_class
+from test_VectorTest import prepare_payload, prepare_test_cases
+
+
+def prepare_state_builder_names():
+    # builders of the state entries and of the other entities, not the transactions or the types
+    return sorted({item['builder'] for item in prepare_test_cases()
+                   if not item['builder'].endswith('TransactionBuilder')})
+
+
+def write_entities(tmp_path, builder_name):
+    payloads = [prepare_payload(item['payload']) for item in prepare_test_cases() if item['builder'] == builder_name] * 2
+    filename = str(tmp_path / 'entities.dat')
+    with open(filename, 'wb') as entity_file:
+        entity_file.write(b''.join(payloads))
+    return filename, payloads
+
+
+@pytest.mark.parametrize('builder_name', prepare_state_builder_names())
+def test_iterate(tmp_path, builder_name):
+    filename, payloads = write_entities(tmp_path, builder_name)
+
+    with EntityFileReader(get_builder_class(builder_name), filename) as reader:
+        entities = [entity.serialize() for entity in reader]
+        count = len(reader)
+
+    assert entities == payloads
+    assert count == len(payloads)
+
+
+@pytest.mark.parametrize('builder_name', prepare_state_builder_names())
+def test_random_access(tmp_path, builder_name):
+    filename, payloads = write_entities(tmp_path, builder_name)
+
+    with EntityFileReader(get_builder_class(builder_name), filename) as reader:
+        # the entities are accessed before the first pass over the file
+        last_entity = reader[-1].serialize()
+        first_entity = reader[0].serialize()
+        with reader.get_view(1) as view:
+            second_payload = bytes(view)
+        with pytest.raises(IndexError):
+            reader.get_view(len(payloads))
+
+    assert [first_entity, second_payload, last_entity] == [payloads[0], payloads[1], payloads[-1]]
+
+
+def test_empty_file(tmp_path):
+    entity_path = tmp_path / 'entities.dat'
+    entity_path.touch()
+
+    with EntityFileReader(get_builder_class(prepare_state_builder_names()[0]), str(entity_path)) as reader:
+        assert len(reader) == 0
+        assert not list(reader)
+
+
+def test_fixed_size_file_with_partial_entity(tmp_path):
+    builder_name = next(name for name in prepare_state_builder_names() if getattr(get_builder_class(name), 'IS_FIXED_SIZE', False))
+    filename, _ = write_entities(tmp_path, builder_name)
+    with open(filename, 'ab') as entity_file:
+        entity_file.write(b'\0')
+
+    with pytest.raises(EOFError):
+        EntityFileReader(get_builder_class(builder_name), filename)
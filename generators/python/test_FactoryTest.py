@@ -0,0 +1,108 @@
+# pylint: disable=import-error
+# the tests run in the build directory, next to the generated package and test_VectorTest
+import pytest
+
+from symbol_catbuffer.CosignatureBuilder import CosignatureBuilder
+from symbol_catbuffer.EmbeddedTransactionBuilderFactory import EmbeddedTransactionBuilderFactory
+from symbol_catbuffer.TransactionBuilder import TransactionBuilder
+from symbol_catbuffer.TransactionBuilderFactory import TransactionBuilderFactory
+from test_BufferTest import get_builder_class
+from test_VectorTest import prepare_payload, prepare_test_cases
+
+
+def prepare_transaction_cases():
+    return [item for item in prepare_test_cases() if item['builder'].endswith('TransactionBuilder')]
+
+
+def generate_builder_id(val):
+    return val['builder']
+
+
+@pytest.mark.parametrize('item', prepare_transaction_cases(), ids=generate_builder_id)
+def test_create_from_payload(item):
+    payload = prepare_payload(item['payload'])
+
+    transaction = TransactionBuilderFactory.create_from_payload(payload)
+
+    assert type(transaction).__name__ == item['builder']
+    assert transaction.serialize() == payload
+
+
+def test_create_from_payload_unknown_version():
+    payload = bytearray(prepare_payload(prepare_transaction_cases()[0]['payload']))
+    payload[108] = 0xFF
+
+    transaction = TransactionBuilderFactory.create_from_payload(payload)
+
+    # only the header of the transactions without builder is decoded
+    assert transaction.__class__ is TransactionBuilder
+    assert transaction.version == 0xFF
+
+
+@pytest.mark.parametrize('item', [item for item in prepare_transaction_cases() if item['builder'].startswith('Aggregate')],
+                         ids=generate_builder_id)
+def test_create_embedded_from_payload(item):
+    transaction = TransactionBuilderFactory.create_from_payload(prepare_payload(item['payload']))
+
+    for embedded_transaction in transaction.transactions:
+        embedded_payload = embedded_transaction.serialize()
+        assert EmbeddedTransactionBuilderFactory.create_from_payload(embedded_payload).__class__ is embedded_transaction.__class__
+        assert type(embedded_transaction).__name__.startswith('Embedded')
+
+
+@pytest.mark.parametrize('item', prepare_transaction_cases(), ids=generate_builder_id)
+def test_peek_header(item):
+    payload = prepare_payload(item['payload'])
+    transaction = TransactionBuilderFactory.create_from_payload(payload)
+
+    # the header is peeked inside a larger buffer
+    peeked = TransactionBuilderFactory.peek_header(b'\xff' * 3 + payload + b'\xff' * 5, 3)
+
+    assert peeked == (len(payload), transaction.signer_public_key, transaction.version, transaction.network,
+                      transaction.type, transaction.fee, transaction.deadline)
+    assert all(value >= 0 for value in peeked if isinstance(value, int))
+
+
+@pytest.mark.parametrize('item', [item for item in prepare_transaction_cases() if item['builder'].startswith('Aggregate')],
+                         ids=generate_builder_id)
+def test_peek_embedded_header(item):
+    transaction = TransactionBuilderFactory.create_from_payload(prepare_payload(item['payload']))
+
+    for embedded_transaction in transaction.transactions:
+        embedded_payload = embedded_transaction.serialize()
+        peeked = EmbeddedTransactionBuilderFactory.peek_header(embedded_payload)
+
+        assert peeked == (len(embedded_payload), embedded_transaction.signer_public_key, embedded_transaction.version,
+                          embedded_transaction.network, embedded_transaction.type)
+
+
+def test_decode_columns():
+    payloads = [prepare_payload(item['payload']) for item in prepare_transaction_cases()]
+    transactions = [TransactionBuilderFactory.create_from_payload(payload) for payload in payloads]
+
+    groups = TransactionBuilderFactory.decode_columns(payloads)
+
+    assert sum(len(columns['fee']) for columns in groups.values()) == len(payloads)
+    for transaction in transactions:
+        columns = groups[(transaction.type, transaction.version)]
+        assert transaction.fee in columns['fee']
+        assert transaction.deadline in columns['deadline']
+
+
+def test_append_columns_back_to_back_aggregates():
+    items = [item for item in prepare_transaction_cases() if item['builder'] == 'AggregateCompleteTransactionBuilder'][:2]
+    payloads = [prepare_payload(item['payload']) for item in items]
+    builder_class = get_builder_class(items[0]['builder'])
+    columns = builder_class.create_columns()
+
+    offset = 0
+    with memoryview(b''.join(payloads)) as buffer:
+        while offset < len(buffer):
+            offset = builder_class.append_columns(columns, buffer, offset)
+
+    assert columns == TransactionBuilderFactory.decode_columns(payloads)[(builder_class.ENTITY_TYPE, builder_class.VERSION)]
+    transactions = [TransactionBuilderFactory.create_from_payload(payload) for payload in payloads]
+    cosignature_size = CosignatureBuilder.from_tuple(transactions[0].cosignatures[0]).get_size()
+    assert list(columns['cosignatures_offsets']) == [0] + [
+        sum(len(transaction.cosignatures) * cosignature_size for transaction in transactions[:index + 1])
+        for index in range(len(transactions))]
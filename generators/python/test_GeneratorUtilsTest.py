@@ -0,0 +1,29 @@
+# pylint: disable=import-error
+# the tests run in the build directory, next to the generated package
+import pytest
+
+from symbol_catbuffer.GeneratorUtils import GeneratorUtils
+
+
+@pytest.mark.parametrize('size', [1, 2, 4, 8])
+def test_integers_are_unsigned_by_default(size):
+    buffer = bytearray(size)
+
+    GeneratorUtils.write_uint(buffer, 0, 2 ** (8 * size) - 1, size)
+
+    assert buffer == b'\xff' * size
+    assert GeneratorUtils.read_uint(memoryview(buffer), 0, size) == 2 ** (8 * size) - 1
+    assert GeneratorUtils.buffer_to_uint(GeneratorUtils.uint_to_buffer(0x80, size)) == 0x80
+
+
+@pytest.mark.parametrize('size', [1, 2, 4, 8])
+def test_signed_integers(size):
+    buffer = bytearray(size)
+
+    GeneratorUtils.write_uint(buffer, 0, -1, size, signed=True)
+
+    assert buffer == b'\xff' * size
+    assert GeneratorUtils.read_uint(memoryview(buffer), 0, size, signed=True) == -1
+    assert GeneratorUtils.read_uint(memoryview(buffer), 0, size) == 2 ** (8 * size) - 1
+    with pytest.raises(OverflowError):
+        GeneratorUtils.uint_to_buffer(-1, size)
@@ -0,0 +1,65 @@
+# pylint: disable=import-error
+# the tests run in the build directory, next to the generated package and test_VectorTest
+import pytest
+
+from symbol_catbuffer.TransactionBuilderFactory import TransactionBuilderFactory
+from test_VectorTest import generate_pretty_id, prepare_payload, prepare_test_cases
+
+HEADER_FIELDS = ('signature', 'signer_public_key', 'version', 'network', 'type', 'fee', 'deadline')
+
+
+def prepare_transaction_cases():
+    return [item for item in prepare_test_cases() if item['builder'].endswith('TransactionBuilder')]
+
+
+@pytest.mark.parametrize('item', prepare_transaction_cases(), ids=generate_pretty_id)
+def test_lazy_fields_match_eager_fields(item):
+    payload = prepare_payload(item['payload'])
+    transaction = TransactionBuilderFactory.create_from_payload(payload)
+
+    lazy_transaction = TransactionBuilderFactory.create_from_payload(payload, lazy=True)
+
+    assert type(lazy_transaction).__name__ == item['builder']
+    for name in HEADER_FIELDS:
+        assert getattr(lazy_transaction, name) == getattr(transaction, name)
+    assert str(lazy_transaction.body) == str(transaction.body)
+
+
+@pytest.mark.parametrize('item', prepare_transaction_cases(), ids=generate_pretty_id)
+def test_lazy_serialize(item):
+    payload = prepare_payload(item['payload'])
+
+    lazy_transaction = TransactionBuilderFactory.create_from_payload(payload, lazy=True)
+    # the decoded fields are compared to the payload, the decoded body is serialized again
+    accessed_transaction = TransactionBuilderFactory.create_from_payload(payload, lazy=True)
+    for name in HEADER_FIELDS + ('body',):
+        getattr(accessed_transaction, name)
+
+    assert lazy_transaction.serialize() == payload
+    assert accessed_transaction.serialize() == payload
+
+
+@pytest.mark.parametrize('item', prepare_transaction_cases(), ids=generate_pretty_id)
+def test_lazy_serialize_modified_field(item):
+    payload = prepare_payload(item['payload'])
+    transaction = TransactionBuilderFactory.create_from_payload(payload)
+    lazy_transaction = TransactionBuilderFactory.create_from_payload(payload, lazy=True)
+
+    transaction.fee += 1
+    lazy_transaction.fee += 1
+
+    assert lazy_transaction.serialize() == transaction.serialize() != payload
+
+
+def test_load_lazy_from_buffer_with_offset_and_trailing_data():
+    payloads = [prepare_payload(item['payload']) for item in prepare_transaction_cases()]
+    buffer = memoryview(b'\xff' * 3 + b''.join(payloads) + b'\xff' * 5)
+
+    offset = 3
+    transactions = []
+    for _ in payloads:
+        transaction, offset = TransactionBuilderFactory.create_from_buffer(buffer, offset, lazy=True)
+        transactions.append(transaction)
+
+    assert offset == len(buffer) - 5
+    assert [transaction.serialize() for transaction in transactions] == payloads
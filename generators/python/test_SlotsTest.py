@@ -0,0 +1,33 @@
+# pylint: disable=import-error
+# the tests run in the build directory, next to the generated package and test_VectorTest
+from enum import Enum
+
+import pytest
+
+from test_BufferTest import get_builder_class
+from test_VectorTest import generate_pretty_id, prepare_payload, prepare_test_cases
+
+
+def iter_generated_objects(value):
+    # the decoded object and the generated objects it holds, enums excluded
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            yield from iter_generated_objects(item)
+    elif type(value).__module__.startswith('symbol_catbuffer.') and not isinstance(value, Enum):
+        yield value
+        for cls in type(value).__mro__:
+            for name in vars(cls).get('__slots__', ()):
+                yield from iter_generated_objects(getattr(value, name, None))
+
+
+@pytest.mark.parametrize('item', prepare_test_cases(), ids=generate_pretty_id)
+def test_decoded_objects_have_no_dict(item):
+    builder = get_builder_class(item['builder']).load_from_binary(prepare_payload(item['payload']))
+
+    objects = list(iter_generated_objects(builder))
+
+    assert objects[0] is builder
+    for decoded_object in objects:
+        assert not hasattr(decoded_object, '__dict__'), type(decoded_object).__name__
+        with pytest.raises(AttributeError):
+            decoded_object.unknown_attribute = 0
@@ -0,0 +1,125 @@
+# pylint: disable=import-error
+# the tests run in the build directory, next to the generated package and test_VectorTest
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import inspect
+import io
+import struct
+
+import pytest
+
+from symbol_catbuffer.BlockHeaderBuilderFactory import BlockHeaderBuilderFactory
+from symbol_catbuffer.ImportanceBlockHeaderBuilder import ImportanceBlockHeaderBuilder
+from symbol_catbuffer.NormalBlockHeaderBuilder import NormalBlockHeaderBuilder
+from symbol_catbuffer.TransactionBuilderFactory import TransactionBuilderFactory
+from test_BufferTest import get_builder_class
+from test_VectorTest import prepare_payload, prepare_test_cases
+
+
+# serialized sizes of the block headers, without the transactions of the block
+NORMAL_BLOCK_HEADER_SIZE = 376
+IMPORTANCE_BLOCK_HEADER_SIZE = 424
+
+
+def create_block(header_size, entity_type, transactions_size):
+    # size, version, network (testnet) and entity type, the other header fields are zeros, the transactions are filler bytes
+    payload = bytearray(header_size + transactions_size)
+    struct.pack_into('<I', payload, 0, len(payload))
+    struct.pack_into('<BBH', payload, 108, 1, 0x98, entity_type)
+    payload[header_size:] = b'\xff' * transactions_size
+    return bytes(payload)
+
+
+def prepare_transaction_payloads():
+    return [prepare_payload(item['payload']) for item in prepare_test_cases() if item['builder'].endswith('TransactionBuilder')]
+
+
+async def collect_from_stream(data, **kwargs):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return [transaction async for transaction in TransactionBuilderFactory.aiter_from_stream(reader, **kwargs)]
+
+
+def prepare_state_entry_builders():
+    builder_names = sorted({item['builder'] for item in prepare_test_cases()})
+    return [name for name in builder_names
+            if 'chunk_size' in inspect.signature(getattr(get_builder_class(name), 'iter_from_stream', lambda: None)).parameters]
+
+
+def test_transactions_iter_from_stream():
+    payloads = prepare_transaction_payloads()
+
+    transactions = list(TransactionBuilderFactory.iter_from_stream(io.BytesIO(b''.join(payloads))))
+    lazy_transactions = list(TransactionBuilderFactory.iter_from_stream(io.BytesIO(b''.join(payloads)), lazy=True))
+
+    assert [transaction.serialize() for transaction in transactions] == payloads
+    assert [transaction.serialize() for transaction in lazy_transactions] == payloads
+
+
+def test_transactions_iter_from_stream_truncated():
+    payload = prepare_payload(next(item['payload'] for item in prepare_test_cases() if item['builder'].endswith('TransactionBuilder')))
+
+    with pytest.raises(EOFError):
+        list(TransactionBuilderFactory.iter_from_stream(io.BytesIO(payload + payload[:-1])))
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_transactions_aiter_from_stream(lazy):
+    payloads = prepare_transaction_payloads()
+
+    transactions = asyncio.run(collect_from_stream(b''.join(payloads), lazy=lazy))
+
+    assert [transaction.serialize() for transaction in transactions] == payloads
+
+
+@pytest.mark.parametrize('executor_class', [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_transactions_aiter_from_stream_with_executor(executor_class):
+    payloads = prepare_transaction_payloads()
+
+    # the transactions larger than 200 bytes are decoded by the executor
+    with executor_class(max_workers=2) as executor:
+        transactions = asyncio.run(collect_from_stream(b''.join(payloads), executor=executor, executor_size=200))
+
+    assert [transaction.serialize() for transaction in transactions] == payloads
+
+
+def test_transactions_aiter_from_stream_rejects_lazy_executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValueError):
+            asyncio.run(collect_from_stream(b''.join(prepare_transaction_payloads()), lazy=True, executor=executor))
+
+
+@pytest.mark.parametrize('builder_name', prepare_state_entry_builders())
+def test_state_entries_iter_from_stream(builder_name):
+    payloads = [prepare_payload(item['payload']) for item in prepare_test_cases() if item['builder'] == builder_name]
+    builder_class = get_builder_class(builder_name)
+
+    # small chunks, the entries span several chunks
+    entries = list(builder_class.iter_from_stream(io.BytesIO(b''.join(payloads * 3)), chunk_size=64))
+
+    assert [entry.serialize() for entry in entries] == payloads * 3
+
+
+def test_block_headers_iter_from_stream():
+    normal_block = create_block(NORMAL_BLOCK_HEADER_SIZE, 0x8143, 100)
+    importance_block = create_block(IMPORTANCE_BLOCK_HEADER_SIZE, 0x8243, 0)
+
+    headers = list(BlockHeaderBuilderFactory.iter_from_stream(io.BytesIO(normal_block + importance_block + normal_block)))
+    normal_headers = list(NormalBlockHeaderBuilder.iter_from_stream(io.BytesIO(normal_block + normal_block)))
+
+    assert [type(header) for header in headers] == [NormalBlockHeaderBuilder, ImportanceBlockHeaderBuilder, NormalBlockHeaderBuilder]
+    # the headers are serialized without the transactions of their block
+    normal_header = create_block(NORMAL_BLOCK_HEADER_SIZE, 0x8143, 0)
+    assert [header.serialize() for header in headers] == [normal_header, importance_block, normal_header]
+    assert [header.serialize() for header in normal_headers] == [normal_header, normal_header]
+
+
+def test_block_header_create_from_buffer():
+    block = create_block(IMPORTANCE_BLOCK_HEADER_SIZE, 0x8243, 0)
+
+    header, offset = BlockHeaderBuilderFactory.create_from_buffer(memoryview(b'\xff' * 3 + block), 3)
+
+    assert isinstance(header, ImportanceBlockHeaderBuilder)
+    assert offset == 3 + len(block)
+    assert BlockHeaderBuilderFactory.create_from_payload(block).serialize() == block
@@ -1,3 +1,6 @@
+<%
+    static_layout = helper.get_static_layout(generator.schema, generator.name)
+%>\
 import { Serializer } from './Serializer';
 import { GeneratorUtils } from './GeneratorUtils';
 % for a in sorted(generator.required_import):
@@ -13,7 +16,24 @@ export class ${generator.generated_class_name}${(' extends ' + str(generator.gen
     /** ${helper.capitalize_first_character(a.attribute_comment)}. **/
     readonly ${a.attribute_name}${('?:' if a.attribute_is_conditional else ':')} ${a.attribute_var_type};
 
-% endfor\
+% endfor
+% for name, (offset, _) in static_layout.field_layout.items():
+    /** Offset of the ${name} field in the serialized object. **/
+    public static readonly ${helper.create_enum_name(name)}_OFFSET: number = ${offset};
+
+% endfor
+% if static_layout.size_terms is not None:
+    /** Serialized size without the variable size fields, each one adds its count times its element size. **/
+    public static readonly SIZE_CONSTANT: number = ${static_layout.size_constant};
+
+  % for term_name, count_name, element_size in static_layout.size_terms:
+    /** Size of the ${term_name} elements, counted by ${count_name}. **/
+    public static readonly ${helper.create_enum_name(term_name)}_ELEMENT_SIZE: number = ${element_size};
+
+  % endfor
+% endif
+    /** True when the serialized size does not depend on the field values. **/
+    public static readonly IS_FIXED_SIZE: boolean = ${'true' if static_layout.is_fixed_size else 'false'};
 
 <%def name="renderCondition(a)" filter="trim">
     ${helper.get_condition_operation_text(a.attribute['condition_operation']).format(a.attribute['condition'], helper.get_generated_class_name(a.condition_type_attribute['type'], a.condition_type_attribute, generator.schema) + '.' + helper.create_enum_name(a.attribute['condition_value']))}
@@ -232,8 +252,11 @@ this_attribute_name = 'this.' + a.attribute_name + ('!' if a.attribute_is_condit
      * @return Size in bytes.
      */
     public getSize(): number {
+% if static_layout.is_fixed_size:
+        return ${generator.generated_class_name}.SIZE_CONSTANT;
+% else:
         let size = ${'super.getSize()' if generator.base_class_name is not None else '0'};
-% for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline]:
+  % for a in [a for a in generator.attributes if not a.attribute_is_super and not a.attribute_is_inline]:
     % if a.attribute_is_conditional:
         if (this.${renderCondition(a) | trim}) {
             ${renderSize(a).strip()}
@@ -241,8 +264,9 @@ this_attribute_name = 'this.' + a.attribute_name + ('!' if a.attribute_is_condit
     % else:
         ${renderSize(a).strip()}
     % endif
-% endfor
+  % endfor
         return size;
+% endif
     }
 
 % if generator.base_class_name in ['Transaction', 'EmbeddedTransaction']:
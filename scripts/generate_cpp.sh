@@ -15,7 +15,7 @@ fi
 echo "Building C++ version $CURRENT_VERSION, operation $OPERATION"
 
 mkdir -p "${rootDir}/build/cpp/${ARTIFACT_NAME}/src/"
-python3 -m catbuffer_parser \
+python3 -m generators \
   --schema catbuffer-schemas/schemas/all_transactions.cats \
   --include catbuffer-schemas/schemas \
   --output "${rootDir}/build/cpp/${ARTIFACT_NAME}/src" \
@@ -17,7 +17,7 @@ echo "Building Java version $CURRENT_VERSION, operation $OPERATION"
 #rm -rf "$rootDir/build/java/$ARTIFACT_NAME"
 
 mkdir -p "$rootDir/build/java/$ARTIFACT_NAME/src/main/java/io/nem/symbol/catapult/builders"
-python3 -m catbuffer_parser \
+python3 -m generators \
   --schema catbuffer-schemas/schemas/all.cats \
   --include catbuffer-schemas/schemas \
   --output "$rootDir/build/java/$ARTIFACT_NAME/src/main/java/io/nem/symbol/catapult/builders" \
@@ -74,7 +74,7 @@ rm -rf "${rootDir}/catbuffer/_generated/python"
 rm -rf "${artifactBuildDir}"
 
 mkdir -p "${artifactPackageDir}"
-python3 -m catbuffer_parser \
+python3 -m generators \
   --schema catbuffer-schemas/schemas/all.cats \
   --include catbuffer-schemas/schemas \
   --output "${artifactPackageDir}" \
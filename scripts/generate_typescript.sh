@@ -17,7 +17,7 @@ echo "Building Typescript version $CURRENT_VERSION, operation $OPERATION"
 #rm -rf "$rootDir/build/typescript/$ARTIFACT_NAME"
 
 mkdir -p "$rootDir/build/typescript/$ARTIFACT_NAME/src/"
-python3 -m catbuffer_parser \
+python3 -m generators \
   --schema catbuffer-schemas/schemas/all.cats \
   --include catbuffer-schemas/schemas \
   --output "$rootDir/build/typescript/$ARTIFACT_NAME/src" \
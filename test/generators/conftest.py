@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+from catbuffer_parser.__main__ import MultiFileParser
+
+COPYRIGHT_FILE = str(Path(__file__).parents[2] / 'HEADER.inc')
+
+# small schema with the kinds of types used by the java and typescript generators
+TINY_SCHEMA = '''using Amount = uint64
+using Height = uint64
+
+enum Kind : uint8
+\talpha = 1
+\tbeta = 2
+
+struct Pair
+\tamount = Amount
+\theight = Height
+
+struct Bag
+\tkind = Kind
+\tcount = uint8
+\tpairs = array(Pair, count)
+'''
+
+
+@pytest.fixture
+def copyright_file():
+    return COPYRIGHT_FILE
+
+
+@pytest.fixture
+def parse_schema(tmp_path):
+    def parse(content):
+        schema_path = tmp_path / 'tiny.cats'
+        schema_path.write_text(content)
+        file_parser = MultiFileParser()
+        file_parser.set_include_path(str(tmp_path))
+        file_parser.parse(str(schema_path))
+        return file_parser.cats_parser.type_descriptors()
+
+    return parse
+
+
+@pytest.fixture
+def schema(parse_schema):
+    return parse_schema(TINY_SCHEMA)
+
+
+@pytest.fixture
+def tiny_schema_text():
+    return TINY_SCHEMA
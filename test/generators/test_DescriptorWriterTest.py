@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from generators.Descriptor import Descriptor
+from generators.DescriptorWriter import DescriptorWriter
+
+
+def test_write_creates_files(tmp_path):
+    writer = DescriptorWriter(str(tmp_path / 'output'))
+
+    writer.write_all(iter([Descriptor('A.java', ['class A {', '}']), Descriptor('B.java', [])]))
+
+    assert (tmp_path / 'output' / 'A.java').read_bytes() == b'class A {\n}\n'
+    assert (tmp_path / 'output' / 'B.java').read_bytes() == b''
+    assert writer.written_files == ['A.java', 'B.java']
+    assert writer.unchanged_files == []
+
+
+def test_write_skips_unchanged_files(tmp_path):
+    DescriptorWriter(str(tmp_path)).write_all([Descriptor('A.java', ['a']), Descriptor('B.java', ['b'])])
+    os.utime(str(tmp_path / 'A.java'), (1, 1))
+    os.utime(str(tmp_path / 'B.java'), (1, 1))
+
+    writer = DescriptorWriter(str(tmp_path))
+    writer.write_all([Descriptor('A.java', ['a']), Descriptor('B.java', ['b changed'])])
+
+    assert writer.written_files == ['B.java']
+    assert writer.unchanged_files == ['A.java']
+    # the modification time of the unchanged file is preserved
+    assert os.stat(str(tmp_path / 'A.java')).st_mtime == 1
+    assert (tmp_path / 'B.java').read_bytes() == b'b changed\n'
+
+
+def test_write_keeps_file_mode(tmp_path):
+    DescriptorWriter(str(tmp_path)).write(Descriptor('run.sh', ['echo']))
+    os.chmod(str(tmp_path / 'run.sh'), 0o750)
+
+    DescriptorWriter(str(tmp_path)).write(Descriptor('run.sh', ['echo changed']))
+
+    assert os.stat(str(tmp_path / 'run.sh')).st_mode & 0o777 == 0o750
+
+
+def test_write_is_atomic(tmp_path, monkeypatch):
+    DescriptorWriter(str(tmp_path)).write(Descriptor('A.java', ['a']))
+
+    def failing_replace(source, destination):
+        raise OSError('replace failed: {0} -> {1}'.format(source, destination))
+
+    monkeypatch.setattr(os, 'replace', failing_replace)
+    with pytest.raises(OSError):
+        DescriptorWriter(str(tmp_path)).write(Descriptor('A.java', ['a changed']))
+
+    # the previous file is intact and the temporary file is removed
+    assert (tmp_path / 'A.java').read_bytes() == b'a\n'
+    assert os.listdir(str(tmp_path)) == ['A.java']
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from catbuffer_parser.__main__ import MultiFileParser
+
+from generators.java.JavaFileGenerator import JavaFileGenerator
+
+COPYRIGHT_FILE = str(Path(__file__).parents[2] / 'HEADER.inc')
+
+# conditional fields give the generated classes one constructor per condition value
+CONDITIONAL_SCHEMA = '''enum Kind : uint8
+\talpha = 1
+\tbeta = 2
+\tgamma = 3
+
+struct Choice
+\tkind = Kind
+\talphaValue = uint32 if kind equals alpha
+\tbetaValue = uint64 if kind equals beta
+'''
+
+
+def parse_schema(tmp_path, content):
+    schema_path = tmp_path / 'conditional.cats'
+    schema_path.write_text(content)
+    file_parser = MultiFileParser()
+    file_parser.set_include_path(str(tmp_path))
+    file_parser.parse(str(schema_path))
+    return file_parser.cats_parser.type_descriptors()
+
+
+def generate_files(schema, jobs):
+    return [(descriptor.filename, '\n'.join(descriptor.code))
+            for descriptor in JavaFileGenerator(schema, {'copyright': COPYRIGHT_FILE, 'jobs': jobs})]
+
+
+def test_pool_rendering_is_byte_identical_to_sequential_rendering(tmp_path):
+    sequential_files = generate_files(parse_schema(tmp_path, CONDITIONAL_SCHEMA), 1)
+    pool_files = generate_files(parse_schema(tmp_path, CONDITIONAL_SCHEMA), 2)
+
+    assert 'ChoiceBuilder.java' in [filename for filename, _ in sequential_files]
+    assert pool_files == sequential_files
+
+
+def test_constructor_options_follow_the_schema_order(tmp_path):
+    choice_code = dict(generate_files(parse_schema(tmp_path, CONDITIONAL_SCHEMA), 1))['ChoiceBuilder.java']
+
+    factory_positions = [choice_code.index('create{}('.format(name)) for name in ('Alpha', 'Beta', 'Gamma')]
+    assert factory_positions == sorted(factory_positions)
@@ -0,0 +1,59 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from generators.All import AVAILABLE_GENERATORS
+from generators.__main__ import main
+
+# full schemas, cloned by travis next to the generators, required by the python and cpp generators
+SCHEMAS_DIRECTORY = Path(os.environ.get('CATBUFFER_SCHEMAS', str(Path(__file__).parents[2] / 'catbuffer-schemas' / 'schemas')))
+
+
+def run_main(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['generators'] + list(args))
+    main()
+
+
+def read_files(directory):
+    return {str(path.relative_to(directory)): path.read_bytes() for path in sorted(directory.rglob('*')) if path.is_file()}
+
+
+def generate_per_language(monkeypatch, schema_path, include_path, output_path, copyright_file, generator_names):
+    for generator_name in generator_names:
+        run_main(monkeypatch, '-s', str(schema_path), '-i', str(include_path), '-o', str(output_path / generator_name),
+                 '-g', generator_name, '-c', copyright_file)
+
+
+def test_several_generators_match_per_language_runs(monkeypatch, schema, tmp_path, copyright_file):
+    # the schema fixture writes tiny.cats in tmp_path
+    assert schema
+    schema_path = tmp_path / 'tiny.cats'
+
+    run_main(monkeypatch, '-s', str(schema_path), '-i', str(tmp_path), '-o', str(tmp_path / 'multi'),
+             '-g', 'java', '-g', 'typescript', '-g', 'java', '-c', copyright_file)
+    generate_per_language(monkeypatch, schema_path, tmp_path, tmp_path / 'single', copyright_file, ['java', 'typescript'])
+
+    assert sorted(path.name for path in (tmp_path / 'multi').iterdir()) == ['java', 'typescript']
+    assert read_files(tmp_path / 'multi') == read_files(tmp_path / 'single')
+
+
+@pytest.mark.skipif(not (SCHEMAS_DIRECTORY / 'all.cats').is_file(), reason='catbuffer schemas are not available')
+def test_all_generators_match_per_language_runs(monkeypatch, tmp_path, copyright_file):
+    schema_path = SCHEMAS_DIRECTORY / 'all.cats'
+
+    run_main(monkeypatch, '-s', str(schema_path), '-i', str(SCHEMAS_DIRECTORY), '-o', str(tmp_path / 'all'), '-g', 'all',
+             '-c', copyright_file)
+    generate_per_language(monkeypatch, schema_path, SCHEMAS_DIRECTORY, tmp_path / 'single', copyright_file, list(AVAILABLE_GENERATORS))
+
+    assert sorted(path.name for path in (tmp_path / 'all').iterdir()) == sorted(AVAILABLE_GENERATORS)
+    assert read_files(tmp_path / 'all') == read_files(tmp_path / 'single')
+
+
+def test_single_generator_writes_to_output(monkeypatch, schema, tmp_path, copyright_file):
+    assert schema
+    run_main(monkeypatch, '-s', str(tmp_path / 'tiny.cats'), '-i', str(tmp_path), '-o', str(tmp_path / 'java'), '-g', 'java',
+             '-c', copyright_file)
+
+    assert (tmp_path / 'java' / 'PairBuilder.java').is_file()
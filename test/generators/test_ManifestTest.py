@@ -0,0 +1,158 @@
+import json
+
+import pytest
+
+from generators.common.Manifest import Manifest
+from generators.cpp_builder.BuilderGenerator import BuilderGenerator
+from generators.java.JavaFileGenerator import JavaFileGenerator
+
+# smallest schema with a transaction and its embedded version, the cpp builders are only generated for the transactions
+TRANSACTION_SCHEMA = '''using Amount = uint64
+using Timestamp = uint64
+using Key = binary_fixed(32)
+using Signature = binary_fixed(64)
+
+enum NetworkType : uint8
+\tmijin = 0x60
+
+enum EntityType : uint16
+\treserved = 0x0000
+
+struct SizePrefixedEntity
+\tsize = uint32
+
+struct VerifiableEntity
+\tverifiableEntityHeader_Reserved1 = uint32
+\tsignature = Signature
+
+struct EntityBody
+\tsignerPublicKey = Key
+\tentityBody_Reserved1 = uint32
+\tversion = uint8
+\tnetwork = NetworkType
+\ttype = EntityType
+
+struct Transaction
+\tinline SizePrefixedEntity
+\tinline VerifiableEntity
+\tinline EntityBody
+\tfee = Amount
+\tdeadline = Timestamp
+
+struct EmbeddedTransactionHeader
+\tsize = uint32
+\tembeddedTransactionHeader_Reserved1 = uint32
+
+struct EmbeddedTransaction
+\tinline EmbeddedTransactionHeader
+\tinline EntityBody
+
+enum LinkAction : uint8
+\tunlink = 0x00
+\tlink = 0x01
+
+struct AccountKeyLinkTransactionBody
+\tlinkedPublicKey = Key
+\tlinkAction = LinkAction
+
+struct AccountKeyLinkTransaction
+\tconst uint8 version = 1
+\tconst EntityType entityType = 0x414C
+\tinline Transaction
+\tinline AccountKeyLinkTransactionBody
+
+struct EmbeddedAccountKeyLinkTransaction
+\tconst uint8 version = 1
+\tconst EntityType entityType = 0x414C
+\tinline EmbeddedTransaction
+\tinline AccountKeyLinkTransactionBody
+'''
+
+
+def generate(schema, output_path, copyright_file, generator_class=JavaFileGenerator):
+    # writes the rendered files and returns their names, the files skipped by the manifest are not yielded
+    output_path.mkdir(exist_ok=True)
+    filenames = []
+    for descriptor in generator_class(schema, {'copyright': copyright_file, 'incremental': True, 'output': str(output_path)}):
+        (output_path / descriptor.filename).write_text(''.join('%s\n' % line for line in descriptor.code))
+        filenames.append(descriptor.filename)
+    return filenames
+
+
+def test_file_is_unchanged_after_save(tmp_path):
+    (tmp_path / 'A.java').write_text('A')
+    manifest = Manifest(str(tmp_path))
+    assert not manifest.is_unchanged('A.java', 'digest')
+    manifest.save()
+
+    manifest = Manifest(str(tmp_path))
+
+    assert manifest.is_unchanged('A.java', 'digest')
+    assert not manifest.is_unchanged('A.java', 'other digest')
+
+
+def test_missing_file_is_changed(tmp_path):
+    manifest = Manifest(str(tmp_path))
+    manifest.is_unchanged('A.java', 'digest')
+    manifest.save()
+
+    assert not Manifest(str(tmp_path)).is_unchanged('A.java', 'digest')
+
+
+@pytest.mark.parametrize('content', ['not json', json.dumps({'version': Manifest.VERSION + 1, 'files': {'A.java': 'digest'}})])
+def test_unreadable_manifest_is_empty(tmp_path, content):
+    (tmp_path / 'A.java').write_text('A')
+    (tmp_path / Manifest.FILE_NAME).write_text(content)
+
+    assert not Manifest(str(tmp_path)).is_unchanged('A.java', 'digest')
+
+
+def test_digest_depends_on_inputs():
+    assert Manifest.digest({'a': 1, 'b': 2}, 'x') == Manifest.digest({'b': 2, 'a': 1}, 'x')
+    assert Manifest.digest({'a': 1}, 'x') != Manifest.digest({'a': 1}, 'y')
+
+
+def test_schema_subset_includes_referenced_types(schema):
+    assert set(Manifest.get_schema_subset(schema, ['Bag'])) == {'Bag', 'Kind', 'Pair', 'Amount', 'Height'}
+    assert set(Manifest.get_schema_subset(schema, ['Pair', 'Unknown'])) == {'Pair', 'Amount', 'Height'}
+
+
+def test_from_options(tmp_path):
+    assert Manifest.from_options({}) is None
+    assert Manifest.from_options({'incremental': False, 'output': str(tmp_path)}) is None
+    assert Manifest.from_options({'incremental': True, 'output': str(tmp_path)}).output_path == str(tmp_path)
+
+    with pytest.raises(ValueError):
+        Manifest.from_options({'incremental': True})
+
+
+def test_incremental_generation_requires_output(schema, copyright_file):
+    with pytest.raises(ValueError):
+        list(JavaFileGenerator(schema, {'copyright': copyright_file, 'incremental': True}))
+
+
+def test_incremental_generation_renders_changed_files(schema, parse_schema, tiny_schema_text, tmp_path, copyright_file):
+    output_path = tmp_path / 'java'
+    first_files = generate(schema, output_path, copyright_file)
+    unchanged_files = generate(schema, output_path, copyright_file)
+    changed_files = generate(parse_schema(tiny_schema_text.replace('height = Height', 'height = Amount')), output_path, copyright_file)
+
+    assert 'PairBuilder.java' in first_files
+    assert unchanged_files == []
+    # the files generated from the changed type and the types referencing it are rendered again, not the other types
+    assert {'BagBuilder.java', 'PairBuilder.java'} <= set(changed_files)
+    assert not {'AmountDto.java', 'HeightDto.java', 'KindDto.java'} & set(changed_files)
+
+
+def test_incremental_cpp_generation_renders_files_of_changed_embedded_header(parse_schema, tmp_path, copyright_file):
+    output_path = tmp_path / 'cpp'
+    first_files = generate(parse_schema(TRANSACTION_SCHEMA), output_path, copyright_file, BuilderGenerator)
+    unchanged_files = generate(parse_schema(TRANSACTION_SCHEMA), output_path, copyright_file, BuilderGenerator)
+    changed_schema = parse_schema(TRANSACTION_SCHEMA.replace('embeddedTransactionHeader_Reserved1 = uint32',
+                                                             'embeddedTransactionHeader_Reserved1 = uint16'))
+    changed_files = generate(changed_schema, output_path, copyright_file, BuilderGenerator)
+
+    assert first_files == ['AccountKeyLinkBuilder.h', 'AccountKeyLinkBuilder.cpp']
+    assert unchanged_files == []
+    # the embedded header is only referenced by the embedded transaction, its size is part of the generated builder
+    assert changed_files == first_files
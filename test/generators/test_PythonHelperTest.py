@@ -0,0 +1,68 @@
+from collections import namedtuple
+
+import pytest
+
+from generators.common.Helper import AttributeKind
+from generators.python.PythonHelper import PythonHelper
+
+# the attribute data fields read by the column helpers
+ColumnAttribute = namedtuple('ColumnAttribute', ['kind', 'attribute_base_type', 'attribute_size', 'attribute'])
+
+SIGNED_SCHEMA = '''using Amount = uint64
+using Delta = int32
+
+struct Change
+\tamount = Amount
+\tdelta = Delta
+\tsmallDelta = int8
+\tcount = uint16
+'''
+
+
+@pytest.fixture
+def signed_schema(parse_schema):
+    return parse_schema(SIGNED_SCHEMA)
+
+
+def test_numpy_dtype_uses_signedness(signed_schema):
+    helper = PythonHelper()
+
+    assert helper.get_numpy_dtype(signed_schema, 'Change') == {
+        'names': ['amount', 'delta', 'smallDelta', 'count'],
+        'formats': ['<u8', '<i4', '<i1', '<u2'],
+        'offsets': [0, 8, 12, 13],
+        'itemsize': 15
+    }
+    assert helper.get_numpy_dtype(signed_schema, 'Delta') == '<i4'
+
+
+def test_integer_format_uses_signedness(signed_schema):
+    helper = PythonHelper()
+    layout = signed_schema['Change']['layout']
+
+    assert [helper.is_signed(signed_schema, attribute) for attribute in layout] == [False, True, True, False]
+    assert [helper.get_struct_integer_format(size, signed) for size, signed in ((1, True), (2, False), (8, True), (3, True))] == [
+        'b', 'H', 'q', None]
+    assert [helper.get_signed_argument(signed_schema, attribute) for attribute in layout] == ['', ', signed=True', ', signed=True', '']
+
+
+def test_column_typecode_uses_signedness(signed_schema):
+    helper = PythonHelper()
+    amount, delta, small_delta, count = signed_schema['Change']['layout']
+    attributes = [
+        ColumnAttribute(AttributeKind.CUSTOM, 'byte', 8, amount),
+        ColumnAttribute(AttributeKind.CUSTOM, 'byte', 4, delta),
+        ColumnAttribute(AttributeKind.SIMPLE, None, 1, small_delta),
+        ColumnAttribute(AttributeKind.SIZE_FIELD, None, 2, count),
+        ColumnAttribute(AttributeKind.BUFFER, None, 8, amount)
+    ]
+
+    assert [helper.get_column_typecode(signed_schema, attribute) for attribute in attributes] == ['Q', 'i', 'b', 'H', None]
+
+
+def test_struct_peek(signed_schema):
+    helper = PythonHelper()
+
+    assert helper.get_fixed_layout(signed_schema, 'Change') == {'amount': (0, 8), 'delta': (8, 4), 'smallDelta': (12, 1), 'count': (13, 2)}
+    assert helper.get_struct_peek(signed_schema, 'Change', ['delta', 'count']) == (8, '<i1xH')
+    assert helper.get_struct_peek(signed_schema, 'Change', ['count']) == (13, '<H')
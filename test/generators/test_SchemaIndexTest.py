@@ -0,0 +1,93 @@
+import pickle
+
+import pytest
+
+from generators.common.SchemaIndex import SchemaIndex
+from generators.java.JavaFileGenerator import JavaFileGenerator
+
+INLINE_SCHEMA = '''using Amount = uint64
+
+enum Kind : uint8
+\talpha = 1
+\tbeta = 2
+
+struct Header
+\tsize = uint32
+\tkind = Kind
+
+struct Pair
+\tamount = Amount
+
+struct Bag
+\tconst Kind bagKind = 2
+\tinline Header
+\tcount = uint8
+\tpairs = array(Pair, count)
+'''
+
+
+@pytest.fixture
+def inline_schema(parse_schema):
+    return parse_schema(INLINE_SCHEMA)
+
+
+def test_referenced_and_referencing_types(inline_schema):
+    schema_index = SchemaIndex(inline_schema)
+
+    assert schema_index.get_referenced_types('Bag') == ['Kind', 'Header', 'Pair']
+    assert schema_index.get_referencing_types('Kind') == ['Header', 'Bag']
+    assert schema_index.get_referencing_types('Bag') == []
+
+
+def test_const_attributes(inline_schema):
+    schema_index = SchemaIndex(inline_schema)
+
+    assert [(type_name, attribute['name']) for type_name, attribute in schema_index.get_const_attributes('Kind')] == [('Bag', 'bagKind')]
+    assert schema_index.get_const_attributes('Amount') == []
+
+
+def test_layout_tables(inline_schema):
+    schema_index = SchemaIndex(inline_schema)
+    layout = inline_schema['Bag']['layout']
+
+    assert schema_index.count_size_references(layout, 'count') == 1
+    assert schema_index.count_size_references(layout, 'size') == 0
+    # inline attributes are expanded
+    assert schema_index.find_attribute(layout, 'name', 'kind') is inline_schema['Header']['layout'][1]
+    assert schema_index.find_attribute(layout, 'size', 'count')['name'] == 'pairs'
+    assert schema_index.find_attribute(layout, 'name', 'unknown') is None
+
+
+def test_analysis_is_created_once(inline_schema):
+    schema_index = SchemaIndex(inline_schema)
+    calls = []
+
+    def create_analysis():
+        calls.append('Bag')
+        return 'analysis'
+
+    assert schema_index.get_analysis(('Bag', 'test'), create_analysis) == 'analysis'
+    assert schema_index.get_analysis(('Bag', 'test'), create_analysis) == 'analysis'
+    assert calls == ['Bag']
+
+
+def test_pickled_index_drops_the_tables(inline_schema):
+    schema_index = SchemaIndex(inline_schema)
+    schema_index.get_analysis('key', lambda: 'analysis')
+    schema_index.count_size_references(inline_schema['Bag']['layout'], 'count')
+
+    unpickled_index = pickle.loads(pickle.dumps(schema_index))
+
+    assert unpickled_index.get_analysis('key', lambda: 'new analysis') == 'new analysis'
+    assert unpickled_index.count_size_references(unpickled_index.schema['Bag']['layout'], 'count') == 1
+    assert unpickled_index.get_referenced_types('Bag') == schema_index.get_referenced_types('Bag')
+
+
+def test_shared_index_generates_the_same_files(inline_schema, copyright_file):
+    options = {'copyright': copyright_file}
+
+    files = [(descriptor.filename, descriptor.code) for descriptor in JavaFileGenerator(inline_schema, options)]
+    shared_index_files = [(descriptor.filename, descriptor.code)
+                          for descriptor in JavaFileGenerator(inline_schema, dict(options, schema_index=SchemaIndex(inline_schema)))]
+
+    assert shared_index_files == files
@@ -0,0 +1,37 @@
+import os
+from os.path import join
+
+from generators.common.TemplateCache import TEMPLATES_ROOT, TemplateCache
+
+TEMPLATE_FILE_NAME = join(TEMPLATES_ROOT, 'java', 'templates', 'Type.mako')
+
+
+def test_template_is_compiled_once(monkeypatch, tmp_path):
+    monkeypatch.setenv('CATBUFFER_TEMPLATE_CACHE', str(tmp_path))
+    monkeypatch.setattr(TemplateCache, '_lookup', None)
+
+    template = TemplateCache.get_template(TEMPLATE_FILE_NAME)
+
+    assert TemplateCache.get_template(join(TEMPLATES_ROOT, 'java', '..', 'java', 'templates', 'Type.mako')) is template
+
+
+def test_compiled_template_is_stored_by_content_hash(monkeypatch, tmp_path):
+    monkeypatch.setenv('CATBUFFER_TEMPLATE_CACHE', str(tmp_path))
+    monkeypatch.setattr(TemplateCache, '_lookup', None)
+
+    TemplateCache.get_template(TEMPLATE_FILE_NAME)
+
+    # pylint: disable=protected-access
+    expected_file_name = TemplateCache._get_module_file_name(str(tmp_path), TEMPLATE_FILE_NAME, '/java/templates/Type.mako')
+    module_file_names = [join(directory, filename) for directory, _, filenames in os.walk(str(tmp_path)) for filename in filenames]
+    assert [file_name for file_name in module_file_names if file_name.endswith('.py')] == [expected_file_name]
+
+
+def test_empty_cache_directory_disables_the_disk_cache(monkeypatch):
+    monkeypatch.setenv('CATBUFFER_TEMPLATE_CACHE', '')
+    monkeypatch.setattr(TemplateCache, '_lookup', None)
+
+    template = TemplateCache.get_template(TEMPLATE_FILE_NAME)
+
+    assert TemplateCache.get_module_directory() is None
+    assert template.module_directory is None